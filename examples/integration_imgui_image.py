@@ -77,7 +77,7 @@ class WindowEvents(mglw.WindowConfig):
         imgui.begin("Custom window with Image", True)
         # Create an image control by passing in the OpenGL texture ID (glo)
         # and pass in the image size as well.
-        # The texture needs to he registered using register_texture for this to work
+        # Unregistered textures are bound directly by their id
         imgui.image(self.fbo.color_attachments[0].glo, self.fbo.size)
         imgui.end()
 
@@ -0,0 +1,33 @@
+import random
+
+import moderngl
+
+import moderngl_window
+from moderngl_window.text.bitmapped import TextBatch2D
+
+
+class App(moderngl_window.WindowConfig):
+    title = "Text Batch"
+    aspect_ratio = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch = TextBatch2D()
+        self.fps = self.batch.add("FPS: 0", (20, self.wnd.buffer_height - 20), size=16)
+
+        width, height = self.wnd.buffer_size
+        for i in range(3000):
+            self.batch.add(
+                "Label {}".format(i),
+                (random.uniform(0, width), random.uniform(0, height - 40)),
+                size=random.uniform(8, 20),
+                color=(random.random(), random.random(), random.random(), 1.0),
+            )
+
+    def on_render(self, time, frame_time):
+        self.ctx.enable_only(moderngl.BLEND)
+        self.batch.update(self.fps, text="FPS: {:.0f}".format(self.timer.fps))
+        self.batch.draw()
+
+
+App.run()
@@ -0,0 +1,25 @@
+import math
+
+import moderngl
+
+import moderngl_window
+from moderngl_window.text.sdf import SDFFont, SDFTextWriter2D
+
+
+class App(moderngl_window.WindowConfig):
+    title = "SDF Text"
+    aspect_ratio = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Pass the path to any TrueType font to use it instead of the default font
+        self.writer = SDFTextWriter2D(SDFFont())
+        self.writer.text = "Hello ModernGL!\nSigned distance fields"
+
+    def on_render(self, time, frame_time):
+        self.ctx.enable_only(moderngl.BLEND)
+        size = 48 + math.sin(time) * 40
+        self.writer.draw((40, self.wnd.buffer_height / 2), size=size)
+
+
+App.run()
@@ -15,7 +15,12 @@ import moderngl
 
 from moderngl_window.conf import settings
 from moderngl_window.context.base import BaseWindow, WindowConfig
+from moderngl_window import profiler, reloader
+from moderngl_window.timers.base import BaseTimer
 from moderngl_window.timers.clock import Timer
+from moderngl_window.timers.fixed import FixedTimer
+from moderngl_window.timers.pacing import FramePacer
+from moderngl_window.timers.perf import PerfTimer
 from moderngl_window.utils.keymaps import AZERTY, QWERTY, KeyMap, KeyMapFactory  # noqa
 from moderngl_window.utils.module_loading import import_string
 
@@ -186,7 +191,7 @@ def create_window_from_settings() -> BaseWindow:
 
 
 def run_window_config(
-    config_cls: type[WindowConfig], timer: Optional[Timer] = None, args: Any = None
+    config_cls: type[WindowConfig], timer: Optional[BaseTimer] = None, args: Any = None
 ) -> None:
     """
     Run an WindowConfig entering a blocking main loop
@@ -202,7 +207,7 @@ def run_window_config(
 
 
 def create_window_config_instance(
-    config_cls: type[WindowConfig], timer: Optional[Timer] = None, args: Any = None
+    config_cls: type[WindowConfig], timer: Optional[BaseTimer] = None, args: Any = None
 ) -> WindowConfig:
     """
     Create and initialize a instance of a WindowConfig class.
@@ -232,6 +237,17 @@ def create_window_config_instance(
     if show_cursor is None:
         show_cursor = config_cls.cursor
 
+    # Offline mode renders as fast as possible with a fixed timestep
+    offline_framerate = values.offline or config_cls.offline_framerate
+    if values.duration is not None:
+        config_cls.offline_duration = values.duration
+    if values.target_fps is not None:
+        config_cls.target_fps = values.target_fps
+
+    vsync = values.vsync if values.vsync is not None else config_cls.vsync
+    if offline_framerate:
+        vsync = False
+
     window = window_cls(
         title=config_cls.title,
         size=size,
@@ -240,7 +256,7 @@ def create_window_config_instance(
         visible=config_cls.visible,
         gl_version=config_cls.gl_version,
         aspect_ratio=config_cls.aspect_ratio,
-        vsync=values.vsync if values.vsync is not None else config_cls.vsync,
+        vsync=vsync,
         samples=values.samples if values.samples is not None else config_cls.samples,
         cursor=show_cursor if show_cursor is not None else True,
         backend=values.backend,
@@ -248,8 +264,12 @@ def create_window_config_instance(
     )
     window.print_context_info()
     activate_context(window=window)
+    if values.profile:
+        profiler.Profiler(window.ctx).enable()
+    if values.reload:
+        reloader.Reloader().enable()
     if timer is None:
-        timer = Timer()
+        timer = FixedTimer(offline_framerate) if offline_framerate else PerfTimer()
     config = config_cls(ctx=window.ctx, wnd=window, timer=timer)
     # Avoid the event assigning in the property setter for now
     # We want the even assigning to happen in WindowConfig.__init__
@@ -268,19 +288,54 @@ def run_window_config_instance(config: WindowConfig) -> None:
     """
     Run an WindowConfig instance entering a blocking main loop.
 
+    When the config uses a :py:class:`~moderngl_window.timers.fixed.FixedTimer`
+    the loop runs in offline mode. Frames are rendered as fast as possible
+    and the window is closed after ``offline_duration`` seconds of virtual time.
+    Otherwise frames are paced to ``target_fps`` when it is set.
+
+    Each frame is recorded by the enabled :py:class:`~moderngl_window.profiler.Profiler`.
+    Changed resources are reloaded by the enabled
+    :py:class:`~moderngl_window.reloader.Reloader` before a frame starts.
+
     Args:
         window_config: The WindowConfig instance
     """
     window = config.wnd
-    timer = config.timer
+    timer: BaseTimer = config.timer
+    offline = isinstance(timer, FixedTimer)
+
+    max_frames: Optional[int] = None
+    if isinstance(timer, FixedTimer) and config.offline_duration is not None:
+        max_frames = round(config.offline_duration * timer.framerate)
+
+    pacer: Optional[FramePacer] = None
+    if not offline and config.target_fps:
+        pacer = FramePacer(config.target_fps, budget_func=config.on_frame_budget)
 
     timer.start()
+    frames = 0
 
     while not window.is_closing:
+        if max_frames is not None and frames >= max_frames:
+            window.close()
+            break
+
+        frames += 1
+
+        if pacer is not None:
+            pacer.wait()
+
+        if reloader.current is not None:
+            reloader.current.update()
+
+        active_profiler = profiler.current
+        if active_profiler is not None:
+            active_profiler.begin_frame()
+
         current_time, delta = timer.next_frame()
 
         # Framerate  limit for hidden windows
-        if not window.visible and config.hidden_window_framerate_limit > 0:
+        if not offline and not window.visible and config.hidden_window_framerate_limit > 0:
             expected_delta_time = 1.0 / config.hidden_window_framerate_limit
             sleep_time = expected_delta_time - delta
             if sleep_time > 0:
@@ -292,15 +347,35 @@ def run_window_config_instance(config: WindowConfig) -> None:
         # Always bind the window framebuffer before calling render
         window.use()
 
-        window.render(current_time, delta)
+        with profiler.scope("render"):
+            window.render(current_time, delta)
 
         if not window.is_closing:
-            window.swap_buffers()
+            with profiler.scope("swap_buffers"):
+                window.swap_buffers()
+
+        if active_profiler is not None:
+            active_profiler.end_frame()
 
     _, duration = timer.stop()
+    if reloader.current is not None:
+        reloader.current.disable()
+    if profiler.current is not None:
+        active_profiler = profiler.current
+        active_profiler.release()
+        trace = getattr(config.argv, "profile", None)
+        if trace:
+            active_profiler.export_chrome_trace(trace)
+            logger.info("Wrote profile to %s", trace)
     window.destroy()
     if duration > 0:
         logger.info("Duration: {0:.2f}s @ {1:.2f} FPS".format(duration, timer.fps_average))
+    if isinstance(timer, (Timer, PerfTimer)) and timer.stats.count > 0:
+        logger.info(
+            "Frame time: p50 {0:.2f}ms, p95 {1:.2f}ms, p99 {2:.2f}ms".format(
+                *(value * 1000 for value in timer.stats.percentiles((50, 95, 99)).values())
+            )
+        )
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -366,6 +441,34 @@ def create_parser() -> argparse.ArgumentParser:
         "--backend",
         help="Specify context backend. This is mostly used to enable EGL in headless mode",
     )
+    parser.add_argument(
+        "--offline",
+        type=float,
+        metavar="FPS",
+        help="Render offline with a fixed timestep of 1/FPS as fast as possible",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        help="Seconds of time to render in offline mode before closing the window",
+    )
+    parser.add_argument(
+        "--target-fps",
+        type=float,
+        metavar="FPS",
+        help="Pace the main loop to start frames at exactly this framerate",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="TRACE",
+        help="Profile every frame and write a Chrome trace JSON file when closing",
+    )
+    parser.add_argument(
+        "--reload",
+        action="store_true",
+        default=False,
+        help="Reload reloadable programs and textures when their files change",
+    )
     return parser
 
 
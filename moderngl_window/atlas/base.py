@@ -1,5 +1,7 @@
 from typing import Any
 
+import numpy
+import numpy.typing as npt
 from PIL.Image import Image
 
 
@@ -69,6 +71,44 @@ class AtlasImage(BaseImage):
         if components == 4:
             return self._image.convert("RGBA").tobytes()
         elif components == 3:
-            return self._image.covert("RGB").tobytes()
+            return self._image.convert("RGB").tobytes()
+        elif components == 1:
+            return self._image.convert("L").tobytes()
         else:
-            raise ValueError("Only supports 3 or 4 components")
+            raise ValueError("Only supports 1, 3 or 4 components")
+
+
+class ArrayImage(BaseImage):
+    """An atlas image using a numpy array with the first row at the top"""
+
+    def __init__(self, image: npt.NDArray[numpy.uint8]):
+        if image.ndim == 2:
+            image = image[:, :, numpy.newaxis]
+        if image.ndim != 3:
+            raise ValueError("Expected an array with shape (height, width, components)")
+        self._image = numpy.ascontiguousarray(image, dtype=numpy.uint8)
+
+    @property
+    def width(self) -> int:
+        return self._image.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self._image.shape[0]
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.width, self.height
+
+    def get_pixel_data(self, components: int = 4) -> bytes:
+        """
+        Get the raw pixel data from the image.
+
+        Keyword Args:
+            components: Number of components to get. Must match the array
+        """
+        if components != self._image.shape[2]:
+            raise ValueError(
+                "Image has {} components, not {}".format(self._image.shape[2], components)
+            )
+        return self._image.tobytes()
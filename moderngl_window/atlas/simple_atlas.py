@@ -88,6 +88,18 @@ class Allocator:
 
         raise AllocatorException("No more space in {} for box [{}, {}]".format(self, width, height))
 
+    def resize(self, width: int, height: int) -> None:
+        """
+        Grow the allocation area keeping all allocated regions.
+        The last row is not compacted yet and takes the new height.
+        """
+        if width < self.width or height < self.height:
+            raise AllocatorException("Cannot shrink the allocator")
+
+        self.rows[-1].max_height += height - self.height
+        self.width = width
+        self.height = height
+
 
 class TextureAtlas:
     """
@@ -95,6 +107,11 @@ class TextureAtlas:
     There are more efficient ways to pack textures, but this
     is normally sufficient for dynamic atlases were textures
     are added on the fly runtime.
+
+    Images are written with their first row at the lowest y position
+    of their region. Regions are in pixels and stay the same when the
+    atlas grows, so texture coordinates should be computed from the region
+    and the current :py:attr:`size`. Only :py:meth:`rebuild` moves images.
     """
 
     def __init__(
@@ -122,7 +139,11 @@ class TextureAtlas:
 
         # We want to be able to render into the atlas texture
         self._fbo = self._ctx.framebuffer(color_attachments=[self._texture])
+        self._fbo.clear()
         self._allocator = Allocator(width, height)
+        # Region (x, y, width, height) of each image excluding the border
+        self._regions: dict[BaseImage, tuple[int, int, int, int]] = {}
+        self._version = 0
 
     @property
     def ctx(self) -> moderngl.Context:
@@ -130,10 +151,20 @@ class TextureAtlas:
         return self._ctx
 
     @property
-    def textrue(self) -> moderngl.Texture:
+    def texture(self) -> moderngl.Texture:
         """The moderngl texture with the atlas contents"""
         return self._texture
 
+    @property
+    def textrue(self) -> moderngl.Texture:
+        """The moderngl texture with the atlas contents. Misspelled alias of :py:attr:`texture`"""
+        return self._texture
+
+    @property
+    def fbo(self) -> moderngl.Framebuffer:
+        """moderngl.Framebuffer: Framebuffer for rendering into the atlas"""
+        return self._fbo
+
     @property
     def width(self) -> int:
         """int: Width of the atlas in pixels"""
@@ -156,14 +187,111 @@ class TextureAtlas:
         """
         return self._max_size
 
-    def add(self, image: BaseImage) -> None:
-        pass
+    @property
+    def version(self) -> int:
+        """int: Incremented every time :py:meth:`rebuild` moves the images"""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, image: BaseImage) -> bool:
+        return image in self._regions
+
+    def get_region(self, image: BaseImage) -> tuple[int, int, int, int]:
+        """
+        Get the region of an image in the atlas.
+
+        Returns:
+            tuple[int, int, int, int]: x, y, width, height in pixels
+        Raises:
+            KeyError: if the image is not in the atlas
+        """
+        return self._regions[image]
+
+    def add(self, image: BaseImage) -> tuple[int, int, int, int]:
+        """
+        Add an image to the atlas. Adding an image already in the
+        atlas returns the existing region.
+
+        Returns:
+            tuple[int, int, int, int]: x, y, width, height in pixels
+        Raises:
+            AllocatorException: if the image doesn't fit and the atlas can't grow
+        """
+        region = self._regions.get(image)
+        if region is not None:
+            return region
+
+        width = image.width + self._border * 2
+        height = image.height + self._border * 2
+        while True:
+            try:
+                x, y = self._allocator.alloc(width, height)
+                break
+            except AllocatorException:
+                if not self._auto_resize:
+                    raise
+
+                new_width = min(self._width * 2, self._max_size[0])
+                new_height = min(self._height * 2, self._max_size[1])
+                if (new_width, new_height) == self.size:
+                    raise
+                self.resize(new_width, new_height)
+
+        region = (x + self._border, y + self._border, image.width, image.height)
+        self._write(image, region)
+        self._regions[image] = region
+        return region
 
     def remove(self, image: BaseImage) -> None:
-        pass
+        """
+        Remove an image from the atlas.
+        The space is not reused until the atlas is rebuilt.
+        """
+        del self._regions[image]
 
     def resize(self, width: int, height: int) -> None:
-        pass
+        """
+        Grow the atlas keeping the images in their current regions.
+
+        Raises:
+            ValueError: if the atlas would shrink or exceed the max size
+        """
+        if width < self._width or height < self._height:
+            raise ValueError("Cannot shrink the atlas. Use rebuild() to compact it")
+        if width > self._max_size[0] or height > self._max_size[1]:
+            raise ValueError("{}x{} exceeds the max size {}".format(width, height, self._max_size))
+
+        data = self._texture.read()
+        self._fbo.release()
+        self._texture.release()
+
+        self._texture = self._ctx.texture((width, height), components=self._components)
+        self._fbo = self._ctx.framebuffer(color_attachments=[self._texture])
+        self._fbo.clear()
+        self._texture.write(data, viewport=(0, 0, self._width, self._height))
+        self._allocator.resize(width, height)
+        self._width, self._height = width, height
 
     def rebuild(self) -> None:
-        pass
+        """
+        Add all images again to reclaim the space of removed images.
+        This moves the images so their regions must be queried again.
+        """
+        images = list(self._regions)
+        self._regions = {}
+        self._version += 1
+        self._allocator = Allocator(self._width, self._height)
+        self._fbo.clear()
+        for image in images:
+            self.add(image)
+
+    def release(self) -> None:
+        """Release the texture and framebuffer"""
+        self._fbo.release()
+        self._texture.release()
+
+    def _write(self, image: BaseImage, region: tuple[int, int, int, int]) -> None:
+        """Write the pixels of an image into its region"""
+        self._texture.write(image.get_pixel_data(components=self._components), viewport=region)
@@ -1,2 +1,5 @@
 from .base import BaseVideoCapture  # noqa
 from .ffmpeg import FFmpegCapture  # noqa
+from .image_sequence import ImageSequenceCapture  # noqa
+from .memmap import MemmapCapture  # noqa
+from .shared_memory import SharedFrameRing, SharedMemoryCapture  # noqa
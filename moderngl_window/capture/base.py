@@ -1,10 +1,16 @@
 import datetime
 import os
+import queue
+import threading
 from typing import Any, Optional, Union
 
 import moderngl
+import numpy
+import numpy.typing as npt
 
-from moderngl_window.timers.clock import Timer
+from moderngl_window.timers.base import BaseTimer
+from moderngl_window.timers.perf import PerfTimer
+from moderngl_window.timers.fixed import FixedTimer
 
 
 class BaseVideoCapture:
@@ -14,20 +20,52 @@ class BaseVideoCapture:
     Args:
         source (moderngl.Texture, moderngl.Framebuffer): the source of the capture
         framerate (int, float) : the framerate of the video, by thefault is 60 fps
+        asynchronous (bool): read frames back asynchronously and write them in a thread
+        buffers (int): number of pixel buffers used for asynchronous readback
+        queue_size (int): maximum number of frames waiting to be written
+        timer (BaseTimer): timer deciding when to capture frames. By default
+            a wall clock timer is created. A ``FixedTimer`` captures every frame
 
     if the source is texture there are some requirements:
         - dtype = 'f1';
         - components >= 3.
+
+    In asynchronous mode every frame is copied into one of a ring of pixel
+    buffer objects. The buffer is read ``buffers - 1`` captured frames later
+    when the GPU is done with it, so the render thread doesn't wait for the
+    transfer. ``_dump_frame`` is then called from a writer thread. When the
+    writer can't keep up the render thread blocks once ``queue_size``
+    frames are waiting.
+
+    For deterministic offline rendering pass the ``FixedTimer`` of the
+    window config (see ``WindowConfig.offline_framerate``). Every call to
+    ``save`` then captures a frame regardless of how long it took to render.
     """
 
+    #: Extension of the generated filename when no filename is passed to ``start_capture``
+    file_extension = ".mp4"
+
     def __init__(
         self,
         source: Union[moderngl.Texture, moderngl.Framebuffer],
         framerate: Union[int, float] = 60,
+        asynchronous: bool = False,
+        buffers: int = 3,
+        queue_size: int = 8,
+        timer: Optional[BaseTimer] = None,
     ):
         self._source = source
         self._framerate = framerate
 
+        self._asynchronous = asynchronous
+        self._buffer_count = max(buffers, 1)
+        self._queue_size = queue_size
+        self._buffers: list[moderngl.Buffer] = []
+        self._pending: list[bool] = []
+        self._buffer_index = 0
+        self._queue: Optional[queue.Queue[Optional[bytes]]] = None
+        self._writer: Optional[threading.Thread] = None
+
         self._recording: Optional[bool] = False
 
         self._last_time: float = 0.0
@@ -35,7 +73,9 @@ class BaseVideoCapture:
         self._width: Optional[int] = None
         self._height: Optional[int] = None
 
-        self._timer = Timer()
+        # An external timer is started and stopped by its owner
+        self._owns_timer = timer is None
+        self._timer: BaseTimer = timer or PerfTimer()
 
         self._components: int = 0  # for textures
 
@@ -71,6 +111,121 @@ class BaseVideoCapture:
         """
         return self._source.width, self._source.height
 
+    def _frame_shape(self) -> tuple[int, int, int]:
+        """
+        Return the (height, width, components) shape of one frame
+        """
+        assert self._width is not None and self._height is not None
+        components = 3 if isinstance(self._source, moderngl.Framebuffer) else self._components
+        return self._height, self._width, components
+
+    def _frame_size(self) -> int:
+        """
+        Return the size of one frame in bytes
+        """
+        height, width, components = self._frame_shape()
+        return height * width * components
+
+    def _frame_array(self, frame: bytes) -> npt.NDArray[numpy.uint8]:
+        """
+        Return frame data as a (height, width, components) array with the first row at the top
+        """
+        return numpy.frombuffer(frame, dtype=numpy.uint8).reshape(self._frame_shape())[::-1]
+
+    def _read_frame(self) -> bytes:
+        """
+        Read the current frame from the source
+        """
+        if isinstance(self._source, moderngl.Framebuffer):
+            # get data from framebuffer
+            return self._source.read(components=3)
+
+        # get data from texture
+        return self._source.read()
+
+    def _read_frame_into(self, buffer: moderngl.Buffer) -> None:
+        """
+        Copy the current frame from the source into a buffer on the GPU
+        """
+        if isinstance(self._source, moderngl.Framebuffer):
+            self._source.read_into(buffer, components=3)
+        else:
+            self._source.read_into(buffer)
+
+    def _start_async(self) -> None:
+        """
+        Create the pixel buffers and start the writer thread
+        """
+        ctx = self._source.ctx
+        size = self._frame_size()
+        self._buffers = [ctx.buffer(reserve=size) for _ in range(self._buffer_count)]
+        self._pending = [False] * self._buffer_count
+        self._buffer_index = 0
+
+        self._queue = queue.Queue(maxsize=max(self._queue_size, 1))
+        self._writer = threading.Thread(
+            target=self._write_frames, args=(self._queue,), name="VideoCaptureWriter", daemon=True
+        )
+        self._writer.start()
+
+    def _write_frames(self, frames: "queue.Queue[Optional[bytes]]") -> None:
+        """
+        Writer thread passing queued frames to ``_dump_frame``
+        """
+        failed = False
+        while True:
+            frame = frames.get()
+            if frame is None:
+                break
+
+            # Keep draining the queue so the render thread never blocks on a failed writer
+            if failed:
+                continue
+
+            try:
+                self._dump_frame(frame)
+            except Exception as ex:
+                print(f"Writing video frame failed: {ex}")
+                failed = True
+
+    def _save_async(self) -> None:
+        """
+        Queue the frame copied ``buffers - 1`` frames ago and copy the current frame
+        """
+        assert self._queue is not None
+        buffer = self._buffers[self._buffer_index]
+        if self._pending[self._buffer_index]:
+            self._queue.put(buffer.read())
+
+        self._read_frame_into(buffer)
+        self._pending[self._buffer_index] = True
+        self._buffer_index = (self._buffer_index + 1) % len(self._buffers)
+
+    def _stop_async(self) -> None:
+        """
+        Queue the remaining frames, wait for the writer and release the pixel buffers
+        """
+        if self._queue is None:
+            return
+
+        # The pending frames starting with the oldest one
+        for i in range(len(self._buffers)):
+            index = (self._buffer_index + i) % len(self._buffers)
+            if self._pending[index]:
+                self._queue.put(self._buffers[index].read())
+
+        self._queue.put(None)
+        if self._writer is not None:
+            self._writer.join()
+
+        for buffer in self._buffers:
+            buffer.release()
+
+        self._buffers = []
+        self._pending = []
+        self._queue = None
+        self._writer = None
+
     def _remove_file(self) -> None:
         """Remove the filename of the video is it exist"""
         if os.path.exists(self._filename):
@@ -108,7 +263,7 @@ class BaseVideoCapture:
 
         if not filename:
             now = datetime.datetime.now()
-            filename = f"video_{now:%Y%m%d_%H%M%S}.mp4"
+            filename = f"video_{now:%Y%m%d_%H%M%S}{self.file_extension}"
 
         self._filename = filename
 
@@ -123,7 +278,11 @@ class BaseVideoCapture:
             print("Capturing failed")
             return
 
-        self._timer.start()
+        if self._asynchronous:
+            self._start_async()
+
+        if self._owns_timer:
+            self._timer.start()
         self._last_time = self._timer.time
         self._recording = True
 
@@ -139,26 +298,24 @@ class BaseVideoCapture:
 
         dt = 1.0 / self._framerate
 
-        if self._timer.time - self._last_time > dt:
+        if isinstance(self._timer, FixedTimer) or self._timer.time - self._last_time > dt:
             # start counting
             self._last_time = self._timer.time
 
-            if isinstance(self._source, moderngl.Framebuffer):
-                # get data from framebuffer
-                frame = self._source.read(components=3)
-                self._dump_frame(frame)
+            if self._asynchronous:
+                self._save_async()
             else:
-                # get data from texture
-                frame = self._source.read()
-                self._dump_frame(frame)
+                self._dump_frame(self._read_frame())
 
     def release(self) -> None:
         """
         Stop the recording process
         """
         if self._recording:
+            self._stop_async()
             self._release_func()
 
-            self._timer.stop()
+            if self._owns_timer:
+                self._timer.stop()
             print(f"Video file succesfully saved as {self._filename}")
         self._recording = None
@@ -27,8 +27,10 @@ class FFmpegCapture(BaseVideoCapture):
                 super().__init__(**kwargs)
                 # do other initialization
 
-                # define VideoCapture class
-                self.cap = FFmpegCapture(source=self.wnd.fbo)
+                # define VideoCapture class.
+                # asynchronous=True reads frames back with pixel buffers
+                # and writes to ffmpeg in a separate thread
+                self.cap = FFmpegCapture(source=self.wnd.fbo, asynchronous=True)
 
                 # start recording
                 self.cap.start_capture(
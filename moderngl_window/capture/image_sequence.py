@@ -0,0 +1,122 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+import numpy
+from PIL import Image
+
+from .base import BaseVideoCapture
+
+
+class ImageSequenceCapture(BaseVideoCapture):
+    """
+    ``ImageSequenceCapture`` saves every captured frame as a separate
+    image file. Images are encoded and written by a pool of worker threads.
+
+    The filename passed to ``start_capture`` is either a directory or
+    a pattern with a format field for the frame number such as
+    ``"frames/frame_{:06d}.png"``. The image format is decided by the
+    file extension. The ``.raw`` extension writes the uncompressed pixel
+    data with the first row at the top.
+
+    Args:
+        workers (int): number of threads saving images
+        image_format (str): extension used when the filename is a directory
+
+    Example:
+
+    .. code:: python
+
+        from moderngl_window.capture.image_sequence import ImageSequenceCapture
+
+        self.cap = ImageSequenceCapture(source=self.wnd.fbo, workers=4, asynchronous=True)
+        self.cap.start_capture(filename="frames/frame_{:06d}.png", framerate=30)
+    """
+
+    file_extension = ""
+
+    def __init__(self, workers: int = 4, image_format: str = "png", **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._workers = max(workers, 1)
+        self._image_format = image_format.lstrip(".")
+        self._pattern = ""
+        self._frame_number = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Limit the number of frames waiting in the pool
+        self._slots = threading.BoundedSemaphore(self._workers * 2)
+        self._errors: list[BaseException] = []
+
+    @property
+    def pattern(self) -> str:
+        """str: The filename pattern for the images"""
+        return self._pattern
+
+    def _start_func(self) -> bool:
+        """
+        resolve the filename pattern and start the worker pool
+        """
+        if "{" in self._filename:
+            self._pattern = self._filename
+        else:
+            self._pattern = os.path.join(self._filename, f"frame_{{:06d}}.{self._image_format}")
+
+        directory = os.path.dirname(self._pattern)
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        except OSError as ex:
+            print(f"Could not create directory {directory}: {ex}")
+            return False
+
+        self._frame_number = 0
+        self._errors = []
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="ImageSequenceCapture"
+        )
+        return True
+
+    def _release_func(self) -> None:
+        """
+        wait for the workers to finish
+        """
+        if self._pool is None:
+            return
+
+        self._pool.shutdown(wait=True)
+        self._pool = None
+
+        if self._errors:
+            print(f"Failed to save {len(self._errors)} images: {self._errors[0]}")
+
+    def _dump_frame(self, frame: Any) -> None:
+        """
+        send the frame to a worker thread
+        """
+        if self._pool is None:
+            return
+
+        filename = self._pattern.format(self._frame_number)
+        self._frame_number += 1
+
+        self._slots.acquire()
+        future = self._pool.submit(self._save_image, filename, frame)
+        future.add_done_callback(self._image_saved)
+
+    def _save_image(self, filename: str, frame: bytes) -> None:
+        """
+        save one image. Called in a worker thread
+        """
+        pixels = self._frame_array(frame)
+        if filename.endswith(".raw"):
+            with open(filename, "wb") as fd:
+                fd.write(pixels.tobytes())
+            return
+
+        Image.fromarray(numpy.ascontiguousarray(pixels)).save(filename)
+
+    def _image_saved(self, future: "Future[None]") -> None:
+        self._slots.release()
+        error = future.exception()
+        if error is not None:
+            self._errors.append(error)
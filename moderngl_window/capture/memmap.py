@@ -0,0 +1,85 @@
+from typing import Any, Optional
+
+import numpy
+import numpy.typing as npt
+
+from .base import BaseVideoCapture
+
+
+class MemmapCapture(BaseVideoCapture):
+    """
+    ``MemmapCapture`` writes the captured frames into a pre-allocated
+    memory mapped ``.npy`` file with the shape (frames, height, width, components)
+    and dtype ``uint8``. The first row of each frame is the top of the image.
+
+    The file can be opened with ``numpy.load(filename, mmap_mode="r")``.
+    Frames captured after the file is full are ignored.
+
+    Args:
+        frames (int): number of frames to allocate in the file
+
+    Example:
+
+    .. code:: python
+
+        from moderngl_window.capture.memmap import MemmapCapture
+
+        self.cap = MemmapCapture(source=self.wnd.fbo, frames=600, asynchronous=True)
+        self.cap.start_capture(filename="frames.npy", framerate=60)
+    """
+
+    file_extension = ".npy"
+
+    def __init__(self, frames: int = 600, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._frames = frames
+        self._frames_written = 0
+        self._array: Optional[numpy.memmap[Any, numpy.dtype[numpy.uint8]]] = None
+
+    @property
+    def frames_written(self) -> int:
+        """int: Number of frames written to the file"""
+        return self._frames_written
+
+    @property
+    def array(self) -> Optional[npt.NDArray[numpy.uint8]]:
+        """numpy.ndarray: The memory mapped array while capturing"""
+        return self._array
+
+    def _start_func(self) -> bool:
+        """
+        create the memory mapped file
+        """
+        try:
+            self._array = numpy.lib.format.open_memmap(
+                self._filename,
+                mode="w+",
+                dtype=numpy.uint8,
+                shape=(self._frames, *self._frame_shape()),
+            )
+        except OSError as ex:
+            print(f"Could not create {self._filename}: {ex}")
+            return False
+
+        self._frames_written = 0
+        return True
+
+    def _release_func(self) -> None:
+        """
+        flush and close the file
+        """
+        if self._array is None:
+            return
+
+        self._array.flush()
+        self._array = None
+
+    def _dump_frame(self, frame: Any) -> None:
+        """
+        copy the frame into the next slot of the file
+        """
+        if self._array is None or self._frames_written >= self._frames:
+            return
+
+        self._array[self._frames_written] = self._frame_array(frame)
+        self._frames_written += 1
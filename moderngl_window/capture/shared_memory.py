@@ -0,0 +1,335 @@
+import os
+import sys
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional
+
+import numpy
+import numpy.typing as npt
+
+from .base import BaseVideoCapture
+
+# Identifies an initialized frame ring
+MAGIC = 0x464C474D
+
+HEADER_DTYPE = numpy.dtype(
+    [
+        ("magic", "<u4"),
+        ("slots", "<u4"),
+        ("height", "<u4"),
+        ("width", "<u4"),
+        ("components", "<u4"),
+        ("reserved", "<u4"),
+        ("sequence", "<u8"),
+    ]
+)
+
+# Alignment of the frame data in the shared memory block
+DATA_ALIGNMENT = 64
+
+# Shared memory blocks created by this process
+_created: set[str] = set()
+
+
+def _data_offset(slots: int) -> int:
+    """Byte offset of the first frame in the shared memory block"""
+    offset = HEADER_DTYPE.itemsize + slots * 8
+    return -(-offset // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to existing shared memory without letting this process remove it on exit"""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    shm = SharedMemory(name=name)
+    # The tracker only keeps one entry per block, so leave blocks created here registered
+    if os.name == "posix" and shm._name not in _created:  # type: ignore[attr-defined]
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+
+    return shm
+
+
+class SharedFrameRing:
+    """Ring buffer of ``uint8`` frames in shared memory.
+
+    A single writer adds frames while any number of readers in other
+    processes attach to the ring by name and access the frames as
+    NumPy arrays without copying.
+
+    Every frame gets a sequence number starting at 1. The header holds the
+    sequence number of the latest complete frame and each slot holds the
+    sequence number of the frame stored in it. A slot's number is cleared
+    while it is being written, so readers can tell if a frame was
+    overwritten without any locking. A frame stays available until
+    ``slots`` newer frames have been written.
+
+    Example::
+
+        # Writer
+        ring = SharedFrameRing.create((720, 1280, 3), slots=4, name="frames")
+        ring.write(frame)
+
+        # Reader in another process
+        ring = SharedFrameRing.attach("frames")
+        sequence = ring.wait(0)
+        frame = ring.frame(sequence)
+        # .. use the frame
+        if not ring.is_valid(sequence):
+            # The frame was overwritten while we used it
+    """
+
+    def __init__(self, shm: SharedMemory, owner: bool = False):
+        """Wrap an initialized shared memory block.
+        Use :py:meth:`create` or :py:meth:`attach` instead.
+
+        Args:
+            shm (SharedMemory): The shared memory block
+            owner (bool): This instance created the block and may write frames
+        """
+        header = numpy.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        if int(header["magic"]) != MAGIC:
+            raise ValueError("Shared memory '{}' is not a frame ring".format(shm.name))
+
+        self._shm = shm
+        self._owner = owner
+        self._header = header
+        self._slots = int(header["slots"])
+        self._shape = (int(header["height"]), int(header["width"]), int(header["components"]))
+        self._sequences = numpy.ndarray(
+            (self._slots,), dtype="<u8", buffer=shm.buf, offset=HEADER_DTYPE.itemsize
+        )
+        self._frames = numpy.ndarray(
+            (self._slots, *self._shape),
+            dtype=numpy.uint8,
+            buffer=shm.buf,
+            offset=_data_offset(self._slots),
+        )
+        if not owner:
+            self._frames.flags.writeable = False
+
+    @classmethod
+    def create(
+        cls, shape: tuple[int, int, int], slots: int = 4, name: Optional[str] = None
+    ) -> "SharedFrameRing":
+        """Create a new ring in shared memory.
+
+        Args:
+            shape (tuple): (height, width, components) of the frames
+            slots (int): Number of frames in the ring
+            name (str): Name of the shared memory block. Generated if not set
+        """
+        height, width, components = shape
+        size = _data_offset(slots) + slots * height * width * components
+        shm = SharedMemory(name=name, create=True, size=size)
+        _created.add(shm._name)  # type: ignore[attr-defined]
+
+        header = numpy.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        header[()] = (0, slots, height, width, components, 0, 0)
+        numpy.ndarray((slots,), dtype="<u8", buffer=shm.buf, offset=HEADER_DTYPE.itemsize)[:] = 0
+        # Readers can attach after the magic is written
+        header["magic"] = MAGIC
+        del header
+
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """Attach to a ring created in another process.
+
+        Args:
+            name (str): Name of the shared memory block
+        """
+        return cls(_attach(name))
+
+    @property
+    def name(self) -> str:
+        """str: Name of the shared memory block"""
+        return self._shm.name
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """tuple: (height, width, components) of the frames"""
+        return self._shape
+
+    @property
+    def slots(self) -> int:
+        """int: Number of frames in the ring"""
+        return self._slots
+
+    @property
+    def sequence(self) -> int:
+        """int: Sequence number of the latest frame. 0 if no frame is written"""
+        return int(self._header["sequence"])
+
+    def write(self, frame: Any) -> int:
+        """Write a frame to the next slot.
+
+        Args:
+            frame: ``bytes`` or an array with the shape of the ring
+        Returns:
+            int: The sequence number of the frame
+        """
+        if not self._owner:
+            raise ValueError("Only the process creating the ring can write frames")
+
+        sequence = self.sequence + 1
+        slot = (sequence - 1) % self._slots
+        if isinstance(frame, (bytes, bytearray, memoryview)):
+            frame = numpy.frombuffer(frame, dtype=numpy.uint8).reshape(self._shape)
+
+        self._sequences[slot] = 0
+        self._frames[slot] = frame
+        self._sequences[slot] = sequence
+        self._header["sequence"] = sequence
+        return sequence
+
+    def is_valid(self, sequence: int) -> bool:
+        """Is the frame still in the ring and not being overwritten?
+
+        Args:
+            sequence (int): Sequence number of the frame
+        """
+        if sequence < 1:
+            return False
+        return int(self._sequences[(sequence - 1) % self._slots]) == sequence
+
+    def frame(self, sequence: int, copy: bool = False) -> Optional[npt.NDArray[numpy.uint8]]:
+        """Get a frame by sequence number.
+
+        Args:
+            sequence (int): Sequence number of the frame
+            copy (bool): Return a copy instead of a view into shared memory
+        Returns:
+            The frame or ``None`` if it is not available
+        """
+        if not self.is_valid(sequence):
+            return None
+
+        view = self._frames[(sequence - 1) % self._slots]
+        if not copy:
+            return view
+
+        data = view.copy()
+        # Make sure the frame was not overwritten while copying
+        return data if self.is_valid(sequence) else None
+
+    def latest(self, copy: bool = False) -> tuple[int, Optional[npt.NDArray[numpy.uint8]]]:
+        """Get the latest frame.
+
+        Args:
+            copy (bool): Return a copy instead of a view into shared memory
+        Returns:
+            tuple: sequence number and frame. The frame is ``None`` if not available
+        """
+        sequence = self.sequence
+        return sequence, self.frame(sequence, copy=copy)
+
+    def wait(self, sequence: int, timeout: Optional[float] = None, interval: float = 0.0005) -> int:
+        """Wait for a frame newer than a sequence number.
+
+        Args:
+            sequence (int): Sequence number of the last frame the caller has seen
+            timeout (float): Maximum number of seconds to wait. Waits forever if not set
+            interval (float): Seconds to sleep between each check
+        Returns:
+            int: Sequence number of the latest frame or 0 on timeout
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            latest = self.sequence
+            if latest > sequence:
+                return latest
+            if deadline is not None and time.perf_counter() >= deadline:
+                return 0
+            time.sleep(interval)
+
+    def close(self) -> None:
+        """Close this process' access to the ring.
+        All frame views must be released first.
+        """
+        del self._header, self._sequences, self._frames
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the shared memory block. Only called by the owner."""
+        _created.discard(self._shm._name)  # type: ignore[attr-defined]
+        self._shm.unlink()
+
+
+class SharedMemoryCapture(BaseVideoCapture):
+    """
+    ``SharedMemoryCapture`` writes the captured frames into a
+    :py:class:`SharedFrameRing` so other processes can consume them.
+    Frames have the shape (height, width, components) with the first
+    row at the top.
+
+    The filename passed to ``start_capture`` is used as the name of the
+    shared memory block. The block is removed when the capture is released.
+
+    Args:
+        slots (int): number of frames in the ring
+
+    Example:
+
+    .. code:: python
+
+        from moderngl_window.capture.shared_memory import SharedMemoryCapture
+
+        self.cap = SharedMemoryCapture(source=self.wnd.fbo, slots=8, asynchronous=True)
+        self.cap.start_capture(filename="render_frames", framerate=30)
+
+        # In the consumer process
+        from moderngl_window.capture.shared_memory import SharedFrameRing
+
+        ring = SharedFrameRing.attach("render_frames")
+        sequence, frame = ring.latest()
+    """
+
+    file_extension = ""
+
+    def __init__(self, slots: int = 4, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._slots = slots
+        self._ring: Optional[SharedFrameRing] = None
+
+    @property
+    def ring(self) -> Optional[SharedFrameRing]:
+        """SharedFrameRing: The ring while capturing"""
+        return self._ring
+
+    def _start_func(self) -> bool:
+        """
+        create the shared memory ring
+        """
+        try:
+            self._ring = SharedFrameRing.create(
+                self._frame_shape(), slots=self._slots, name=self._filename
+            )
+        except (OSError, ValueError) as ex:
+            print(f"Could not create shared memory {self._filename}: {ex}")
+            return False
+
+        return True
+
+    def _release_func(self) -> None:
+        """
+        close and remove the shared memory ring
+        """
+        if self._ring is None:
+            return
+
+        self._ring.close()
+        self._ring.unlink()
+        self._ring = None
+
+    def _dump_frame(self, frame: Any) -> None:
+        """
+        write the frame to the ring
+        """
+        if self._ring is None:
+            return
+
+        self._ring.write(self._frame_array(frame))
@@ -20,7 +20,7 @@ from moderngl_window.meta import (
     TextureDescription,
 )
 from moderngl_window.scene import Scene
-from moderngl_window.timers import BaseTimer, Timer
+from moderngl_window.timers import BaseTimer, PerfTimer
 
 FuncAny = Callable[[Any], Any]
 
@@ -1093,6 +1093,45 @@ class WindowConfig:
     A value less than 0 will disable the framerate limit. Otherwise the
     the value is a suggested limit in frames per second.
     """
+    offline_framerate: Optional[float] = None
+    """
+    Enables the offline render mode when set. Instead of following the
+    wall clock the time advances exactly ``1 / offline_framerate`` seconds
+    every frame using a :py:class:`~moderngl_window.timers.fixed.FixedTimer`.
+    Frames are rendered as fast as possible without vsync or framerate
+    limits making the output deterministic. This is useful for capturing
+    videos. Can also be enabled with the ``--offline`` command line argument.
+
+    .. code:: python
+
+        # Default value
+        offline_framerate = None
+    """
+    offline_duration: Optional[float] = None
+    """
+    Number of seconds of virtual time to render in offline mode before
+    the window is closed. ``None`` renders until the window is closed.
+    Can also be set with the ``--duration`` command line argument.
+
+    .. code:: python
+
+        # Default value
+        offline_duration = None
+    """
+    target_fps: Optional[float] = None
+    """
+    Paces the main loop to start frames at exactly this framerate using
+    a :py:class:`~moderngl_window.timers.pacing.FramePacer`. This gives
+    more even frame times than ``time.sleep`` and works without vsync.
+    :py:meth:`on_frame_budget` is called when rendering takes longer than
+    the frame budget. Can also be set with the ``--target-fps`` command
+    line argument.
+
+    .. code:: python
+
+        # Default value
+        target_fps = None
+    """
 
     log_level = logging.INFO
     """
@@ -1133,7 +1172,7 @@ class WindowConfig:
 
         self.ctx = ctx
         self.wnd = wnd
-        self.timer: BaseTimer = timer or Timer()
+        self.timer: BaseTimer = timer or PerfTimer()
 
         self.assign_event_callbacks()
 
@@ -1207,6 +1246,17 @@ class WindowConfig:
             height (int): height in buffer size (not window size)
         """
 
+    def on_frame_budget(self, exceeded: bool, frame_time: float) -> None:
+        """
+        Called when :py:attr:`target_fps` is set and the average time spent
+        rendering a frame goes over the frame budget or falls well below it again.
+        This can be used to lower or restore the render resolution or quality.
+
+        Args:
+            exceeded (bool): True when over budget, False when recovered
+            frame_time (float): The average time spent rendering a frame in seconds
+        """
+
     def on_close(self) -> None:
         """Called when the window is about to close"""
 
@@ -1463,6 +1513,7 @@ class WindowConfig:
         tess_evaluation_shader: Optional[str] = None,
         defines: Optional[dict[str, Any]] = None,
         varyings: Optional[list[str]] = None,
+        reloadable: bool = False,
     ) -> moderngl.Program:
         """Loads a shader program.
 
@@ -1483,6 +1534,8 @@ class WindowConfig:
             defines (dict): ``#define`` values to replace in the shader source.
                             Example: ``{'VALUE1': 10, 'VALUE2': '3.1415'}``.
             varyings (list[str]): Out attribute names for transform shaders
+            reloadable (bool): Wrap the program in a ``ReloadableProgram`` that is
+                               reloaded when its files change and a reloader is enabled
         Returns:
             moderngl.Program: The program instance
         """
@@ -1496,9 +1549,24 @@ class WindowConfig:
                 tess_evaluation_shader=tess_evaluation_shader,
                 defines=defines,
                 varyings=varyings,
+                reloadable=reloadable,
             )
         )
 
+    def load_programs(self, descriptions: list[ProgramDescription]) -> list[moderngl.Program]:
+        """Loads several shader programs at once.
+
+        Every source is read before the first program is created and compile
+        errors are reported for all programs together. Useful for loading all
+        programs during startup.
+
+        Args:
+            descriptions (list[ProgramDescription]): The programs to load
+        Returns:
+            list[moderngl.Program]: The programs in the same order
+        """
+        return resources.programs.load_batch(descriptions)
+
     def load_compute_shader(
         self, path: str, defines: Optional[dict[str, Any]] = None, **kwargs: Any
     ) -> moderngl.ComputeShader:
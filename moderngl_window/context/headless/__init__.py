@@ -1,2 +1,3 @@
+from .batch import BatchFramebuffer  # noqa
 from .keys import Keys  # noqa
 from .window import Window  # noqa
@@ -0,0 +1,223 @@
+import math
+from typing import Callable, Optional
+
+import moderngl
+import numpy
+import numpy.typing as npt
+
+
+class BatchFramebuffer:
+    """Framebuffer holding the frames of many small viewports.
+
+    The frames are tiled in a grid inside one large framebuffer so
+    rendering all slots only needs one framebuffer bind and reading
+    them back is a single transfer. This is useful when rendering
+    observations for many environments at once.
+
+    Example::
+
+        batch = BatchFramebuffer(ctx, count=256, size=(84, 84))
+
+        def render_slot(slot):
+            scenes[slot].draw(projection, cameras[slot])
+
+        batch.clear()
+        batch.render(render_slot)
+        frames = batch.read()  # (256, 84, 84, 3)
+
+    Frames are returned with the first row at the top.
+    """
+
+    def __init__(
+        self,
+        ctx: moderngl.Context,
+        count: int,
+        size: tuple[int, int],
+        components: int = 3,
+        columns: Optional[int] = None,
+        depth: bool = True,
+    ):
+        """Create the framebuffer.
+
+        Args:
+            ctx (moderngl.Context): The context
+            count (int): Number of slots
+            size (tuple): (width, height) of each slot
+            components (int): Number of components read back for each pixel
+            columns (int): Number of slots in each row. Makes the framebuffer square if not set
+            depth (bool): Create a depth attachment
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1, not {}".format(count))
+        if components not in (1, 2, 3, 4):
+            raise ValueError("components must be between 1 and 4, not {}".format(components))
+
+        width, height = size
+        if columns is None:
+            columns = max(1, round(math.sqrt(count * height / width)))
+        columns = min(columns, count)
+        rows = -(-count // columns)
+
+        max_size = ctx.info.get("GL_MAX_TEXTURE_SIZE") or 16384
+        if columns * width > max_size or rows * height > max_size:
+            raise ValueError(
+                "{} slots of {}x{} do not fit in a {}x{} framebuffer".format(
+                    count, width, height, max_size, max_size
+                )
+            )
+
+        self.ctx = ctx
+        self._count = count
+        self._size = (width, height)
+        self._components = components
+        self._columns = columns
+        self._rows = rows
+        self._texture = ctx.texture((columns * width, rows * height), 4)
+        self._depth = ctx.depth_renderbuffer(self._texture.size) if depth else None
+        self._fbo = ctx.framebuffer(color_attachments=[self._texture], depth_attachment=self._depth)
+        self._data = numpy.empty((rows * height, columns * width, components), dtype=numpy.uint8)
+        self._viewports = [
+            ((i % columns) * width, (i // columns) * height, width, height) for i in range(count)
+        ]
+
+    @property
+    def count(self) -> int:
+        """int: Number of slots"""
+        return self._count
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """tuple: (width, height) of each slot"""
+        return self._size
+
+    @property
+    def shape(self) -> tuple[int, int, int, int]:
+        """tuple: Shape of the array returned by :py:meth:`read`"""
+        return self._count, self._size[1], self._size[0], self._components
+
+    @property
+    def grid(self) -> tuple[int, int]:
+        """tuple: (columns, rows) of slots in the framebuffer"""
+        return self._columns, self._rows
+
+    @property
+    def fbo(self) -> moderngl.Framebuffer:
+        """moderngl.Framebuffer: The framebuffer holding all slots"""
+        return self._fbo
+
+    @property
+    def texture(self) -> moderngl.Texture:
+        """moderngl.Texture: The color attachment holding all slots"""
+        return self._texture
+
+    def viewport(self, slot: int) -> tuple[int, int, int, int]:
+        """Get the viewport of a slot in the framebuffer.
+
+        Args:
+            slot (int): The slot
+        Returns:
+            tuple: x, y, width, height
+        """
+        return self._viewports[slot]
+
+    def transforms(self) -> npt.NDArray[numpy.float32]:
+        """Scale and offset moving normalized device coordinates into each slot.
+
+        Used for drawing all slots with one instanced draw call while the
+        whole framebuffer is bound with :py:meth:`use`. The vertex shader
+        applies ``gl_Position.xy = gl_Position.xy * t.xy + t.zw * gl_Position.w``
+        where ``t`` is the row for the instance. Geometry outside a slot
+        is not clipped and can bleed into the neighbouring slots.
+
+        Returns:
+            numpy.ndarray: (count, 4) array of x scale, y scale, x offset, y offset
+        """
+        columns, rows = self._columns, self._rows
+        slots = numpy.arange(self._count)
+        data = numpy.empty((self._count, 4), dtype=numpy.float32)
+        data[:, 0] = 1.0 / columns
+        data[:, 1] = 1.0 / rows
+        data[:, 2] = ((slots % columns) * 2 + 1) / columns - 1.0
+        data[:, 3] = ((slots // columns) * 2 + 1) / rows - 1.0
+        return data
+
+    def use(self) -> None:
+        """Bind the framebuffer with a viewport covering all slots"""
+        self._fbo.use()
+        self._fbo.viewport = (0, 0, *self._texture.size)
+
+    def use_slot(self, slot: int) -> None:
+        """Bind the framebuffer and restrict rendering to a slot.
+
+        Args:
+            slot (int): The slot
+        """
+        self._fbo.use()
+        self._fbo.viewport = self._viewports[slot]
+        self._fbo.scissor = self._viewports[slot]
+
+    def clear(
+        self,
+        red: float = 0.0,
+        green: float = 0.0,
+        blue: float = 0.0,
+        alpha: float = 0.0,
+        depth: float = 1.0,
+    ) -> None:
+        """Clear all slots.
+
+        Args:
+            red (float): color component
+            green (float): color component
+            blue (float): color component
+            alpha (float): alpha component
+            depth (float): depth value
+        """
+        self._fbo.scissor = (0, 0, *self._texture.size)
+        self._fbo.clear(red=red, green=green, blue=blue, alpha=alpha, depth=depth)
+
+    def render(self, func: Callable[[int], None], slots: Optional[range] = None) -> None:
+        """Call a function rendering each slot.
+
+        The viewport and scissor box are set to the slot before each call.
+
+        Args:
+            func: Function taking the slot number
+            slots (range): The slots to render. All slots if not set
+        """
+        for slot in slots if slots is not None else range(self._count):
+            self.use_slot(slot)
+            func(slot)
+
+        self._fbo.scissor = (0, 0, *self._texture.size)
+        self._fbo.viewport = (0, 0, *self._texture.size)
+
+    def read(self, out: Optional[npt.NDArray[numpy.uint8]] = None) -> npt.NDArray[numpy.uint8]:
+        """Read all slots with a single transfer.
+
+        Args:
+            out (numpy.ndarray): Array to write the frames to. Must have the shape :py:attr:`shape`
+        Returns:
+            numpy.ndarray: (count, height, width, components) array of ``uint8``
+        """
+        if out is None:
+            out = numpy.empty(self.shape, dtype=numpy.uint8)
+        elif out.shape != self.shape:
+            raise ValueError(
+                "Expected an array with shape {}, not {}".format(self.shape, out.shape)
+            )
+
+        self._fbo.read_into(self._data, components=self._components)
+        width, height = self._size
+        tiles = self._data.reshape(self._rows, height, self._columns, width, self._components)
+        tiles = tiles.transpose(0, 2, 1, 3, 4).reshape(-1, height, width, self._components)
+        # OpenGL stores the bottom row first
+        numpy.copyto(out, tiles[: self._count, ::-1])
+        return out
+
+    def release(self) -> None:
+        """Release the framebuffer and its attachments"""
+        self._fbo.release()
+        self._texture.release()
+        if self._depth is not None:
+            self._depth.release()
@@ -2,8 +2,11 @@ from pathlib import Path
 from typing import Any, Optional
 
 import moderngl
+import numpy
 
+from moderngl_window.capture.shared_memory import SharedFrameRing
 from moderngl_window.context.base import BaseWindow
+from moderngl_window.context.headless.batch import BatchFramebuffer
 from moderngl_window.context.headless.keys import Keys
 
 
@@ -11,19 +14,48 @@ class Window(BaseWindow):
     """Headless window.
 
     Do not currently support any form window events or key input.
+
+    By default :py:meth:`swap_buffers` waits for the GPU to finish the
+    frame. Passing ``buffers=2`` or ``buffers=3`` queues a copy of each
+    frame into a ring of pixel buffers instead, so the CPU can prepare
+    the next frame while the GPU is still working. :py:meth:`read_latest`
+    returns a frame that was submitted ``buffers - 1`` swaps earlier.
+    Reading it still waits if the GPU has not copied that frame yet.
+    The window always renders to the same framebuffer, so ``fbo`` can
+    be stored.
     """
 
     #: Name of the window
     name = "headless"
     keys = Keys
 
-    def __init__(self, **kwargs: Any):
+    def __init__(self, buffers: int = 1, **kwargs: Any):
+        """Create the headless window.
+
+        Args:
+            buffers (int): Number of framebuffers to render to in turn
+            **kwargs: Passed to the base window
+        """
         super().__init__(**kwargs)
         self._fbo: Optional[moderngl.Framebuffer] = None
+        self._buffer_count = max(buffers, 1)
+        # Pixel buffer receiving the next frame
+        self._pbo_index = 0
+        self._pbos: list[moderngl.Buffer] = []
+        # Frame number stored in each pixel buffer. 0 when empty
+        self._pbo_frames: list[int] = []
+        self._resolve_fbo: Optional[moderngl.Framebuffer] = None
+        self._latest: tuple[int, Optional[numpy.ndarray]] = (0, None)
         self._vsync = False  # We don't care about vsync in headless mode
         self._resizable = False  # headless window is not resizable
         self._cursor = False  # Headless don't have a cursor
         self._headless = True
+        self._stream: Optional[SharedFrameRing] = None
+        self._stream_slots = 4
+        self._stream_components = 3
+        self._stream_data: Optional[numpy.ndarray] = None
+        # Latest frame number written to the stream
+        self._stream_frames = 0
         self.init_mgl_context()
         self.set_default_viewport()
 
@@ -49,18 +81,186 @@ class Window(BaseWindow):
         self._create_fbo()
         self.use()
 
+    @property
+    def buffers(self) -> int:
+        """int: Number of frames in flight"""
+        return self._buffer_count
+
     def _create_fbo(self) -> None:
-        if self._fbo:
+        self._release_buffers()
+
+        self._fbo = self.ctx.framebuffer(
+            color_attachments=self.ctx.texture(self.size, 4, samples=self._samples),
+            depth_attachment=self.ctx.depth_texture(self.size, samples=self._samples),
+        )
+        self._pbo_index = 0
+
+        if self._buffer_count > 1:
+            self._pbos = [
+                self.ctx.buffer(reserve=self._width * self._height * 4)
+                for _ in range(self._buffer_count)
+            ]
+            self._pbo_frames = [0] * self._buffer_count
+        self._latest = (0, None)
+
+        if self._stream is not None:
+            # The frame size changed. Consumers have to attach to the new ring
+            name = self._stream.name
+            self.stop_streaming()
+            self.start_streaming(name, slots=self._stream_slots, components=self._stream_components)
+
+    def create_batch(
+        self, count: int, size: tuple[int, int], components: int = 3, **kwargs: Any
+    ) -> BatchFramebuffer:
+        """Create a framebuffer for rendering many small frames at once.
+
+        Args:
+            count (int): Number of slots
+            size (tuple): (width, height) of each slot
+            components (int): Number of components read back for each pixel
+            **kwargs: Passed to :py:class:`BatchFramebuffer`
+        Returns:
+            BatchFramebuffer: The framebuffer
+        """
+        return BatchFramebuffer(self.ctx, count, size, components=components, **kwargs)
+
+    def _release_buffers(self) -> None:
+        """Release the framebuffer and pixel buffers"""
+        if self._fbo is not None:
             for attachment in self._fbo.color_attachments:
                 attachment.release()
             if self._fbo.depth_attachment:
                 self._fbo.depth_attachment.release()
             self._fbo.release()
 
-        self._fbo = self.ctx.framebuffer(
-            color_attachments=self.ctx.texture(self.size, 4, samples=self._samples),
-            depth_attachment=self.ctx.depth_texture(self.size, samples=self._samples),
+        for pbo in self._pbos:
+            pbo.release()
+
+        if self._resolve_fbo is not None:
+            self._resolve_fbo.release()
+
+        self._pbos = []
+        self._pbo_frames = []
+        self._resolve_fbo = None
+        self._fbo = None
+
+    def _readable_fbo(self) -> moderngl.Framebuffer:
+        """The current framebuffer or a resolved copy of it when multisampled"""
+        assert self._fbo is not None
+        if self._samples == 0:
+            return self._fbo
+
+        # Multisampled framebuffers must be resolved before reading
+        if self._resolve_fbo is None:
+            self._resolve_fbo = self.ctx.simple_framebuffer(self.size, components=4)
+        self.ctx.copy_framebuffer(self._resolve_fbo, self._fbo)
+        return self._resolve_fbo
+
+    def read_latest(self, wait: bool = False) -> tuple[int, Optional[numpy.ndarray]]:
+        """Get the most recent frame the GPU has completed.
+
+        Only available with more than one buffer. A frame is treated as
+        completed ``buffers - 1`` swaps after it was submitted. Reading it
+        does not wait for the frames rendered after it, but it does wait
+        for the copy of the frame itself if the GPU is further behind.
+
+        Args:
+            wait (bool): Wait for the last swapped frame instead
+        Returns:
+            tuple: The frame number and a (height, width, 4) ``uint8`` array with
+            the first row at the top. ``(0, None)`` if no frame is completed yet
+        """
+        if self._buffer_count == 1:
+            raise RuntimeError("read_latest() requires a headless window with buffers > 1")
+
+        # The slot of the next frame holds the oldest frame
+        index = self._pbo_index
+        if wait:
+            index = (index - 1) % self._buffer_count
+
+        frame = self._pbo_frames[index]
+        if frame == 0 or frame == self._latest[0]:
+            return self._latest
+
+        data = numpy.frombuffer(self._pbos[index].read(), dtype=numpy.uint8)
+        # OpenGL stores the bottom row first
+        self._latest = frame, data.reshape(self._height, self._width, 4)[::-1]
+        return self._latest
+
+    @property
+    def stream(self) -> Optional[SharedFrameRing]:
+        """SharedFrameRing: The ring frames are streamed to or ``None`` when not streaming"""
+        return self._stream
+
+    def start_streaming(
+        self, name: Optional[str] = None, slots: int = 4, components: int = 3
+    ) -> SharedFrameRing:
+        """Stream every rendered frame to a ring buffer in shared memory.
+
+        The frame is written to the ring in :py:meth:`swap_buffers`.
+        Other processes attach to the ring by name and read the frames
+        as NumPy arrays without copying. Frames have the shape
+        (height, width, components) with the first row at the top.
+
+        Resizing the window creates a new ring with the same name.
+
+        Example::
+
+            # Renderer
+            ring = window.start_streaming("env_0", slots=4)
+
+            # Consumer in another process
+            ring = SharedFrameRing.attach("env_0")
+            sequence = ring.wait(0)
+            frame = ring.frame(sequence)
+
+        Args:
+            name (str): Name of the shared memory block. Generated if not set
+            slots (int): Number of frames in the ring
+            components (int): 3 for RGB or 4 for RGBA frames
+        Returns:
+            SharedFrameRing: The ring
+        """
+        if self._stream is not None:
+            raise RuntimeError("Already streaming to '{}'".format(self._stream.name))
+
+        if components not in (3, 4):
+            raise ValueError("components must be 3 or 4, not {}".format(components))
+
+        self._stream_slots = slots
+        self._stream_components = components
+        self._stream_data = numpy.empty((self._height, self._width, components), dtype=numpy.uint8)
+        self._stream_frames = 0
+        self._stream = SharedFrameRing.create(
+            (self._height, self._width, components), slots=slots, name=name
         )
+        return self._stream
+
+    def stop_streaming(self) -> None:
+        """Stop streaming frames and remove the shared memory ring"""
+        if self._stream is None:
+            return
+
+        self._stream.close()
+        self._stream.unlink()
+        self._stream = None
+        self._stream_data = None
+
+    def _stream_frame(self) -> None:
+        """Write the current frame or the latest completed frame to the stream"""
+        if self._stream is None or self._stream_data is None:
+            return
+
+        if self._buffer_count > 1:
+            frame, data = self.read_latest()
+            if data is not None and frame > self._stream_frames:
+                self._stream_frames = frame
+                self._stream.write(data[..., : self._stream_components])
+            return
+
+        self._readable_fbo().read_into(self._stream_data, components=self._stream_components)
+        # OpenGL stores the bottom row first
+        self._stream.write(self._stream_data[::-1])
 
     @property
     def size(self) -> tuple[int, int]:
@@ -113,12 +313,30 @@ class Window(BaseWindow):
 
     def swap_buffers(self) -> None:
         """
-        Placeholder. We currently don't do double buffering in headless mode.
-        This may change in the future.
+        Finish the current frame.
+
+        With a single buffer this waits for the GPU to complete the frame.
+        With several buffers a copy of the frame into the next pixel buffer
+        is queued without waiting.
+
+        The frame is written to the stream when streaming is started.
         """
-        # NOTE: No double buffering currently
         self._frames += 1
-        self._ctx.finish()
+        if self._buffer_count == 1:
+            if self._stream is not None:
+                self._stream_frame()
+            else:
+                self._ctx.finish()
+            return
+
+        # Queue the copy. The pixel buffer is read when the frame is completed
+        index = self._pbo_index
+        self._readable_fbo().read_into(self._pbos[index], components=4)
+        self._pbo_frames[index] = self._frames
+        self._pbo_index = (index + 1) % self._buffer_count
+
+        if self._stream is not None:
+            self._stream_frame()
 
     def _set_icon(self, icon_path: Path) -> None:
         """Do nothing when icon is set"""
@@ -133,4 +351,6 @@ class Window(BaseWindow):
 
     def destroy(self) -> None:
         """Destroy the context"""
+        self.stop_streaming()
+        self._release_buffers()
         self._ctx.release()
@@ -0,0 +1,140 @@
+import ctypes
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+import moderngl
+import numpy
+
+from moderngl_window.integrations.texture_registry import TextureRegistry
+
+#: A draw list as ``(vertex address, vertex count, index address, index count)``
+DrawList = tuple[int, int, int, int]
+#: A draw command as ``(texture id, clip rectangle, element count)``
+DrawCommand = tuple[int, tuple[float, float, float, float], int]
+
+
+def capacity(size: int) -> int:
+    """Round a buffer size up to the next power of two to limit reallocations"""
+    return 1 << max(size - 1, 0).bit_length()
+
+
+class DrawListMixin:
+    """Uploads and draws imgui draw lists for the imgui renderers.
+
+    The vertices and indices of all draw lists are gathered into one
+    vertex and one index buffer each frame. The buffers are orphaned and
+    written once. Indices are offset by the base vertex of their draw list
+    so consecutive commands sharing the texture and clip rectangle are
+    drawn with a single draw call.
+
+    Nothing here depends on the imgui bindings. The renderers convert
+    their draw data to :py:data:`DrawList` and :py:data:`DrawCommand`
+    tuples and set up the attributes below.
+    """
+
+    ctx: moderngl.Context
+    _vertex_buffer: moderngl.Buffer
+    _index_buffer: moderngl.Buffer
+    _vao: moderngl.VertexArray
+    _textures: TextureRegistry
+    #: Size of a vertex in bytes
+    _vertex_size: int
+    #: The type of the indices in the draw lists
+    _index_dtype: Any
+    _vertex_data: bytearray
+    _index_data: numpy.ndarray
+
+    def _write_buffers(self, draw_lists: Sequence[DrawList]) -> None:
+        """Gather all draw lists and upload them with a single write per buffer"""
+        vertex_count = sum(draw_list[1] for draw_list in draw_lists)
+        index_count = sum(draw_list[3] for draw_list in draw_lists)
+        vertex_bytes = vertex_count * self._vertex_size
+        if vertex_bytes == 0 or index_count == 0:
+            return
+
+        if len(self._vertex_data) < vertex_bytes:
+            self._vertex_data = bytearray(capacity(vertex_bytes))
+        if len(self._index_data) < index_count:
+            self._index_data = numpy.empty(capacity(index_count), dtype=numpy.uint32)
+
+        index_size = numpy.dtype(self._index_dtype).itemsize
+        vertex_address = ctypes.addressof(ctypes.c_char.from_buffer(self._vertex_data))
+        vertex_offset = 0
+        index_offset = 0
+        for vertices, vertices_size, indices_address, indices_size in draw_lists:
+            ctypes.memmove(
+                vertex_address + vertex_offset * self._vertex_size,
+                vertices,
+                vertices_size * self._vertex_size,
+            )
+
+            # Read the indices without copying them and offset them by the base vertex
+            idx_type = ctypes.c_byte * (indices_size * index_size)
+            indices = numpy.frombuffer(
+                idx_type.from_address(indices_address), dtype=self._index_dtype
+            )
+            numpy.add(
+                indices,
+                vertex_offset,
+                out=self._index_data[index_offset : index_offset + len(indices)],
+                dtype=numpy.uint32,
+            )
+
+            vertex_offset += vertices_size
+            index_offset += len(indices)
+
+        # Orphan the buffers so the writes don't wait for the previous frame
+        if self._vertex_buffer.size < vertex_bytes:
+            self._vertex_buffer.orphan(capacity(vertex_bytes))
+        else:
+            self._vertex_buffer.orphan()
+        if self._index_buffer.size < index_count * 4:
+            self._index_buffer.orphan(capacity(index_count * 4))
+        else:
+            self._index_buffer.orphan()
+
+        self._vertex_buffer.write(memoryview(self._vertex_data)[:vertex_bytes])
+        self._index_buffer.write(self._index_data[:index_count])
+
+    def _draw_commands(
+        self, command_lists: Iterable[Iterable[DrawCommand]], fb_height: int
+    ) -> None:
+        """Draw the commands of all draw lists merging consecutive commands into batches"""
+        bound_texture: Optional[int] = None
+        scissor: Optional[tuple[float, float, float, float]] = None
+        batch: Optional[list[Any]] = None
+        first = 0
+        for commands in command_lists:
+            for texture_id, clip_rect, count in commands:
+                # Extend the batch while the texture and clip rect stay the same
+                if batch is not None and batch[0] == texture_id and batch[1] == clip_rect:
+                    batch[3] += count
+                else:
+                    if batch is not None:
+                        bound_texture, scissor = self._draw(
+                            batch, bound_texture, scissor, fb_height
+                        )
+                    batch = [texture_id, clip_rect, first, count]
+                first += count
+
+        if batch is not None:
+            self._draw(batch, bound_texture, scissor, fb_height)
+
+    def _draw(
+        self,
+        batch: list[Any],
+        bound_texture: Optional[int],
+        scissor: Optional[tuple[float, float, float, float]],
+        fb_height: int,
+    ) -> tuple[int, tuple[float, float, float, float]]:
+        """Draw a batch of commands skipping redundant texture and scissor changes"""
+        texture_id, clip_rect, first, count = batch
+        if texture_id != bound_texture:
+            self._textures.get(texture_id).use(0)
+
+        if clip_rect != scissor:
+            x, y, z, w = clip_rect
+            self.ctx.scissor = int(x), int(fb_height - w), int(z - x), int(w - y)
+
+        self._vao.render(moderngl.TRIANGLES, vertices=count, first=first)
+        return texture_id, clip_rect
@@ -1,10 +1,14 @@
-import ctypes
+import array
 
 import imgui
 import moderngl
+import numpy
 from imgui.integrations import compute_fb_scale
 from imgui.integrations.base import BaseOpenGLRenderer
 
+from moderngl_window.integrations.draw_lists import DrawListMixin
+from moderngl_window.integrations.texture_registry import TextureRegistry
+
 
 class ModernglWindowMixin:
     def resize(self, width: int, height: int):
@@ -76,7 +80,13 @@ class ModernglWindowMixin:
         io.add_input_character(ord(char))
 
 
-class ModernGLRenderer(BaseOpenGLRenderer):
+class ModernGLRenderer(DrawListMixin, BaseOpenGLRenderer):
+    """Renders imgui draw data with moderngl.
+
+    The draw lists are uploaded and batched by
+    :py:class:`~moderngl_window.integrations.draw_lists.DrawListMixin`.
+    """
+
     VERTEX_SHADER_SRC = """
         #version 330
         uniform mat4 ProjMtx;
@@ -109,13 +119,19 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         self._vertex_buffer = None
         self._index_buffer = None
         self._vao = None
-        self._textures = {}
+        self._textures = None
+        self._vertex_data = bytearray()
+        self._index_data = numpy.empty(0, dtype=numpy.uint32)
+        self._vertex_size = imgui.VERTEX_SIZE
+        self._index_dtype = numpy.uint16 if imgui.INDEX_SIZE == 2 else numpy.uint32
         self.wnd = kwargs.get("wnd")
         self.ctx = self.wnd.ctx if self.wnd and self.wnd.ctx else kwargs.get("ctx")
 
         if not self.ctx:
             raise ValueError("Missing moderngl context")
 
+        self._textures = TextureRegistry(self.ctx)
+
         super().__init__()
 
         if hasattr(self, "wnd") and self.wnd:
@@ -123,13 +139,25 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         elif "display_size" in kwargs:
             self.io.display_size = kwargs.get("display_size")
 
+    @property
+    def textures(self) -> TextureRegistry:
+        """TextureRegistry: The textures known by the renderer"""
+        return self._textures
+
     def register_texture(self, texture: moderngl.Texture):
-        """Make the imgui renderer aware of the texture"""
-        self._textures[texture.glo] = texture
+        """Make the imgui renderer aware of the texture.
+
+        This is optional. Any ``texture.glo`` can be passed to imgui and
+        unknown ids are bound directly.
+
+        Returns:
+            int: The id to pass to imgui
+        """
+        return self._textures.register(texture)
 
     def remove_texture(self, texture: moderngl.Texture):
         """Remove the texture from the imgui renderer"""
-        del self._textures[texture.glo]
+        self._textures.remove(texture)
 
     def refresh_font_texture(self):
         width, height, pixels = self.io.fonts.get_tex_data_as_rgba32()
@@ -151,12 +179,13 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         self.projMat = self._prog["ProjMtx"]
         self._prog["Texture"].value = 0
         self._vertex_buffer = self.ctx.buffer(reserve=imgui.VERTEX_SIZE * 65536)
-        self._index_buffer = self.ctx.buffer(reserve=imgui.INDEX_SIZE * 65536)
+        # Indices are offset by the base vertex of their command list and may exceed 16 bits
+        self._index_buffer = self.ctx.buffer(reserve=4 * 65536)
         self._vao = self.ctx.vertex_array(
             self._prog,
             [(self._vertex_buffer, "2f 2f 4f1", "Position", "UV", "Color")],
             index_buffer=self._index_buffer,
-            index_element_size=imgui.INDEX_SIZE,
+            index_element_size=4,
         )
 
     def render(self, draw_data):
@@ -193,35 +222,27 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         self.ctx.blend_equation = moderngl.FUNC_ADD
         self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
 
-        self._font_texture.use()
-
-        for commands in draw_data.commands_lists:
-            # Write the vertex and index buffer data without copying it
-            vtx_type = ctypes.c_byte * commands.vtx_buffer_size * imgui.VERTEX_SIZE
-            idx_type = ctypes.c_byte * commands.idx_buffer_size * imgui.INDEX_SIZE
-            vtx_arr = (vtx_type).from_address(commands.vtx_buffer_data)
-            idx_arr = (idx_type).from_address(commands.idx_buffer_data)
-            self._vertex_buffer.write(vtx_arr)
-            self._index_buffer.write(idx_arr)
-
-            idx_pos = 0
-            for command in commands.commands:
-                texture = self._textures.get(command.texture_id)
-                if texture is None:
-                    raise ValueError(
-                        (
-                            "Texture {} is not registered. Please add to renderer using "
-                            "register_texture(..). "
-                            "Current textures: {}".format(command.texture_id, list(self._textures))
-                        )
-                    )
-
-                texture.use(0)
-
-                x, y, z, w = command.clip_rect
-                self.ctx.scissor = int(x), int(fb_height - w), int(z - x), int(w - y)
-                self._vao.render(moderngl.TRIANGLES, vertices=command.elem_count, first=idx_pos)
-                idx_pos += command.elem_count
+        self._write_buffers(
+            [
+                (
+                    commands.vtx_buffer_data,
+                    commands.vtx_buffer_size,
+                    commands.idx_buffer_data,
+                    commands.idx_buffer_size,
+                )
+                for commands in draw_data.commands_lists
+            ]
+        )
+        self._draw_commands(
+            (
+                (
+                    (command.texture_id, tuple(command.clip_rect), command.elem_count)
+                    for command in commands.commands
+                )
+                for commands in draw_data.commands_lists
+            ),
+            fb_height,
+        )
 
         self.ctx.scissor = None
 
@@ -236,6 +257,8 @@ class ModernGLRenderer(BaseOpenGLRenderer):
             self._vao.release()
         if self._prog:
             self._prog.release()
+        if self._textures is not None:
+            self._textures.clear()
 
         self.io.fonts.texture_id = 0
         self._font_texture = None
@@ -278,3 +301,48 @@ class ModernglWindowRenderer(ModernGLRenderer, ModernglWindowMixin):
 
         for value in self.REVERSE_KEY_MAP.values():
             self.io.key_map[value] = value
+
+
+def draw_profiler(profiler, title="Profiler", frames=120):
+    """Draw a window with the frame times and scopes of a profiler.
+    Must be called between ``imgui.new_frame()`` and ``imgui.render()``.
+
+    Args:
+        profiler (moderngl_window.profiler.Profiler): The profiler
+        title (str): Title of the window
+        frames (int): Number of frames in the frame time graph
+    """
+    expanded, _ = imgui.begin(title)
+    if not expanded:
+        imgui.end()
+        return
+
+    recent = [frame for frame in profiler.frames if frame.gpu_ready][-frames:]
+    cpu_times = array.array("f", [frame.cpu / 1e6 for frame in recent])
+    gpu_times = array.array("f", [frame.gpu / 1e6 for frame in recent])
+    if recent:
+        imgui.plot_lines(
+            "CPU", cpu_times, overlay_text="{:.2f} ms".format(cpu_times[-1]), scale_min=0.0
+        )
+        imgui.plot_lines(
+            "GPU", gpu_times, overlay_text="{:.2f} ms".format(gpu_times[-1]), scale_min=0.0
+        )
+
+    imgui.columns(4, "scopes")
+    for label in ("Scope", "Calls", "CPU ms", "GPU ms"):
+        imgui.text(label)
+        imgui.next_column()
+    imgui.separator()
+
+    for name, times in profiler.summary().items():
+        imgui.text(name)
+        imgui.next_column()
+        imgui.text("{:.1f}".format(times["calls"]))
+        imgui.next_column()
+        imgui.text("{:.3f}".format(times["cpu"]))
+        imgui.next_column()
+        imgui.text("{:.3f}".format(times["gpu"]))
+        imgui.next_column()
+
+    imgui.columns(1)
+    imgui.end()
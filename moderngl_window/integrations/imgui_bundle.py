@@ -1,9 +1,11 @@
-import ctypes
-
 import moderngl
+import numpy
 from imgui_bundle import imgui
 from imgui_bundle.python_backends import compute_fb_scale
 
+from moderngl_window.integrations.draw_lists import DrawListMixin
+from moderngl_window.integrations.texture_registry import TextureRegistry
+
 
 class ModernglWindowMixin:
     io: imgui.IO
@@ -106,7 +108,13 @@ class BaseOpenGLRenderer(object):
         self._invalidate_device_objects()
 
 
-class ModernGLRenderer(BaseOpenGLRenderer):
+class ModernGLRenderer(DrawListMixin, BaseOpenGLRenderer):
+    """Renders imgui draw data with moderngl.
+
+    The draw lists are uploaded and batched by
+    :py:class:`~moderngl_window.integrations.draw_lists.DrawListMixin`.
+    """
+
     VERTEX_SHADER_SRC = """
         #version 330
         uniform mat4 ProjMtx;
@@ -139,7 +147,11 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         self._vertex_buffer = None
         self._index_buffer = None
         self._vao = None
-        self._textures = {}
+        self._textures = None
+        self._vertex_data = bytearray()
+        self._index_data = numpy.empty(0, dtype=numpy.uint32)
+        self._vertex_size = imgui.VERTEX_SIZE
+        self._index_dtype = numpy.uint16 if imgui.INDEX_SIZE == 2 else numpy.uint32
         self.wnd = kwargs.get("wnd")
         self.ctx: moderngl.Context = (
             self.wnd.ctx if self.wnd and self.wnd.ctx else kwargs.get("ctx")
@@ -148,6 +160,8 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         if not self.ctx:
             raise RuntimeError("Missing moderngl context")
 
+        self._textures = TextureRegistry(self.ctx)
+
         super().__init__()
 
         if hasattr(self, "wnd") and self.wnd:
@@ -155,13 +169,25 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         elif "display_size" in kwargs:
             self.io.display_size = kwargs.get("display_size")
 
+    @property
+    def textures(self) -> TextureRegistry:
+        """TextureRegistry: The textures known by the renderer"""
+        return self._textures
+
     def register_texture(self, texture: moderngl.Texture):
-        """Make the imgui renderer aware of the texture"""
-        self._textures[texture.glo] = texture
+        """Make the imgui renderer aware of the texture.
+
+        This is optional. Any ``texture.glo`` can be passed to imgui and
+        unknown ids are bound directly.
+
+        Returns:
+            int: The id to pass to imgui
+        """
+        return self._textures.register(texture)
 
     def remove_texture(self, texture: moderngl.Texture):
         """Remove the texture from the imgui renderer"""
-        del self._textures[texture.glo]
+        self._textures.remove(texture)
 
     def refresh_font_texture(self):
         font_matrix = self.io.fonts.get_tex_data_as_rgba32()
@@ -186,12 +212,13 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         self.projMat = self._prog["ProjMtx"]
         self._prog["Texture"].value = 0
         self._vertex_buffer = self.ctx.buffer(reserve=imgui.VERTEX_SIZE * 65536)
-        self._index_buffer = self.ctx.buffer(reserve=imgui.INDEX_SIZE * 65536)
+        # Indices are offset by the base vertex of their command list and may exceed 16 bits
+        self._index_buffer = self.ctx.buffer(reserve=4 * 65536)
         self._vao = self.ctx.vertex_array(
             self._prog,
             [(self._vertex_buffer, "2f 2f 4f1", "Position", "UV", "Color")],
             index_buffer=self._index_buffer,
-            index_element_size=imgui.INDEX_SIZE,
+            index_element_size=4,
         )
 
     def render(self, draw_data: imgui.ImDrawData):
@@ -228,35 +255,27 @@ class ModernGLRenderer(BaseOpenGLRenderer):
         self.ctx.blend_equation = moderngl.FUNC_ADD
         self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
 
-        self._font_texture.use()
-
-        for commands in draw_data.cmd_lists:
-            # Write the vertex and index buffer data without copying it
-            vtx_type = ctypes.c_byte * commands.vtx_buffer.size() * imgui.VERTEX_SIZE
-            idx_type = ctypes.c_byte * commands.idx_buffer.size() * imgui.INDEX_SIZE
-            vtx_arr = (vtx_type).from_address(commands.vtx_buffer.data_address())
-            idx_arr = (idx_type).from_address(commands.idx_buffer.data_address())
-            self._vertex_buffer.write(vtx_arr)
-            self._index_buffer.write(idx_arr)
-
-            idx_pos = 0
-            for command in commands.cmd_buffer:
-                texture = self._textures.get(command.texture_id)
-                if texture is None:
-                    raise ValueError(
-                        (
-                            "Texture {} is not registered. Please add to renderer using "
-                            "register_texture(..). "
-                            "Current textures: {}".format(command.texture_id, list(self._textures))
-                        )
-                    )
-
-                texture.use(0)
-
-                x, y, z, w = command.clip_rect
-                self.ctx.scissor = int(x), int(fb_height - w), int(z - x), int(w - y)
-                self._vao.render(moderngl.TRIANGLES, vertices=command.elem_count, first=idx_pos)
-                idx_pos += command.elem_count
+        self._write_buffers(
+            [
+                (
+                    commands.vtx_buffer.data_address(),
+                    commands.vtx_buffer.size(),
+                    commands.idx_buffer.data_address(),
+                    commands.idx_buffer.size(),
+                )
+                for commands in draw_data.cmd_lists
+            ]
+        )
+        self._draw_commands(
+            (
+                (
+                    (command.texture_id, tuple(command.clip_rect), command.elem_count)
+                    for command in commands.cmd_buffer
+                )
+                for commands in draw_data.cmd_lists
+            ),
+            fb_height,
+        )
 
         self.ctx.scissor = None
 
@@ -271,6 +290,8 @@ class ModernGLRenderer(BaseOpenGLRenderer):
             self._vao.release()
         if self._prog:
             self._prog.release()
+        if self._textures is not None:
+            self._textures.clear()
 
         self.io.fonts.tex_id = 0
         self._font_texture = None
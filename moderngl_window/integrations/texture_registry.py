@@ -0,0 +1,100 @@
+import weakref
+from typing import Union
+
+import moderngl
+
+
+class TextureRegistry:
+    """Textures drawn by the imgui renderers keyed by their OpenGL object id.
+
+    imgui only knows the id of a texture. Registered textures are held by
+    weak references so they are dropped when garbage collected, and entries
+    of released textures are dropped when looked up. Ids that are not
+    registered are wrapped in an external texture on first use, so any
+    texture can be passed to imgui with ``texture.glo`` without registering
+    it and without ever failing during rendering.
+
+    Example::
+
+        registry = TextureRegistry(ctx)
+        imgui.image(registry.register(texture), 128, 128)
+    """
+
+    def __init__(self, ctx: moderngl.Context):
+        """Create the registry.
+
+        Args:
+            ctx (moderngl.Context): The context
+        """
+        self.ctx = ctx
+        self._textures: weakref.WeakValueDictionary[int, moderngl.Texture] = (
+            weakref.WeakValueDictionary()
+        )
+        # Wrappers for ids of textures that were not registered
+        self._external: dict[int, moderngl.Texture] = {}
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    def __contains__(self, texture_id: int) -> bool:
+        texture = self._textures.get(texture_id)
+        return texture is not None and not self._released(texture)
+
+    def register(self, texture: moderngl.Texture) -> int:
+        """Register a texture.
+
+        Args:
+            texture (moderngl.Texture): The texture
+        Returns:
+            int: The id to pass to imgui
+        """
+        self._textures[texture.glo] = texture
+        external = self._external.pop(texture.glo, None)
+        if external is not None:
+            external.release()
+        return texture.glo
+
+    def remove(self, texture: Union[moderngl.Texture, int]) -> None:
+        """Remove a texture. Does nothing if the texture is not registered.
+
+        Args:
+            texture: The texture or its id
+        """
+        texture_id = texture if isinstance(texture, int) else texture.glo
+        self._textures.pop(texture_id, None)
+        external = self._external.pop(texture_id, None)
+        if external is not None:
+            external.release()
+
+    def get(self, texture_id: int) -> moderngl.Texture:
+        """Get the texture for an id used in imgui.
+
+        Args:
+            texture_id (int): The OpenGL object id
+        Returns:
+            moderngl.Texture: The registered texture or a wrapper binding the id
+        """
+        texture = self._textures.get(texture_id)
+        if texture is not None:
+            if not self._released(texture):
+                return texture
+            # The id may already belong to a new texture
+            del self._textures[texture_id]
+
+        texture = self._external.get(texture_id)
+        if texture is None:
+            # Binding only needs the id. The size and format are not used
+            texture = self.ctx.external_texture(texture_id, (1, 1), 4, 0, "f1")
+            self._external[texture_id] = texture
+        return texture
+
+    def clear(self) -> None:
+        """Remove all textures"""
+        self._textures.clear()
+        for texture in self._external.values():
+            texture.release()
+        self._external = {}
+
+    def _released(self, texture: moderngl.Texture) -> bool:
+        """Has the texture been released?"""
+        return isinstance(texture.mglo, moderngl.InvalidObject)
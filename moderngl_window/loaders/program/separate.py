@@ -4,9 +4,12 @@ from typing import Optional, Union
 
 import moderngl
 
+from moderngl_window import reloader
 from moderngl_window.exceptions import ImproperlyConfigured
 from moderngl_window.loaders.base import BaseLoader
+from moderngl_window.meta.base import ResourceDescription
 from moderngl_window.opengl import program
+from moderngl_window.opengl.includes import include_cache
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,11 @@ class Loader(BaseLoader):
     kind = "separate"
     meta: program.ProgramDescription
 
+    def __init__(self, meta: ResourceDescription):
+        super().__init__(meta)
+        # The resolved paths of the loaded shaders by stage
+        self._paths: dict[str, Path] = {}
+
     def load(
         self,
     ) -> Union[moderngl.Program, moderngl.ComputeShader, program.ReloadableProgram]:
@@ -27,33 +35,15 @@ class Loader(BaseLoader):
         """
         prog: Union[moderngl.Program, moderngl.ComputeShader, program.ReloadableProgram]
 
-        vs_source = self._load_shader("vertex", self.meta.vertex_shader)
-        geo_source = self._load_shader("geometry", self.meta.geometry_shader)
-        fs_source = self._load_shader("fragment", self.meta.fragment_shader)
-        tc_source = self._load_shader("tess_control", self.meta.tess_control_shader)
-        te_source = self._load_shader("tess_evaluation", self.meta.tess_evaluation_shader)
+        shaders = self._load_shaders()
         cs_source = self._load_shader("compute", self.meta.compute_shader)
 
-        if vs_source:
-            shaders = program.ProgramShaders.from_separate(
-                self.meta,
-                vs_source,
-                geometry_source=geo_source,
-                fragment_source=fs_source,
-                tess_control_source=tc_source,
-                tess_evaluation_source=te_source,
-            )
-            shaders.handle_includes(self._load_source)
-            prog = shaders.create()
-
-            # Wrap the program if reloadable is set
-            if self.meta.reloadable:
-                # Disable reload flag so reloads will return Program instances
-                self.meta.reloadable = False
-                # Wrap it ..
-                prog = program.ReloadableProgram(self.meta, prog)
+        if shaders is not None:
+            prog = self.create(shaders)
         elif cs_source:
-            shaders = program.ProgramShaders.compute_shader(self.meta, cs_source)
+            shaders = program.ProgramShaders.compute_shader(
+                self.meta, cs_source, path=self._paths.get("compute")
+            )
             shaders.handle_includes(self._load_source)
             prog = shaders.create_compute_shader()
         else:
@@ -61,6 +51,61 @@ class Loader(BaseLoader):
 
         return prog
 
+    def create(
+        self, shaders: program.ProgramShaders
+    ) -> Union[moderngl.Program, program.ReloadableProgram]:
+        """Create the program from shader sources loaded by :py:meth:`load_shaders`.
+
+        Args:
+            shaders (ProgramShaders): The shader sources
+        Returns:
+            moderngl.Program: The Program instance
+        """
+        prog: Union[moderngl.Program, program.ReloadableProgram]
+        prog = shaders.create()
+
+        # Wrap the program if reloadable is set
+        if self.meta.reloadable:
+            # Disable reload flag so reloads will return Program instances
+            self.meta.reloadable = False
+            # Wrap it ..
+            prog = program.ReloadableProgram(self.meta, prog)
+            if reloader.current is not None:
+                reloader.current.track_program(prog)
+
+        return prog
+
+    def load_shaders(self) -> program.ProgramShaders:
+        """Load the shader sources and resolve includes without creating the program.
+
+        Returns:
+            ProgramShaders: The shader sources
+        """
+        shaders = self._load_shaders()
+        if shaders is None:
+            raise ImproperlyConfigured("Cannot find a vertex shader to load")
+        return shaders
+
+    def _load_shaders(self) -> Optional[program.ProgramShaders]:
+        """Load the shader sources if there is a vertex shader"""
+        vs_source = self._load_shader("vertex", self.meta.vertex_shader)
+        if not vs_source:
+            return None
+
+        shaders = program.ProgramShaders.from_separate(
+            self.meta,
+            vs_source,
+            geometry_source=self._load_shader("geometry", self.meta.geometry_shader),
+            fragment_source=self._load_shader("fragment", self.meta.fragment_shader),
+            tess_control_source=self._load_shader("tess_control", self.meta.tess_control_shader),
+            tess_evaluation_source=self._load_shader(
+                "tess_evaluation", self.meta.tess_evaluation_shader
+            ),
+            paths=self._paths,
+        )
+        shaders.handle_includes(self._load_source)
+        return shaders
+
     def _load_shader(self, shader_type: str, path: Optional[str]) -> Optional[str]:
         """Load a single shader source"""
         if path is not None:
@@ -70,8 +115,8 @@ class Loader(BaseLoader):
 
             logger.info("Loading: %s", resolved_path)
 
-            with open(str(resolved_path), "r") as fd:
-                return fd.read()
+            self._paths[shader_type] = resolved_path
+            return include_cache.read(resolved_path)
         return None
 
     def _load_source(self, path: Union[Path, str]) -> tuple[Path, str]:
@@ -88,5 +133,4 @@ class Loader(BaseLoader):
 
         logger.info("Loading: %s", path)
 
-        with open(str(resolved_path), "r") as fd:
-            return resolved_path, fd.read()
+        return resolved_path, include_cache.read(resolved_path)
@@ -4,9 +4,11 @@ from typing import Union
 
 import moderngl
 
+from moderngl_window import reloader
 from moderngl_window.exceptions import ImproperlyConfigured
 from moderngl_window.loaders.base import BaseLoader
 from moderngl_window.opengl import program
+from moderngl_window.opengl.includes import include_cache
 
 logger = logging.getLogger(__name__)
 
@@ -57,13 +59,19 @@ class Loader(BaseLoader):
         Returns:
             moderngl.Program: The Program instance
         """
-        prog: Union[moderngl.Program, program.ReloadableProgram]
-        assert self.meta.path is not None, "There is no path for the resource"
-        assert self.meta.path is not None, "There is no path for the resource"
+        return self.create(self.load_shaders())
 
-        self.meta.resolved_path, source = self._load_source(self.meta.path)
-        shaders = program.ProgramShaders.from_single(self.meta, source)
-        shaders.handle_includes(self._load_source)
+    def create(
+        self, shaders: program.ProgramShaders
+    ) -> Union[moderngl.Program, program.ReloadableProgram]:
+        """Create the program from shader sources loaded by :py:meth:`load_shaders`.
+
+        Args:
+            shaders (ProgramShaders): The shader sources
+        Returns:
+            moderngl.Program: The Program instance
+        """
+        prog: Union[moderngl.Program, program.ReloadableProgram]
         prog = shaders.create()
 
         # Wrap the program if reloadable is set
@@ -72,9 +80,24 @@ class Loader(BaseLoader):
             self.meta.reloadable = False
             # Wrap it ..
             prog = program.ReloadableProgram(self.meta, prog)
+            if reloader.current is not None:
+                reloader.current.track_program(prog)
 
         return prog
 
+    def load_shaders(self) -> program.ProgramShaders:
+        """Load the shader sources and resolve includes without creating the program.
+
+        Returns:
+            ProgramShaders: The shader sources
+        """
+        assert self.meta.path is not None, "There is no path for the resource"
+
+        self.meta.resolved_path, source = self._load_source(self.meta.path)
+        shaders = program.ProgramShaders.from_single(self.meta, source)
+        shaders.handle_includes(self._load_source)
+        return shaders
+
     def _load_source(self, path: Union[Path, str]) -> tuple[Path, str]:
         """Finds and loads a single source file.
 
@@ -89,5 +112,4 @@ class Loader(BaseLoader):
 
         logger.info("Loading: %s", path)
 
-        with open(str(resolved_path), "r") as fd:
-            return resolved_path, fd.read()
+        return resolved_path, include_cache.read(resolved_path)
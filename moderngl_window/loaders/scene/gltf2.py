@@ -67,6 +67,9 @@ ACCESSOR_TYPE = {
     "VEC4": 4,
 }
 
+# Draw modes that can be merged by concatenating indices
+MERGEABLE_MODES = (moderngl.POINTS, moderngl.LINES, moderngl.TRIANGLES)
+
 
 class Loader(BaseLoader):
     """Loader for GLTF 2.0 files"""
@@ -139,6 +142,9 @@ class Loader(BaseLoader):
         self.load_meshes()
         self.load_nodes()
 
+        if self.meta.merge_meshes:
+            self.merge_meshes()
+
         self.scene.calc_scene_bbox()
         self.scene.prepare()
 
@@ -296,6 +302,165 @@ class Loader(BaseLoader):
 
         return node
 
+    def merge_meshes(self) -> None:
+        """Static batching pass merging meshes into fewer draw calls.
+
+        Meshes sharing material, draw mode and attribute layout are
+        pre-transformed into world space using the global node matrix
+        and merged into a single mesh in a new root node. Only point,
+        line and triangle lists with float positions are merged.
+        """
+        for root in self.scene.root_nodes:
+            root.calc_model_mat(glm.mat4())
+
+        groups: dict[tuple[Any, ...], list[tuple[Node, Mesh]]] = {}
+        references: dict[int, int] = {}
+        stack = list(self.scene.root_nodes)
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children)
+            mesh = node.mesh
+            if mesh is None or mesh.vao is None:
+                continue
+
+            references[id(mesh)] = references.get(id(mesh), 0) + 1
+            if mesh.vao.mode not in MERGEABLE_MODES:
+                continue
+
+            layout = tuple(
+                sorted(
+                    (name, attrib_format.format)
+                    for buffer_info in mesh.vao.buffers
+                    for attrib_format, name in zip(
+                        buffer_info.attrib_formats, buffer_info.attributes
+                    )
+                )
+            )
+            position = dict(layout).get(mesh.attributes.get("POSITION", {}).get("name"))
+            if position is None or position.lstrip("0123456789") not in ("f", "f4"):
+                continue
+
+            key = (id(mesh.material), mesh.vao.mode, layout)
+            groups.setdefault(key, []).append((node, mesh))
+
+        merged_meshes = 0
+        for entries in groups.values():
+            if len(entries) < 2:
+                continue
+
+            mesh = merge_meshes(entries)
+            node = Node(name=mesh.name, mesh=mesh)
+            self.scene.root_nodes.append(node)
+            self.scene.nodes.append(node)
+            self.scene.meshes.append(mesh)
+            merged_meshes += len(entries)
+
+            for entry_node, entry_mesh in entries:
+                entry_node.mesh = None
+                references[id(entry_mesh)] -= 1
+                # Release the original geometry when no other node is using it
+                if references[id(entry_mesh)] == 0:
+                    assert entry_mesh.vao is not None
+                    entry_mesh.vao.release()
+                    self.scene.meshes.remove(entry_mesh)
+
+        if merged_meshes:
+            logger.info("Merged %s meshes into %s", merged_meshes, len(self.scene.meshes))
+
+
+def read_vertex_attributes(vao: VAO) -> dict[str, tuple[str, npt.NDArray[numpy.uint8]]]:
+    """Read back the per vertex data for each attribute in a VAO.
+
+    Args:
+        vao (VAO): The vao to read
+    Returns:
+        dict: attribute name -> (format, raw bytes per vertex)
+    """
+    result = {}
+    for buffer_info in vao.buffers:
+        data = numpy.frombuffer(buffer_info.buffer.read(), dtype="u1").reshape(
+            buffer_info.vertices, buffer_info.vertex_size
+        )
+        offset = 0
+        for attrib_format, name in zip(buffer_info.attrib_formats, buffer_info.attributes):
+            end = offset + attrib_format.bytes_total
+            result[name] = (attrib_format.format, data[:, offset:end])
+            offset = end
+
+    return result
+
+
+def merge_meshes(entries: list[tuple[Node, Mesh]]) -> Mesh:
+    """Merge meshes with identical material and layout into one mesh in world space.
+
+    Args:
+        entries: list of (node, mesh) with calculated global matrices
+    Returns:
+        Mesh: The merged mesh
+    """
+    first = entries[0][1]
+    assert first.vao is not None
+    # Attribute name in the shader -> gltf attribute type (POSITION, NORMAL ..)
+    attr_types = {info["name"]: attr_type for attr_type, info in first.attributes.items()}
+
+    columns: dict[str, list[npt.NDArray[Any]]] = {}
+    formats: dict[str, str] = {}
+    indices: list[npt.NDArray[numpy.uint32]] = []
+    base_vertex = 0
+
+    for node, mesh in entries:
+        assert mesh.vao is not None
+        matrix = numpy.array(
+            (node.matrix_global or glm.mat4()).to_list(), dtype="f4"
+        ).T  # row major
+        rotation = matrix[:3, :3]
+        determinant = numpy.linalg.det(rotation)
+        normal_matrix = numpy.linalg.inv(rotation).T if determinant != 0 else rotation
+
+        vertices = 0
+        for name, (fmt, data) in read_vertex_attributes(mesh.vao).items():
+            vertices = len(data)
+            formats[name] = fmt
+            attr_type = attr_types.get(name)
+            if attr_type in ("POSITION", "NORMAL", "TANGENT"):
+                values = numpy.ascontiguousarray(data).view("f4").copy()
+                if attr_type == "POSITION":
+                    values[:, :3] = values[:, :3] @ rotation.T + matrix[:3, 3]
+                else:
+                    matrix3 = normal_matrix if attr_type == "NORMAL" else rotation
+                    xyz = values[:, :3] @ matrix3.T
+                    lengths = numpy.linalg.norm(xyz, axis=1)[:, None]
+                    values[:, :3] = xyz / numpy.where(lengths > 0, lengths, 1.0)
+                    if attr_type == "TANGENT" and values.shape[1] == 4 and determinant < 0:
+                        values[:, 3] *= -1.0
+                data = values.view("u1")
+            columns.setdefault(name, []).append(data)
+
+        mesh_indices = mesh.vao.read_indices()
+        if mesh_indices is None:
+            mesh_indices = numpy.arange(vertices, dtype="u4")
+        # Mirroring transforms flip the triangle winding
+        if determinant < 0 and mesh.vao.mode == moderngl.TRIANGLES:
+            mesh_indices = mesh_indices.reshape(-1, 3)[:, ::-1].reshape(-1)
+        indices.append(mesh_indices + base_vertex)
+        base_vertex += vertices
+
+    name = first.material.name if first.material else first.name
+    vao = VAO(name, mode=first.vao.mode)
+    for attr_name, data_list in columns.items():
+        vao.buffer(numpy.concatenate(data_list).tobytes(), formats[attr_name], attr_name)
+    vao.index_buffer(numpy.concatenate(indices).astype("u4"), index_element_size=4)
+
+    positions = numpy.concatenate(columns[first.attributes["POSITION"]["name"]]).view("f4")
+    return Mesh(
+        name,
+        vao=vao,
+        material=first.material,
+        attributes={key: dict(value) for key, value in first.attributes.items()},
+        bbox_min=glm.vec3(*positions[:, :3].min(axis=0)),
+        bbox_max=glm.vec3(*positions[:, :3].max(axis=0)),
+    )
+
 
 class GLTFMeta:
     """Container for gltf metadata"""
@@ -28,6 +28,12 @@ class SceneDescription(ResourceDescription):
     A ``cache`` option is also available as some scene loaders
     supports converting the file into a different format
     on the fly to speed up loading.
+
+    The ``merge_meshes`` option enables a static batching pass in
+    loaders supporting it (currently GLTF 2). Meshes sharing material,
+    draw mode and attribute layout are pre-transformed into world space
+    and merged into a single mesh, greatly reducing the number of
+    draw calls for files with many small primitives.
     """
 
     default_kind = ""
@@ -39,6 +45,7 @@ class SceneDescription(ResourceDescription):
         kind: Optional[str] = None,
         cache: bool = False,
         attr_names: type[AttributeNames] = AttributeNames,
+        merge_meshes: bool = False,
         **kwargs: Any,
     ):
         """Create a scene description.
@@ -48,12 +55,21 @@ class SceneDescription(ResourceDescription):
             kind (str): Loader kind
             cache (str): Use the loader caching system if present
             attr_names (AttributeNames): Attrib name config
+            merge_meshes (bool): Merge static meshes sharing material and layout
             **kwargs: Optional custom attributes
         """
         if attr_names is None:
             attr_names = AttributeNames
 
-        kwargs.update({"path": path, "kind": kind, "cache": cache, "attr_names": attr_names})
+        kwargs.update(
+            {
+                "path": path,
+                "kind": kind,
+                "cache": cache,
+                "attr_names": attr_names,
+                "merge_meshes": merge_meshes,
+            }
+        )
         super().__init__(**kwargs)
 
     @property
@@ -65,3 +81,8 @@ class SceneDescription(ResourceDescription):
     def attr_names(self) -> AttributeNames:
         """AttributeNames: Attribute name config"""
         return self._kwargs["attr_names"]
+
+    @property
+    def merge_meshes(self) -> bool:
+        """bool: Merge static meshes sharing material and attribute layout"""
+        return bool(self._kwargs.get("merge_meshes"))
@@ -0,0 +1,279 @@
+"""
+Cache of shader sources referenced by ``#include`` preprocessors
+"""
+
+import os
+import re
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Optional, Union
+
+#: Directive kinds found by :py:func:`find_directives`
+INCLUDE = "include"
+ONCE = "once"
+IF = "if"
+ENDIF = "endif"
+
+_INCLUDE = re.compile(r'#include\s+"?([^"]+)')
+_DIRECTIVE = re.compile(r"#\s*(\w+)\s*(\w*)")
+_IF = {"if", "ifdef", "ifndef"}
+
+Directive = tuple[int, str, Optional[str]]
+
+
+def find_directives(lines: list[str]) -> list[Directive]:
+    """Find the preprocessors relevant for resolving includes.
+
+    Args:
+        lines (list[str]): The source lines
+    Returns:
+        list: ``(line number, kind, value)`` tuples. The value is the path of includes
+    """
+    directives: list[Directive] = []
+    for nr, line in enumerate(lines):
+        line = line.strip()
+        if not line.startswith("#"):
+            continue
+
+        if line.startswith("#include"):
+            match = _INCLUDE.search(line)
+            if match is None:
+                raise ValueError(f"Could not match '#include\\s+\"?([^\"]+)' in line {line}")
+            directives.append((nr, INCLUDE, match[1]))
+            continue
+
+        match = _DIRECTIVE.match(line)
+        if match is None:
+            continue
+        name = match[1]
+        if name in _IF:
+            directives.append((nr, IF, None))
+        elif name == "endif":
+            directives.append((nr, ENDIF, None))
+        elif name == "pragma" and match[2] == "once":
+            directives.append((nr, ONCE, None))
+
+    return directives
+
+
+def find_guard(lines: list[str]) -> Optional[str]:
+    """Find the include guard wrapping the entire source.
+
+    A guard is an ``#ifndef NAME`` and ``#define NAME`` pair starting the
+    source with the matching ``#endif`` ending it. Blank lines and ``//``
+    comments are ignored.
+
+    Args:
+        lines (list[str]): The source lines
+    Returns:
+        str: The name of the guard macro or None
+    """
+    significant = [
+        line.strip() for line in lines if line.strip() and not line.strip().startswith("//")
+    ]
+    if len(significant) < 3:
+        return None
+
+    start = re.match(r"#\s*ifndef\s+(\w+)$", significant[0])
+    if start is None or re.match(rf"#\s*define\s+{start[1]}\b", significant[1]) is None:
+        return None
+
+    depth = 0
+    for nr, line in enumerate(significant):
+        match = _DIRECTIVE.match(line)
+        if match is None:
+            continue
+        if match[1] in _IF:
+            depth += 1
+        elif match[1] == "endif":
+            depth -= 1
+            if depth == 0:
+                return start[1] if nr == len(significant) - 1 else None
+
+    return None
+
+
+class SourceFile:
+    """A shader source file with its parsed preprocessors"""
+
+    __slots__ = ("path", "source", "mtime", "_directives", "_guard", "_once")
+
+    def __init__(self, path: Hashable, source: str, mtime: Optional[tuple[int, int]] = None):
+        """Create a source file.
+
+        Args:
+            path: The resolved path
+            source (str): The source
+            mtime (tuple): Modification time and size of the file when it was read
+        """
+        self.path = path
+        self.source = source
+        self.mtime = mtime
+        self._directives: Optional[list[Directive]] = None
+        self._guard: Optional[str] = None
+        self._once = False
+
+    @property
+    def directives(self) -> list[Directive]:
+        """list: Include, ``#pragma once`` and conditional preprocessors in the source"""
+        return self._parse()
+
+    @property
+    def guard(self) -> Optional[str]:
+        """str: The include guard macro of the source if it has one"""
+        self._parse()
+        return self._guard
+
+    @property
+    def once(self) -> bool:
+        """bool: Does the source contain ``#pragma once``?"""
+        self._parse()
+        return self._once
+
+    def _parse(self) -> list[Directive]:
+        """Parse the preprocessors on first use"""
+        if self._directives is None:
+            lines = self.source.split("\n")
+            self._directives = find_directives(lines)
+            self._guard = find_guard(lines)
+            self._once = any(kind == ONCE for _, kind, _ in self._directives)
+        return self._directives
+
+    def __repr__(self) -> str:
+        return f"<SourceFile: {self.path}>"
+
+
+class IncludeCache:
+    """Shader sources read from disk and the include graph between them.
+
+    Files are only read again when their modification time or size
+    changed and the preprocessors of a source are only parsed once.
+    Resolving includes records which files include which, so the
+    sources affected by a changed file can be found.
+
+    Example::
+
+        source = include_cache.read(path)
+        # Every file including the changed one directly or indirectly
+        affected = include_cache.dependents(path)
+    """
+
+    def __init__(self) -> None:
+        self._files: dict[Hashable, SourceFile] = {}
+        self._includes: dict[Hashable, set[Hashable]] = {}
+        self._included_by: dict[Hashable, set[Hashable]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """int: Number of reads served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """int: Number of files read from disk"""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, path: Hashable) -> bool:
+        return path in self._files
+
+    def read(self, path: Union[str, Path]) -> str:
+        """Read a file unless the cached source is still current.
+
+        Args:
+            path: The resolved path
+        Returns:
+            str: The source
+        """
+        stat = os.stat(path)
+        mtime = (stat.st_mtime_ns, stat.st_size)
+        entry = self._files.get(path)
+        if entry is not None and entry.mtime == mtime:
+            self._hits += 1
+            return entry.source
+
+        self._misses += 1
+        with open(str(path), "r") as fd:
+            source = fd.read()
+        self._files[path] = SourceFile(path, source, mtime)
+        return source
+
+    def parse(self, path: Hashable, source: str) -> SourceFile:
+        """Get the parsed source of a file.
+
+        Args:
+            path: The resolved path
+            source (str): The source of the file
+        Returns:
+            SourceFile: The parsed source. Parsed again if the source changed
+        """
+        entry = self._files.get(path)
+        if entry is None or (entry.source is not source and entry.source != source):
+            entry = self._files[path] = SourceFile(path, source)
+        return entry
+
+    def set_includes(self, path: Hashable, includes: set[Hashable]) -> None:
+        """Set the files directly included by a file.
+
+        Args:
+            path: The including file
+            includes (set): The included files
+        """
+        for include in self._includes.get(path, ()):
+            self._included_by[include].discard(path)
+        self._includes[path] = set(includes)
+        for include in includes:
+            self._included_by.setdefault(include, set()).add(path)
+
+    def dependencies(self, path: Hashable) -> set[Hashable]:
+        """Get all files a file includes directly or indirectly.
+
+        Args:
+            path: The file
+        """
+        return self._walk(path, self._includes)
+
+    def dependents(self, path: Hashable) -> set[Hashable]:
+        """Get all files including a file directly or indirectly.
+
+        Args:
+            path: The file
+        """
+        return self._walk(path, self._included_by)
+
+    def invalidate(self, path: Hashable) -> set[Hashable]:
+        """Drop a changed file from the cache.
+
+        Args:
+            path: The changed file
+        Returns:
+            set: The file and all files including it
+        """
+        self._files.pop(path, None)
+        return self.dependents(path) | {path}
+
+    def clear(self) -> None:
+        """Remove all files and the include graph"""
+        self._files.clear()
+        self._includes.clear()
+        self._included_by.clear()
+
+    def _walk(self, path: Hashable, edges: dict[Hashable, set[Hashable]]) -> set[Hashable]:
+        """Collect the nodes reachable from a path"""
+        found: set[Hashable] = set()
+        pending = list(edges.get(path, ()))
+        while pending:
+            node = pending.pop()
+            if node not in found:
+                found.add(node)
+                pending.extend(edges.get(node, ()))
+        found.discard(path)
+        return found
+
+
+#: The cache used by the program loaders
+include_cache = IncludeCache()
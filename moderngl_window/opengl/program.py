@@ -3,12 +3,22 @@ Helper classes for loading shader
 """
 
 import re
+import weakref
+from collections.abc import Hashable, Mapping
 from typing import Any, Callable, Optional, Union
 
 import moderngl
 
 import moderngl_window
 from moderngl_window.meta import ProgramDescription as ProgramDescription
+from moderngl_window.opengl.includes import (
+    ENDIF,
+    IF,
+    ONCE,
+    Directive,
+    find_directives,
+    include_cache,
+)
 
 VERTEX_SHADER = "VERTEX_SHADER"
 GEOMETRY_SHADER = "GEOMETRY_SHADER"
@@ -46,6 +56,7 @@ class ProgramShaders:
             meta.path or meta.vertex_shader,
             source,
             defines=meta.defines,
+            path=meta.resolved_path,
         )
 
         if GEOMETRY_SHADER in source:
@@ -54,6 +65,7 @@ class ProgramShaders:
                 meta.path or meta.geometry_shader,
                 source,
                 defines=meta.defines,
+                path=meta.resolved_path,
             )
 
         if FRAGMENT_SHADER in source:
@@ -62,6 +74,7 @@ class ProgramShaders:
                 meta.path or meta.fragment_shader,
                 source,
                 defines=meta.defines,
+                path=meta.resolved_path,
             )
 
         if TESS_CONTROL_SHADER in source:
@@ -70,6 +83,7 @@ class ProgramShaders:
                 meta.path or meta.tess_control_shader,
                 source,
                 defines=meta.defines,
+                path=meta.resolved_path,
             )
 
         if TESS_EVALUATION_SHADER in source:
@@ -78,6 +92,7 @@ class ProgramShaders:
                 meta.path or meta.tess_evaluation_shader,
                 source,
                 defines=meta.defines,
+                path=meta.resolved_path,
             )
 
         return instance
@@ -91,14 +106,21 @@ class ProgramShaders:
         fragment_source: Optional[str] = None,
         tess_control_source: Optional[str] = None,
         tess_evaluation_source: Optional[str] = None,
+        paths: Optional[Mapping[str, Hashable]] = None,
     ) -> "ProgramShaders":
-        """Initialize multiple shader strings"""
+        """Initialize multiple shader strings.
+
+        ``paths`` are the resolved paths of the sources by stage name, such as
+        ``"vertex"`` or ``"tess_control"``. They name the sources in the include graph.
+        """
+        paths = paths or {}
         instance = cls(meta)
         instance.vertex_source = ShaderSource(
             VERTEX_SHADER,
             meta.path or meta.vertex_shader,
             vertex_source,
             defines=meta.defines,
+            path=paths.get("vertex"),
         )
 
         if geometry_source is not None:
@@ -107,6 +129,7 @@ class ProgramShaders:
                 meta.path or meta.geometry_shader,
                 geometry_source,
                 defines=meta.defines,
+                path=paths.get("geometry"),
             )
 
         if fragment_source is not None:
@@ -115,6 +138,7 @@ class ProgramShaders:
                 meta.path or meta.fragment_shader,
                 fragment_source,
                 defines=meta.defines,
+                path=paths.get("fragment"),
             )
 
         if tess_control_source is not None:
@@ -123,21 +147,26 @@ class ProgramShaders:
                 meta.path or meta.tess_control_shader,
                 tess_control_source,
                 defines=meta.defines,
+                path=paths.get("tess_control"),
             )
 
         if tess_evaluation_source is not None:
             instance.tess_evaluation_source = ShaderSource(
                 TESS_EVALUATION_SHADER,
-                meta.path or meta.tess_control_shader,
+                meta.path or meta.tess_evaluation_shader,
                 tess_evaluation_source,
                 defines=meta.defines,
+                path=paths.get("tess_evaluation"),
             )
 
         return instance
 
     @classmethod
     def compute_shader(
-        cls: type["ProgramShaders"], meta: ProgramDescription, compute_shader_source: str = ""
+        cls: type["ProgramShaders"],
+        meta: ProgramDescription,
+        compute_shader_source: str = "",
+        path: Optional[Hashable] = None,
     ) -> "ProgramShaders":
         instance = cls(meta)
         instance.compute_shader_source = ShaderSource(
@@ -145,6 +174,7 @@ class ProgramShaders:
             "" if meta.compute_shader is None else meta.compute_shader,
             compute_shader_source,
             defines=meta.defines,
+            path=path,
         )
         return instance
 
@@ -152,10 +182,12 @@ class ProgramShaders:
         assert self.compute_shader_source is not None, "There is not compute_shader to create"
         return self.ctx.compute_shader(self.compute_shader_source.source)
 
-    def create(self) -> moderngl.Program:
+    def create(self, keywords: Optional[dict[str, Any]] = None) -> moderngl.Program:
         """
         Creates a shader program.
 
+        Keyword Args:
+            keywords (dict): ``#define`` values added after the ``#version`` line of each shader
         Returns:
             ModernGL Program instance
         """
@@ -173,16 +205,17 @@ class ProgramShaders:
             else:
                 out_attribs = self.meta.varyings or self.vertex_source.find_out_attribs()
 
+        def source(shader: Optional[ShaderSource]) -> Optional[str]:
+            if shader is None:
+                return None
+            return shader.source_with_defines(keywords) if keywords else shader.source
+
         program = self.ctx.program(
-            vertex_shader=self.vertex_source.source,
-            geometry_shader=(self.geometry_source.source if self.geometry_source else None),
-            fragment_shader=(self.fragment_source.source if self.fragment_source else None),
-            tess_control_shader=(
-                self.tess_control_source.source if self.tess_control_source else None
-            ),
-            tess_evaluation_shader=(
-                self.tess_evaluation_source.source if self.tess_evaluation_source else None
-            ),
+            vertex_shader=source(self.vertex_source),
+            geometry_shader=source(self.geometry_source),
+            fragment_shader=source(self.fragment_source),
+            tess_control_shader=source(self.tess_control_source),
+            tess_evaluation_shader=source(self.tess_evaluation_source),
             varyings=tuple(out_attribs),
         )
         program.extra = {"meta": self.meta}
@@ -226,6 +259,7 @@ class ShaderSource:
         defines: Optional[dict[str, str]] = None,
         id: int = 0,
         root: bool = True,
+        path: Optional[Hashable] = None,
     ):
         """Create shader source.
 
@@ -241,8 +275,12 @@ class ShaderSource:
                 The source number. Used when shader consists of multiple sources through includes
             root (bool):
                 If this shader source is the root shader (Not an include)
+            path:
+                The resolved path of the source. Used as its name in the include graph
         """
         self._id = id
+        self._path = path
+        self._directives: Optional[list[Directive]] = None
         self._root = root
         self._source_list = [
             self
@@ -278,6 +316,26 @@ class ShaderSource:
         """str: The source lines as a string"""
         return "\n".join(self._lines)
 
+    def source_with_defines(self, defines: dict[str, Any]) -> str:
+        """Get the source with ``#define`` lines added after the ``#version`` line.
+
+        A ``#line`` directive follows the defines so line numbers in
+        compiler errors still match the source.
+
+        Args:
+            defines (dict): Names and values to define
+        Returns:
+            str: The source
+        """
+        # Only comments and empty lines can come before the version
+        index = next(
+            (nr for nr, line in enumerate(self._lines) if line.strip().startswith("#version")),
+            -1,
+        )
+        lines = [f"#define {name} {value}" for name, value in defines.items()]
+        lines.append(f"#line {index + 2}")
+        return "\n".join([*self._lines[: index + 1], *lines, *self._lines[index + 1 :]])
+
     @property
     def source_list(self) -> list["ShaderSource"]:
         """list[ShaderSource]: List of all shader sources"""
@@ -307,47 +365,129 @@ class ShaderSource:
         self, load_source_func: Callable[[Any], Any], depth: int = 0, source_id: int = 0
     ) -> None:
         """Inject includes into the shader source.
-        This happens recursively up to a max level in case the users has
-        circular includes. We also build up a list of all the included
-        sources in the root shader.
+        The source is expanded in a single pass and included sources are
+        expanded recursively. We also build up a list of all the included
+        sources in the root shader and record the include graph in
+        :py:data:`~moderngl_window.opengl.includes.include_cache`.
+
+        A source containing ``#pragma once`` is only included once and a
+        source wrapped in an include guard is not included again after
+        the guard was defined. Circular includes raise a ``ShaderError``.
 
         Args:
             load_source_func (func): A function for finding and loading a source
             depth (int): The current include depth (increase by 1 for every call)
         """
+        self._expand(load_source_func, depth, source_id, _IncludeState(), False)
+
+    def _expand(
+        self,
+        load_source_func: Callable[[Any], Any],
+        depth: int,
+        source_id: int,
+        state: "_IncludeState",
+        conditional: bool,
+    ) -> None:
+        """Expand the includes of this source.
+
+        Args:
+            load_source_func (func): A function for finding and loading a source
+            depth (int): The current include depth
+            source_id (int): The id of this source
+            state (_IncludeState): Includes seen so far in the root shader
+            conditional (bool): Is this source included inside a conditional block?
+        """
         if depth > 100:
             raise ShaderError(
                 "Reaching an include depth of 100. You probably have circular includes"
             )
 
+        directives = self._directives
+        if directives is None:
+            try:
+                directives = find_directives(self._lines)
+            except ValueError as ex:
+                raise ShaderError(str(ex)) from ex
+
+        key = self._path if self._path is not None else self._name
+        state.stack.append(key)
+        includes = set()
+        lines: list[str] = []
+        start = 0
+        level = 0
         current_id = source_id
-        while True:
-            for nr, line in enumerate(self._lines):
-                line = line.strip()
-                if line.startswith("#include"):
-                    match = re.search(r'#include\s+"?([^"]+)', line)
-                    if match is None:
-                        raise ShaderError(
-                            f"Could not match '#include\\s+\"?([^\"]+)' in line {line}"
-                        )
-                    path = match[1]
-                    current_id += 1
-                    _, source = load_source_func(path)
-                    source = ShaderSource(
-                        None,
-                        path,
-                        source,
-                        defines=self._defines,
-                        id=current_id,
-                        root=False,
+        for nr, kind, path in directives:
+            if kind == IF:
+                level += 1
+                continue
+            if kind == ENDIF:
+                level -= 1
+                continue
+
+            lines.extend(self._lines[start:nr])
+            start = nr + 1
+            if kind == ONCE:
+                continue
+
+            resolved, text = load_source_func(path)
+            includes.add(resolved)
+            try:
+                parsed = include_cache.parse(resolved, text)
+                child_directives = parsed.directives
+            except ValueError as ex:
+                raise ShaderError(f"{ex} in {path}") from ex
+
+            guard = parsed.guard
+            if resolved in state.once or (guard is not None and guard in state.guards):
+                continue
+            if resolved in state.stack:
+                if parsed.once or guard is not None:
+                    # The content is inside its own guard at this point
+                    continue
+                raise ShaderError(
+                    "Circular include of {} in {}".format(
+                        path, " -> ".join(str(entry) for entry in state.stack)
                     )
-                    source.handle_includes(load_source_func, depth=depth + 1, source_id=current_id)
-                    self._lines = self.lines[:nr] + source.lines + self.lines[nr + 1 :]
-                    self._source_list += source.source_list
-                    current_id = self._source_list[-1].id
-                    break
+                )
+
+            # Sources included unconditionally never need to be included again
+            included_conditionally = conditional or level > 0
+            if not included_conditionally:
+                if parsed.once:
+                    state.once.add(resolved)
+                if guard is not None:
+                    state.guards.add(guard)
+
+            current_id += 1
+            source = ShaderSource(
+                None,
+                path,
+                text,
+                defines=self._defines,
+                id=current_id,
+                root=False,
+            )
+            source._path = resolved
+            source._directives = child_directives
+            source._expand(load_source_func, depth + 1, current_id, state, included_conditionally)
+
+            if parsed.once:
+                # Later includes inside other conditional blocks are skipped by the macro
+                macro = state.once_macro(resolved)
+                lines.append(f"#ifndef {macro}")
+                lines.append(f"#define {macro}")
+                lines.extend(source.lines)
+                lines.append("#endif")
             else:
-                break
+                lines.extend(source.lines)
+            self._source_list += source.source_list
+            current_id = self._source_list[-1].id
+
+        state.stack.pop()
+        include_cache.set_includes(key, includes)
+        if start > 0:
+            lines.extend(self._lines[start:])
+            self._lines = lines
 
     def apply_defines(self, defines: dict[str, str]) -> None:
         """Apply the configured define values"""
@@ -399,9 +539,40 @@ class ShaderError(Exception):
     """Generic shader related error"""
 
 
+class ProgramBatchError(ShaderError, moderngl.Error):
+    """Several programs in a batch failed to compile or link.
+
+    This is a ``moderngl.Error`` so code catching compile errors of single
+    programs catches it as well.
+    """
+
+
+class _IncludeState:
+    """Includes seen while expanding a root shader"""
+
+    __slots__ = ("stack", "once", "guards", "macros")
+
+    def __init__(self) -> None:
+        self.stack: list[Hashable] = []
+        self.once: set[Hashable] = set()
+        self.guards: set[str] = set()
+        self.macros: dict[Hashable, str] = {}
+
+    def once_macro(self, path: Hashable) -> str:
+        """The generated guard macro of a ``#pragma once`` source"""
+        macro = self.macros.get(path)
+        if macro is None:
+            macro = self.macros[path] = f"MODERNGL_WINDOW_ONCE_{len(self.macros)}"
+        return macro
+
+
 class ReloadableProgram:
     """
     Programs we want to be reloadable must be created with this wrapper.
+
+    An enabled :py:class:`~moderngl_window.reloader.Reloader` swaps the
+    wrapped ``program`` when the source files change, so the wrapper
+    can be kept and used as usual.
     """
 
     def __init__(self, meta: ProgramDescription, program: moderngl.Program):
@@ -490,5 +661,193 @@ class ReloadableProgram:
         """
         return self.program.geometry_vertices
 
+    @property
+    def binder(self) -> "UniformBinder":
+        """UniformBinder: Uniform writer skipping redundant uploads for this program"""
+        return UniformBinder.get(self)
+
     def __repr__(self) -> str:
         return f"<ReloadableProgram: {self.name} id={self.glo}>"
+
+
+class UniformBinder:
+    """Writes uniforms to a program skipping redundant uploads.
+
+    Uniform members are looked up once and the last value written
+    through the binder is remembered. Writing the same value again
+    does not upload anything. Values assigned directly on the program
+    are not tracked, so call :py:meth:`invalidate` after doing that.
+    The cache is dropped automatically when a reloadable program
+    gets a new program object. The binder only holds a weak reference
+    to the program, so keep a reference to the program itself.
+
+    Example::
+
+        binder = UniformBinder.get(program)
+        binder.write("m_proj", projection_matrix)
+        binder.set("texture0", 0)
+
+        # Once per frame
+        writes, skipped = UniformBinder.frame_counters()
+    """
+
+    _binders: weakref.WeakKeyDictionary[Any, "UniformBinder"] = weakref.WeakKeyDictionary()
+
+    def __init__(self, program: Union[moderngl.Program, ReloadableProgram]):
+        """Create a binder for a program.
+
+        Args:
+            program: The program to write uniforms to
+        """
+        self._program = weakref.ref(program)
+        # The moderngl program the cached members belong to
+        self._target = weakref.ref(self._current_program())
+        self._members: dict[str, Any] = {}
+        self._values: dict[str, Any] = {}
+        #: int: Number of uploads since the counters were reset
+        self.writes = 0
+        #: int: Number of skipped uploads since the counters were reset
+        self.skipped = 0
+
+    @property
+    def program(self) -> Union[moderngl.Program, ReloadableProgram]:
+        """The program uniforms are written to
+
+        Raises:
+            ReferenceError: If the program was garbage collected
+        """
+        program = self._program()
+        if program is None:
+            raise ReferenceError("The program of the binder no longer exists")
+        return program
+
+    @property
+    def released(self) -> bool:
+        """bool: Has the program been garbage collected or released?"""
+        program = self._program()
+        if program is None:
+            return True
+        if isinstance(program, ReloadableProgram):
+            program = program.program
+        return isinstance(program.mglo, moderngl.InvalidObject)
+
+    @classmethod
+    def get(cls, program: Union[moderngl.Program, ReloadableProgram]) -> "UniformBinder":
+        """Get the shared binder for a program. Created on the first call.
+
+        Args:
+            program: The program
+        """
+        binder = cls._binders.get(program)
+        if binder is None:
+            binder = cls(program)
+            cls._binders[program] = binder
+
+        return binder
+
+    @classmethod
+    def frame_counters(cls, reset: bool = True) -> tuple[int, int]:
+        """Total writes and skipped writes for all shared binders.
+
+        Binders of released programs are skipped.
+
+        Args:
+            reset (bool): Reset the counters. Call this once per frame
+        Returns:
+            tuple: (writes, skipped)
+        """
+        writes = skipped = 0
+        for binder in list(cls._binders.values()):
+            if binder.released:
+                continue
+            writes += binder.writes
+            skipped += binder.skipped
+            if reset:
+                binder.reset_counters()
+
+        return writes, skipped
+
+    def member(self, name: str) -> Any:
+        """Get a program member. Lookups are cached.
+
+        Args:
+            name (str): Name of the uniform
+        Raises:
+            KeyError: If the member does not exist in the program
+        """
+        target = self._current_program()
+        if target is not self._target():
+            self._target = weakref.ref(target)
+            self._members.clear()
+            self._values.clear()
+
+        member = self._members.get(name)
+        if member is None:
+            member = self._members[name] = self.program[name]
+
+        return member
+
+    def write(self, name: str, data: Any) -> bool:
+        """Write raw data to a uniform if it changed.
+
+        Args:
+            name (str): Name of the uniform
+            data: bytes or any object supporting the buffer protocol (glm, numpy)
+        Returns:
+            bool: True if the data was uploaded
+        """
+        member = self.member(name)
+        # Keep the memory order. glm matrices are column major
+        data = memoryview(data).tobytes(order="A")
+        if self._values.get(name) == data:
+            self.skipped += 1
+            return False
+
+        member.write(data)
+        self._values[name] = data
+        self.writes += 1
+        return True
+
+    def set(self, name: str, value: Any) -> bool:
+        """Set the value of a uniform if it changed.
+
+        Args:
+            name (str): Name of the uniform
+            value: int, float, bool or tuple value
+        Returns:
+            bool: True if the value was uploaded
+        """
+        member = self.member(name)
+        if name in self._values and self._values[name] == value:
+            self.skipped += 1
+            return False
+
+        member.value = value
+        self._values[name] = value
+        self.writes += 1
+        return True
+
+    def _current_program(self) -> moderngl.Program:
+        """The moderngl program currently wrapped by the program"""
+        if isinstance(self.program, ReloadableProgram):
+            return self.program.program
+        return self.program
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget the last written values making the next write upload.
+
+        Args:
+            name (str): Only forget this uniform
+        """
+        if name is None:
+            self._values.clear()
+        else:
+            self._values.pop(name, None)
+
+    def reset_counters(self) -> None:
+        """Reset the write counters"""
+        self.writes = 0
+        self.skipped = 0
+
+    def __repr__(self) -> str:
+        return f"<UniformBinder: {self._program()!r} writes={self.writes} skipped={self.skipped}>"
@@ -1,3 +1,6 @@
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any, Optional, Union
 
 import moderngl
@@ -5,7 +8,9 @@ import numpy
 import numpy.typing as npt
 
 import moderngl_window as mglw
+from moderngl_window import profiler
 from moderngl_window.opengl import types
+from moderngl_window.opengl.program import ReloadableProgram
 
 # For sanity checking draw modes when creating the VAO
 DRAW_MODES = {
@@ -37,6 +42,7 @@ class BufferInfo:
         :param format: The format of the buffer
         """
         self.buffer = buffer
+        self.buffer_format = buffer_format
         self.attrib_formats = types.parse_attribute_formats(buffer_format)
         self.attributes = attributes
         self.per_instance = per_instance
@@ -124,6 +130,12 @@ class VAO:
 
     """
 
+    #: int: Maximum number of ``moderngl.VertexArray`` instances cached per VAO
+    max_instances = 16
+
+    # All created VAOs so cached instances can be released after reloads
+    _all: "weakref.WeakSet[VAO]" = weakref.WeakSet()
+
     def __init__(self, name: str = "", mode: int = moderngl.TRIANGLES):
         """Create and empty VAO with a name and default render mode.
 
@@ -148,13 +160,42 @@ class VAO:
         self._index_element_size: Optional[int] = None
 
         self.vertex_count = 0
-        self.vaos: dict[Any, moderngl.VertexArray] = {}
+        # Vertex arrays per program in least recently used order
+        self.vaos: OrderedDict[int, moderngl.VertexArray] = OrderedDict()
+        # Weak references to the program and the moderngl program each vertex array
+        # was created with and the finalizer dropping the vertex array with the program
+        self._owners: dict[int, tuple[weakref.ref[Any], weakref.ref[Any], weakref.finalize]] = {}
+        # Buffer mapping for each program attribute signature
+        self._content: dict[tuple[str, ...], list[tuple[Any, ...]]] = {}
+        VAO._all.add(self)
 
     @property
     def ctx(self) -> moderngl.Context:
         """moderngl.Context: The active moderngl context"""
         return mglw.ctx()
 
+    @property
+    def buffers(self) -> list[BufferInfo]:
+        """list[BufferInfo]: The buffers registered in this VAO"""
+        return self._buffers
+
+    @property
+    def index_element_size(self) -> Optional[int]:
+        """int: Byte size of each index or ``None`` if the VAO has no index buffer"""
+        return self._index_element_size if self._index_buffer else None
+
+    def read_indices(self) -> Optional[npt.NDArray[numpy.uint32]]:
+        """Read back the index buffer as ``uint32`` values.
+
+        Returns:
+            The indices or ``None`` if the VAO has no index buffer
+        """
+        if self._index_buffer is None:
+            return None
+
+        dtype = {1: numpy.uint8, 2: numpy.uint16, 4: numpy.uint32}[self._index_element_size or 4]
+        return numpy.frombuffer(self._index_buffer.read(), dtype=dtype).astype(numpy.uint32)
+
     def render(
         self,
         program: moderngl.Program,
@@ -181,7 +222,8 @@ class VAO:
         if mode is None:
             mode = self.mode
 
-        vao.render(mode, vertices=vertices, first=first, instances=instances)
+        with profiler.scope("VAO.render", gpu=True):
+            vao.render(mode, vertices=vertices, first=first, instances=instances)
 
     def render_indirect(
         self,
@@ -288,6 +330,7 @@ class VAO:
 
         self._buffers.append(BufferInfo(buffer, buffer_format, attribute_names))
         self.vertex_count = self._buffers[-1].vertices
+        self._content = {}
 
         return buffer
 
@@ -319,6 +362,10 @@ class VAO:
         """Obtain the ``moderngl.VertexArray`` instance for the program.
 
         The instance is only created once and cached internally.
+        The buffer mapping is shared between programs with the same
+        attribute names. Instances are dropped when their program is
+        released or reloaded and the least recently used instance is
+        released when there are more than :py:attr:`max_instances`.
 
         Args:
             program (moderngl.Program): The program
@@ -326,9 +373,19 @@ class VAO:
         Returns:
             ``moderngl.VertexArray``: instance
         """
-        vao = self.vaos.get(program.glo)
-        if vao is not None and isinstance(vao, moderngl.VertexArray):
-            return vao
+        # Entries are dropped by a finalizer before the id of a collected program can be reused
+        key = id(program)
+        vao = self.vaos.get(key)
+        if vao is not None:
+            if not self._is_stale(key):
+                self.vaos.move_to_end(key)
+                return vao
+            self._release_instance(key)
+        else:
+            self._release_stale()
+
+        if isinstance(program.mglo, moderngl.InvalidObject):
+            raise VAOError("VAO {} can not be used with a released program".format(self.name))
 
         program_attributes = [
             name
@@ -336,6 +393,56 @@ class VAO:
             if isinstance(attr, moderngl.Attribute) and not attr.name.startswith("gl_")
         ]
 
+        signature = tuple(sorted(program_attributes))
+        vao_content = self._content.get(signature)
+        if vao_content is None:
+            vao_content = self._content[signature] = self._create_content(
+                program, program_attributes
+            )
+
+        # Reloadable programs are tracked by the wrapper, but moderngl needs the program
+        gl_program = program.program if isinstance(program, ReloadableProgram) else program
+
+        # Create the vao
+        if self._index_buffer:
+            vao = self.ctx.vertex_array(
+                gl_program,
+                vao_content,
+                self._index_buffer,
+                self._index_element_size,
+            )
+        else:
+            vao = self.ctx.vertex_array(gl_program, vao_content)
+
+        self.vaos[key] = vao
+        self._owners[key] = (
+            weakref.ref(program),
+            weakref.ref(gl_program),
+            weakref.finalize(program, VAO._program_collected, weakref.ref(self), key),
+        )
+
+        while len(self.vaos) > self.max_instances:
+            self._release_instance(next(iter(self.vaos)))
+
+        return vao
+
+    def warm_up(self, programs: Iterable[moderngl.Program]) -> None:
+        """Create the ``moderngl.VertexArray`` instances for programs up front.
+
+        This avoids creating them lazily when rendering the first frame.
+
+        Args:
+            programs: The programs this VAO will be rendered with
+        """
+        for program in programs:
+            self.instance(program)
+
+    def _create_content(
+        self, program: moderngl.Program, program_attributes: list[str]
+    ) -> list[tuple[Any, ...]]:
+        """Map the buffers to the program attributes"""
+        program_attributes = list(program_attributes)
+
         # Make sure all attributes are covered
         for attrib_name in program_attributes:
             # Do we have a buffer mapping to this attribute?
@@ -368,19 +475,50 @@ class VAO:
                 "Did not find a buffer mapping for {}".format([n for n in program_attributes])
             )
 
-        # Create the vao
-        if self._index_buffer:
-            vao = self.ctx.vertex_array(
-                program,
-                vao_content,
-                self._index_buffer,
-                self._index_element_size,
-            )
-        else:
-            vao = self.ctx.vertex_array(program, vao_content)
+        return vao_content
 
-        self.vaos[program.glo] = vao
-        return vao
+    def _release_instance(self, key: int) -> None:
+        """Release a cached vertex array"""
+        vao = self.vaos.pop(key, None)
+        owner = self._owners.pop(key, None)
+        if owner is not None:
+            owner[2].detach()
+        if vao is not None:
+            vao.release()
+
+    @staticmethod
+    def _program_collected(vao: "weakref.ref[VAO]", key: int) -> None:
+        """Drop the vertex array of a garbage collected program"""
+        instance = vao()
+        if instance is not None:
+            instance._release_instance(key)
+
+    @classmethod
+    def release_stale_instances(cls) -> None:
+        """Release the cached vertex arrays of released or reloaded programs in all VAOs.
+
+        Stale instances are otherwise only released when the VAO is rendered
+        with the program again or with a program it has no instance for.
+        """
+        for vao in list(cls._all):
+            vao._release_stale()
+
+    def _release_stale(self) -> None:
+        """Release vertex arrays for programs that were released or reloaded"""
+        stale = [key for key in self._owners if self._is_stale(key)]
+        for key in stale:
+            self._release_instance(key)
+
+    def _is_stale(self, key: int) -> bool:
+        """Was the program of a vertex array released, collected or reloaded?"""
+        program_ref, gl_program_ref, _ = self._owners[key]
+        program = program_ref()
+        gl_program = gl_program_ref()
+        if program is None or gl_program is None:
+            return True
+        if isinstance(program, ReloadableProgram) and program.program is not gl_program:
+            return True
+        return isinstance(gl_program.mglo, moderngl.InvalidObject)
 
     def release(self, buffer: bool = True) -> None:
         """Destroy all internally cached vaos and release all buffers.
@@ -390,8 +528,12 @@ class VAO:
         """
         for _, vao in self.vaos.items():
             vao.release()
+        for _, _, finalizer in self._owners.values():
+            finalizer.detach()
 
-        self.vaos = {}
+        self.vaos = OrderedDict()
+        self._owners = {}
+        self._content = {}
 
         if buffer:
             for buff in self._buffers:
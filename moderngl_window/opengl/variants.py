@@ -0,0 +1,214 @@
+"""
+Programs compiled in variants selected by feature keywords
+"""
+
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import Iterable
+from typing import Callable, Optional, Union
+
+import moderngl
+
+from moderngl_window.exceptions import ImproperlyConfigured
+from moderngl_window.meta import ProgramDescription
+from moderngl_window.opengl.program import ProgramShaders
+from moderngl_window.resources.programs import programs
+
+logger = logging.getLogger(__name__)
+
+Keywords = Union[frozenset[str], Iterable[str]]
+
+
+class ProgramVariants:
+    """A program compiled in variants selected by feature keywords.
+
+    The sources are loaded and their includes resolved once. Every
+    variant defines all keywords after the ``#version`` line, as ``1``
+    when enabled and ``0`` otherwise, so shaders test them with
+    ``#if KEYWORD``. Variants are compiled on first use and cached per
+    keyword set. Combinations known up front can be compiled right away
+    with :py:meth:`precompile` or queued and compiled a few at a time
+    between frames with :py:meth:`compile_pending` so a new combination
+    showing up does not stall a frame.
+
+    Example::
+
+        variants = ProgramVariants(
+            ProgramDescription(path="programs/mesh.glsl"),
+            keywords=["NORMALS", "TEXTURE", "VERTEX_COLOR"],
+        )
+        variants.queue(variants.combinations())
+
+        # Once per frame
+        variants.compile_pending(budget=0.002)
+
+        program = variants.get({"NORMALS", "TEXTURE"})
+    """
+
+    def __init__(
+        self,
+        meta: ProgramDescription,
+        keywords: Iterable[str],
+        setup: Optional[Callable[[moderngl.Program], None]] = None,
+    ):
+        """Create the variants. Nothing is loaded until the first variant is compiled.
+
+        Args:
+            meta (ProgramDescription): The program. ``defines`` apply to all variants
+            keywords: The feature keywords
+            setup: Called with every new variant, for example to assign uniform block bindings
+        """
+        self.meta = meta
+        self.keywords = tuple(keywords)
+        self._known = frozenset(self.keywords)
+        if len(self._known) != len(self.keywords):
+            raise ValueError("Duplicate keywords in {}".format(self.keywords))
+
+        self._setup = setup
+        self._shaders: Optional[ProgramShaders] = None
+        self._programs: dict[frozenset[str], moderngl.Program] = {}
+        self._pending: deque[frozenset[str]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._programs)
+
+    def __contains__(self, keywords: Keywords) -> bool:
+        return self.key(keywords) in self._programs
+
+    @property
+    def programs(self) -> dict[frozenset[str], moderngl.Program]:
+        """dict: The compiled variants by keyword set"""
+        return dict(self._programs)
+
+    @property
+    def pending(self) -> int:
+        """int: Number of queued variants not compiled yet"""
+        return len(self._pending)
+
+    def key(self, keywords: Keywords) -> frozenset[str]:
+        """Get the cache key of a keyword combination.
+
+        Args:
+            keywords: The enabled keywords
+        Raises:
+            ValueError: If a keyword was not declared
+        """
+        key = keywords if isinstance(keywords, frozenset) else frozenset(keywords)
+        unknown = key - self._known
+        if unknown:
+            raise ValueError(
+                "Unknown keywords {} for {}. Declared keywords: {}".format(
+                    sorted(unknown), self.name, self.keywords
+                )
+            )
+        return key
+
+    @property
+    def name(self) -> Optional[str]:
+        """str: The path of the program"""
+        return self.meta.path or self.meta.vertex_shader
+
+    def combinations(self) -> list[frozenset[str]]:
+        """Get every combination of the keywords"""
+        return [
+            frozenset(keywords)
+            for count in range(len(self.keywords) + 1)
+            for keywords in itertools.combinations(self.keywords, count)
+        ]
+
+    def get(self, keywords: Keywords = frozenset()) -> moderngl.Program:
+        """Get the variant for enabled keywords, compiling it if needed.
+
+        Args:
+            keywords: The enabled keywords. A frozenset is the fastest to look up
+        Returns:
+            moderngl.Program: The program
+        """
+        try:
+            return self._programs[keywords]  # type: ignore
+        except (KeyError, TypeError):
+            pass
+
+        key = self.key(keywords)
+        program = self._programs.get(key)
+        if program is None:
+            program = self._compile(key)
+        return program
+
+    def precompile(self, keyword_sets: Iterable[Keywords]) -> None:
+        """Compile variants now.
+
+        Args:
+            keyword_sets: The keyword combinations
+        """
+        for keywords in keyword_sets:
+            self.get(keywords)
+
+    def queue(self, keyword_sets: Iterable[Keywords]) -> None:
+        """Queue variants to be compiled by :py:meth:`compile_pending`.
+
+        Args:
+            keyword_sets: The keyword combinations
+        """
+        for keywords in keyword_sets:
+            key = self.key(keywords)
+            if key not in self._programs and key not in self._pending:
+                self._pending.append(key)
+
+    def compile_pending(self, budget: Optional[float] = None) -> int:
+        """Compile queued variants.
+
+        At least one variant is compiled when any are queued.
+
+        Args:
+            budget (float): Seconds to spend. All queued variants are compiled if not set
+        Returns:
+            int: Number of variants compiled
+        """
+        start = time.perf_counter()
+        compiled = 0
+        while self._pending:
+            if budget is not None and compiled and time.perf_counter() - start >= budget:
+                break
+            key = self._pending.popleft()
+            if key not in self._programs:
+                self._compile(key)
+                compiled += 1
+        return compiled
+
+    def shaders(self) -> ProgramShaders:
+        """Get the loaded shader sources, loading them on first use"""
+        if self._shaders is None:
+            programs.resolve_loader(self.meta)
+            assert self.meta.loader_cls is not None
+            loader = self.meta.loader_cls(self.meta)
+            load_shaders = getattr(loader, "load_shaders", None)
+            if load_shaders is None:
+                raise ImproperlyConfigured(
+                    "The {} loader can't load shader sources for variants".format(self.meta.kind)
+                )
+            self._shaders = load_shaders()
+        return self._shaders
+
+    def release(self) -> None:
+        """Release all variants"""
+        for program in self._programs.values():
+            program.release()
+        self._programs = {}
+        self._pending.clear()
+
+    def _compile(self, key: frozenset[str]) -> moderngl.Program:
+        """Compile a variant"""
+        keywords = {keyword: 1 if keyword in key else 0 for keyword in self.keywords}
+        logger.debug("Compiling %s with %s", self.name, sorted(key))
+        program = self.shaders().create(keywords=keywords)
+        program.extra["keywords"] = key
+        if self._setup is not None:
+            self._setup(program)
+        self._programs[key] = program
+        return program
+
+    def __repr__(self) -> str:
+        return f"<ProgramVariants: {self.name} variants={len(self._programs)}>"
@@ -0,0 +1,370 @@
+"""
+Per-frame CPU and GPU profiling.
+
+A :py:class:`Profiler` records named scopes in every frame. CPU time is
+measured with ``time.perf_counter_ns`` and GPU time with timer queries.
+The main loop, :py:meth:`Scene.draw <moderngl_window.scene.Scene.draw>`,
+mesh programs and :py:meth:`VAO.render <moderngl_window.opengl.vao.VAO.render>`
+record scopes when a profiler is enabled::
+
+    profiler = Profiler(ctx)
+    profiler.enable()
+
+    # Own code can add scopes
+    with profiler.scope("particles", gpu=True):
+        particles.render()
+
+    # Average times of the recent frames
+    print(profiler.summary())
+
+    # Open in chrome://tracing or https://ui.perfetto.dev
+    profiler.export_chrome_trace("trace.json")
+
+Profiling can also be enabled for a ``WindowConfig`` with the
+``--profile`` command line argument.
+"""
+
+import json
+import time
+from collections import deque
+from typing import Any, Optional, Union
+
+import moderngl
+
+#: The enabled profiler or ``None``
+current: Optional["Profiler"] = None
+
+
+class ProfileScope:
+    """A scope recorded in a frame. Times are in nanoseconds."""
+
+    __slots__ = ("name", "depth", "start", "cpu", "gpu")
+
+    def __init__(self, name: str, depth: int, start: int):
+        #: Name of the scope
+        self.name = name
+        #: Number of enclosing scopes
+        self.depth = depth
+        #: CPU time the scope started relative to the start of the frame
+        self.start = start
+        #: CPU time spent in the scope
+        self.cpu = 0
+        #: GPU time spent in the scope or ``None`` if not measured
+        self.gpu: Optional[int] = None
+
+
+class ProfileFrame:
+    """The scopes recorded in a frame. Times are in nanoseconds."""
+
+    __slots__ = ("index", "start", "cpu", "scopes", "gpu_ready")
+
+    def __init__(self, index: int, start: int):
+        #: Frame number
+        self.index = index
+        #: ``perf_counter_ns`` when the frame started
+        self.start = start
+        #: CPU time of the whole frame
+        self.cpu = 0
+        #: The scopes in the order they started
+        self.scopes: list[ProfileScope] = []
+        #: Are the GPU times read back?
+        self.gpu_ready = False
+
+    @property
+    def gpu(self) -> int:
+        """int: GPU time of all measured scopes"""
+        return sum(scope.gpu for scope in self.scopes if scope.gpu is not None)
+
+
+class _NullScope:
+    """Scope doing nothing when profiling is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """Records a scope in the current frame"""
+
+    __slots__ = ("profiler", "name", "gpu", "record", "query")
+
+    def __init__(self, profiler: "Profiler", name: str, gpu: bool):
+        self.profiler = profiler
+        self.name = name
+        self.gpu = gpu
+        self.record: Optional[ProfileScope] = None
+        self.query: Optional[moderngl.Query] = None
+
+    def __enter__(self) -> Optional[ProfileScope]:
+        self.record, self.query = self.profiler._begin_scope(self.name, self.gpu)
+        return self.record
+
+    def __exit__(self, *args: Any) -> None:
+        self.profiler._end_scope(self.record, self.query)
+
+
+def scope(name: str, gpu: bool = False) -> Union[_Scope, _NullScope]:
+    """Record a scope in the enabled profiler.
+    Does nothing when no profiler is enabled.
+
+    Args:
+        name (str): Name of the scope
+        gpu (bool): Also measure the GPU time
+    """
+    if current is None:
+        return _NULL_SCOPE
+    return current.scope(name, gpu=gpu)
+
+
+class Profiler:
+    """Records CPU and GPU time of named scopes in each frame.
+
+    Timer queries are read ``latency`` frames after they were issued
+    when the GPU is done with them, so profiling does not stall the
+    pipeline. Until then the GPU times of a frame are ``None``.
+    Timer queries can't be nested. Only the outermost scope measuring
+    GPU time gets a query while nested scopes report CPU time only.
+    """
+
+    def __init__(
+        self,
+        ctx: Optional[moderngl.Context] = None,
+        gpu: bool = True,
+        latency: int = 3,
+        history: int = 300,
+    ):
+        """Create the profiler.
+
+        Args:
+            ctx (moderngl.Context): The context. GPU time is not measured without one
+            gpu (bool): Measure GPU time with timer queries
+            latency (int): Number of frames before reading the timer queries
+            history (int): Number of frames to keep
+        """
+        self.ctx = ctx
+        self.gpu = gpu and ctx is not None
+        #: The recent frames from oldest to newest
+        self.frames: deque[ProfileFrame] = deque(maxlen=history)
+        self._frame: Optional[ProfileFrame] = None
+        self._frame_index = 0
+        self._depth = 0
+        self._gpu_active = False
+        # Timer queries of the frames waiting for the GPU
+        self._slots: list[tuple[Optional[ProfileFrame], list[tuple[ProfileScope, moderngl.Query]]]]
+        self._slots = [(None, []) for _ in range(max(latency, 1) + 1)]
+        self._free_queries: list[moderngl.Query] = []
+
+    @property
+    def enabled(self) -> bool:
+        """bool: Is this the enabled profiler?"""
+        return current is self
+
+    def enable(self) -> None:
+        """Make this the profiler recording scopes"""
+        global current
+        current = self
+
+    def disable(self) -> None:
+        """Stop recording scopes"""
+        global current
+        if current is self:
+            current = None
+
+    @property
+    def last_frame(self) -> Optional[ProfileFrame]:
+        """ProfileFrame: The most recent frame with GPU times read back"""
+        for frame in reversed(self.frames):
+            if frame.gpu_ready:
+                return frame
+        return None
+
+    def begin_frame(self) -> None:
+        """Start recording a frame"""
+        if self._frame is not None:
+            self.end_frame()
+
+        self._frame_index += 1
+        self._frame = ProfileFrame(self._frame_index, time.perf_counter_ns())
+        self._depth = 0
+
+    def end_frame(self) -> None:
+        """Finish the current frame and read the GPU times of an older frame"""
+        frame = self._frame
+        if frame is None:
+            return
+
+        frame.cpu = time.perf_counter_ns() - frame.start
+        self._frame = None
+        self.frames.append(frame)
+
+        slot = frame.index % len(self._slots)
+        _, queries = self._slots[slot]
+        self._slots[slot] = (frame, queries)
+        if not queries:
+            frame.gpu_ready = True
+
+        # The slot of the next frame holds the oldest queries
+        self._read_slot((frame.index + 1) % len(self._slots))
+
+    def scope(self, name: str, gpu: bool = False) -> Union[_Scope, _NullScope]:
+        """Record a scope in the current frame.
+        Does nothing outside :py:meth:`begin_frame` and :py:meth:`end_frame`.
+
+        Args:
+            name (str): Name of the scope
+            gpu (bool): Also measure the GPU time
+        """
+        if self._frame is None:
+            return _NULL_SCOPE
+        return _Scope(self, name, gpu)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Average times in milliseconds of each scope over the recent frames.
+
+        Returns:
+            dict: ``calls``, ``cpu`` and ``gpu`` per frame for each scope name.
+            ``frame`` holds the times of the whole frame
+        """
+        frames = [frame for frame in self.frames if frame.gpu_ready]
+        if not frames:
+            return {}
+
+        count = len(frames)
+        result: dict[str, dict[str, float]] = {
+            "frame": {
+                "calls": 1.0,
+                "cpu": sum(frame.cpu for frame in frames) / count / 1e6,
+                "gpu": sum(frame.gpu for frame in frames) / count / 1e6,
+            }
+        }
+        for frame in frames:
+            for record in frame.scopes:
+                entry = result.setdefault(record.name, {"calls": 0.0, "cpu": 0.0, "gpu": 0.0})
+                entry["calls"] += 1 / count
+                entry["cpu"] += record.cpu / count / 1e6
+                if record.gpu is not None:
+                    entry["gpu"] += record.gpu / count / 1e6
+
+        return result
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """The recorded frames in the Chrome trace event format.
+
+        CPU scopes are on the ``CPU`` thread. GPU times are shown on the
+        ``GPU`` thread starting at the same time as the CPU scope since
+        timer queries only measure durations.
+        """
+        events: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": 0, "args": {"name": "CPU"}},
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": 1, "args": {"name": "GPU"}},
+        ]
+        for frame in self.frames:
+            start = frame.start / 1000
+            events.append(
+                {
+                    "name": "Frame {}".format(frame.index),
+                    "ph": "X",
+                    "pid": 0,
+                    "tid": 0,
+                    "ts": start,
+                    "dur": frame.cpu / 1000,
+                }
+            )
+            for record in frame.scopes:
+                event = {
+                    "name": record.name,
+                    "ph": "X",
+                    "pid": 0,
+                    "tid": 0,
+                    "ts": start + record.start / 1000,
+                    "dur": record.cpu / 1000,
+                }
+                events.append(event)
+                if record.gpu is not None:
+                    events.append({**event, "tid": 1, "dur": record.gpu / 1000})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        """Write the recorded frames to a Chrome trace JSON file.
+
+        Args:
+            path (str): The file to write
+        """
+        with open(path, "w") as fd:
+            json.dump(self.chrome_trace(), fd)
+
+    def release(self) -> None:
+        """Read the remaining GPU times, disable the profiler and release the queries"""
+        self.disable()
+        for slot in range(len(self._slots)):
+            self._read_slot(slot)
+        for query in self._free_queries:
+            # Queries in moderngl 5 have no release and are deleted with the context
+            release = getattr(query, "release", None)
+            if release is not None:
+                release()
+        self._free_queries = []
+
+    def _begin_scope(
+        self, name: str, gpu: bool
+    ) -> tuple[Optional[ProfileScope], Optional[moderngl.Query]]:
+        """Start a scope in the current frame"""
+        frame = self._frame
+        if frame is None:
+            return None, None
+
+        record = ProfileScope(name, self._depth, time.perf_counter_ns() - frame.start)
+        frame.scopes.append(record)
+        self._depth += 1
+
+        query = None
+        if gpu and self.gpu and not self._gpu_active:
+            query = self._query()
+            query.__enter__()
+            self._gpu_active = True
+
+        return record, query
+
+    def _end_scope(self, record: Optional[ProfileScope], query: Optional[moderngl.Query]) -> None:
+        """End a scope started by :py:meth:`_begin_scope`"""
+        frame = self._frame
+        if query is not None:
+            query.__exit__()
+            self._gpu_active = False
+            if record is not None and frame is not None:
+                self._slots[frame.index % len(self._slots)][1].append((record, query))
+            else:
+                self._free_queries.append(query)
+
+        if record is None or frame is None:
+            return
+
+        record.cpu = time.perf_counter_ns() - frame.start - record.start
+        self._depth -= 1
+
+    def _query(self) -> moderngl.Query:
+        """Get an unused timer query"""
+        if self._free_queries:
+            return self._free_queries.pop()
+        assert self.ctx is not None
+        return self.ctx.query(time=True)
+
+    def _read_slot(self, slot: int) -> None:
+        """Read the timer queries of a slot"""
+        frame, queries = self._slots[slot]
+        for record, query in queries:
+            record.gpu = query.elapsed
+            self._free_queries.append(query)
+
+        if frame is not None:
+            frame.gpu_ready = True
+        self._slots[slot] = (None, [])
@@ -0,0 +1,556 @@
+"""
+Hot reloading of resources when their files change.
+
+A :py:class:`Reloader` watches the files of loaded resources in a
+background thread. Changes are only applied when :py:meth:`Reloader.update`
+is called on the render thread, which the main loop does at the start of
+every frame. Only the resources using a changed file are loaded again.
+
+- Reloadable programs get the new program swapped in place. Files included
+  with ``#include`` are watched as well.
+- Textures get the new image written into the existing texture.
+- Anything else, like scenes, can be reloaded with a callback.
+
+Example::
+
+    reloader = Reloader()
+    reloader.enable()
+
+    # Tracked automatically while the reloader is enabled
+    program = self.load_program("programs/terrain.glsl", reloadable=True)
+    texture = self.load_texture_2d("textures/grass.png", reloadable=True)
+
+    # Custom reloading
+    reloader.watch([scene_path], self.reload_scene)
+
+Reloading can also be enabled for a ``WindowConfig`` with the
+``--reload`` command line argument.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import weakref
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import moderngl
+
+from moderngl_window.opengl.includes import include_cache
+from moderngl_window.opengl.program import ReloadableProgram
+from moderngl_window.opengl.vao import VAO
+
+logger = logging.getLogger(__name__)
+
+#: The enabled reloader or ``None``
+current: Optional["Reloader"] = None
+
+
+def _normalize(path: Union[str, Path]) -> Path:
+    """Absolute path used to compare watched files"""
+    return Path(os.path.abspath(path))
+
+
+class FileWatcher:
+    """Watches files for changes in a background thread.
+
+    The changed files are collected until :py:meth:`changes` is called.
+    Use :py:meth:`create` to get the best watcher for the platform.
+    """
+
+    def __init__(self) -> None:
+        self._files: set[Path] = set()
+        self._changed: set[Path] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def create(cls, interval: float = 0.5) -> "FileWatcher":
+        """Create an inotify watcher on Linux or a polling watcher elsewhere.
+
+        Args:
+            interval (float): Seconds between polls if polling is used
+        """
+        if InotifyWatcher.available():
+            try:
+                return InotifyWatcher()
+            except OSError as ex:
+                logger.warning("inotify is not available, polling for changes: %s", ex)
+        return PollingWatcher(interval)
+
+    @property
+    def files(self) -> set[Path]:
+        """set: The watched files"""
+        with self._lock:
+            return set(self._files)
+
+    @property
+    def running(self) -> bool:
+        """bool: Is the background thread running?"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def watch(self, path: Union[str, Path]) -> None:
+        """Start watching a file.
+
+        Args:
+            path: The file
+        """
+        path = _normalize(path)
+        with self._lock:
+            if path not in self._files:
+                self._files.add(path)
+                self._add(path)
+
+    def unwatch(self, path: Union[str, Path]) -> None:
+        """Stop watching a file.
+
+        Args:
+            path: The file
+        """
+        path = _normalize(path)
+        with self._lock:
+            if path in self._files:
+                self._files.discard(path)
+                self._changed.discard(path)
+                self._remove(path)
+
+    def changes(self) -> set[Path]:
+        """Get and clear the files changed since the last call"""
+        with self._lock:
+            changed, self._changed = self._changed, set()
+        return changed
+
+    def start(self) -> None:
+        """Start the background thread"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="moderngl-window-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _changed_files(self, paths: Iterable[Path]) -> None:
+        """Record changed files that are watched"""
+        with self._lock:
+            self._changed.update(path for path in paths if path in self._files)
+
+    def _add(self, path: Path) -> None:
+        """Called with the lock held when a file is watched"""
+
+    def _remove(self, path: Path) -> None:
+        """Called with the lock held when a file is no longer watched"""
+
+    def _run(self) -> None:
+        """The background thread"""
+        raise NotImplementedError
+
+
+class PollingWatcher(FileWatcher):
+    """Detects changes by comparing the modification time and size of the files"""
+
+    def __init__(self, interval: float = 0.5):
+        """Create the watcher.
+
+        Args:
+            interval (float): Seconds between polls
+        """
+        super().__init__()
+        self.interval = interval
+        self._stats: dict[Path, Optional[tuple[int, int]]] = {}
+
+    def poll(self) -> None:
+        """Check all files for changes"""
+        with self._lock:
+            stats = list(self._stats.items())
+
+        changed = []
+        for path, previous in stats:
+            stat = self._stat(path)
+            if stat != previous:
+                changed.append(path)
+
+        with self._lock:
+            for path in changed:
+                if path in self._stats:
+                    self._stats[path] = self._stat(path)
+                    # A file that is being replaced can be missing for a moment
+                    if self._stats[path] is not None:
+                        self._changed.add(path)
+
+    def _add(self, path: Path) -> None:
+        self._stats[path] = self._stat(path)
+
+    def _remove(self, path: Path) -> None:
+        self._stats.pop(path, None)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def _stat(self, path: Path) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+class InotifyWatcher(FileWatcher):
+    """Receives changes from inotify on Linux.
+
+    The directories of the files are watched so files replaced by editors
+    saving to a temporary file and renaming it are detected as well.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    _EVENT = struct.Struct("iIII")
+    _libc: Optional[ctypes.CDLL] = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        libc = self._load_libc()
+        if libc is None:
+            raise OSError("Could not load libc")
+        self._libc = libc
+        self._fd = -1
+        self._descriptors: dict[Path, int] = {}
+        self._directories: dict[int, Path] = {}
+        self._open()
+
+    @classmethod
+    def available(cls) -> bool:
+        """bool: Is inotify supported on this platform?"""
+        return sys.platform.startswith("linux") and cls._load_libc() is not None
+
+    @classmethod
+    def _load_libc(cls) -> Optional[ctypes.CDLL]:
+        if cls._libc is None:
+            name = ctypes.util.find_library("c")
+            try:
+                libc = ctypes.CDLL(name, use_errno=True)
+            except OSError:
+                return None
+            if not hasattr(libc, "inotify_init1"):
+                return None
+            cls._libc = libc
+        return cls._libc
+
+    def read_events(self) -> None:
+        """Read the pending events without blocking"""
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except (BlockingIOError, OSError):
+            return
+
+        paths = []
+        offset = 0
+        with self._lock:
+            while offset + self._EVENT.size <= len(data):
+                descriptor, _, _, length = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._directories.get(descriptor)
+                if directory is not None and name:
+                    paths.append(directory / os.fsdecode(name))
+
+        self._changed_files(paths)
+
+    def start(self) -> None:
+        # The inotify instance is closed when stopped
+        if self._fd < 0:
+            self._open()
+        super().start()
+
+    def stop(self) -> None:
+        super().stop()
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        # The watches went with the inotify instance
+        self._descriptors.clear()
+        self._directories.clear()
+
+    def _open(self) -> None:
+        """Create the inotify instance and watch the directories of the watched files"""
+        assert self._libc is not None
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        with self._lock:
+            self._fd = fd
+            for path in self._files:
+                self._add(path)
+
+    def _add(self, path: Path) -> None:
+        directory = path.parent
+        if directory in self._descriptors or self._fd < 0:
+            return
+        assert self._libc is not None
+        descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.MASK)
+        if descriptor < 0:
+            errno = ctypes.get_errno()
+            logger.warning("Could not watch %s: %s", directory, os.strerror(errno))
+            return
+        self._descriptors[directory] = descriptor
+        self._directories[descriptor] = directory
+
+    def _remove(self, path: Path) -> None:
+        directory = path.parent
+        if any(file.parent == directory for file in self._files):
+            return
+        descriptor = self._descriptors.pop(directory, None)
+        if descriptor is not None and self._fd >= 0:
+            assert self._libc is not None
+            self._libc.inotify_rm_watch(self._fd, descriptor)
+            self._directories.pop(descriptor, None)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([self._fd], [], [], 0.2)
+            except (OSError, ValueError):
+                return
+            if ready:
+                self.read_events()
+
+
+class Reloader:
+    """Reloads resources on the render thread when their files change"""
+
+    def __init__(self, watcher: Optional[FileWatcher] = None):
+        """Create the reloader.
+
+        Args:
+            watcher (FileWatcher): The watcher to use. The best watcher for the platform if not set
+        """
+        self.watcher = watcher or FileWatcher.create()
+        self._programs: weakref.WeakKeyDictionary[ReloadableProgram, set[Path]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._textures: weakref.WeakKeyDictionary[Any, set[Path]] = weakref.WeakKeyDictionary()
+        self._callbacks: list[tuple[set[Path], Callable[[set[Path]], Any]]] = []
+        #: int: Number of resources reloaded
+        self.reloads = 0
+        #: int: Number of reloads that failed. The previous resource is kept
+        self.failures = 0
+
+    def enable(self) -> None:
+        """Make this the reloader the main loop updates and start watching"""
+        global current
+        if current is not None and current is not self:
+            current.disable()
+        current = self
+        self.watcher.start()
+
+    def disable(self) -> None:
+        """Stop watching and updating"""
+        global current
+        if current is self:
+            current = None
+        self.watcher.stop()
+
+    def track_program(self, program: ReloadableProgram) -> None:
+        """Reload a program when its files or included files change.
+
+        Args:
+            program (ReloadableProgram): The program
+        """
+        files = self._program_files(program)
+        self._programs[program] = files
+        self._watch(files)
+
+    def track_texture(self, texture: Any) -> None:
+        """Reload a texture loaded from a file when the file changes.
+
+        Cube maps are reloaded when any of the face files change.
+
+        Args:
+            texture: A texture loaded by the texture loaders
+        Raises:
+            ValueError: If the texture was not loaded from files
+        """
+        files = self._texture_files(texture)
+        if not files:
+            raise ValueError("Texture {} was not loaded from a file".format(texture))
+        self._textures[texture] = files
+        self._watch(files)
+
+    def watch(
+        self, paths: Iterable[Union[str, Path]], callback: Callable[[set[Path]], Any]
+    ) -> None:
+        """Call a function on the render thread when files change.
+
+        Args:
+            paths: The files
+            callback: Called with the changed files
+        """
+        files = {_normalize(path) for path in paths}
+        self._callbacks.append((files, callback))
+        self._watch(files)
+
+    def update(self) -> int:
+        """Reload the resources using files changed since the last update.
+
+        Call this on the render thread between frames.
+
+        Returns:
+            int: Number of resources reloaded
+        """
+        changed = self.watcher.changes()
+        if not changed:
+            return 0
+
+        for path in changed:
+            include_cache.invalidate(path)
+
+        reloads = 0
+        programs = [program for program, files in self._programs.items() if files & changed]
+        for program in programs:
+            reloads += self._reload_program(program)
+        if programs:
+            VAO.release_stale_instances()
+
+        textures = [texture for texture, files in self._textures.items() if files & changed]
+        for texture in textures:
+            reloads += self._reload_texture(texture)
+
+        for files, callback in list(self._callbacks):
+            if files & changed:
+                try:
+                    callback(files & changed)
+                    reloads += 1
+                except Exception:
+                    self.failures += 1
+                    logger.exception("Reloading %s failed", sorted(files & changed))
+
+        self.reloads += reloads
+        return reloads
+
+    def _watch(self, files: set[Path]) -> None:
+        for path in files:
+            self.watcher.watch(path)
+
+    def _program_files(self, program: ReloadableProgram) -> set[Path]:
+        """The source files of a program and the files they include"""
+        meta = program.meta
+        assert meta.loader_cls is not None, "The program was not loaded by a loader"
+        loader = meta.loader_cls(meta)
+        files: set[Path] = set()
+        for path in (
+            meta.path,
+            meta.vertex_shader,
+            meta.geometry_shader,
+            meta.fragment_shader,
+            meta.tess_control_shader,
+            meta.tess_evaluation_shader,
+            meta.compute_shader,
+        ):
+            if not path:
+                continue
+            resolved = loader.find_program(path)
+            if resolved is None:
+                continue
+            files.add(_normalize(resolved))
+            for include in include_cache.dependencies(resolved):
+                if isinstance(include, (str, Path)):
+                    files.add(_normalize(include))
+        return files
+
+    def _texture_files(self, texture: Any) -> set[Path]:
+        """The files a texture was loaded from"""
+        meta = (texture.extra or {}).get("meta")
+        if meta is None:
+            return set()
+        if meta.resolved_path is not None:
+            return {_normalize(meta.resolved_path)}
+        if meta.loader_cls is None:
+            return set()
+        # Cube maps are loaded from one file per face
+        loader = meta.loader_cls(meta)
+        files = set()
+        for path in (meta.pos_x, meta.pos_y, meta.pos_z, meta.neg_x, meta.neg_y, meta.neg_z):
+            resolved = loader.find_texture(path)
+            if resolved is not None:
+                files.add(_normalize(resolved))
+        return files
+
+    def _reload_program(self, program: ReloadableProgram) -> int:
+        """Load the program again and swap it in place"""
+        meta = program.meta
+        assert meta.loader_cls is not None
+        try:
+            # The loader returns a plain program as reloadable was disabled when wrapping it
+            new_program = meta.loader_cls(meta).load()
+        except Exception:
+            self.failures += 1
+            logger.exception("Reloading program %s failed. Keeping the previous one", program.name)
+            return 0
+
+        old_program = program.program
+        program.program = new_program
+        old_program.release()
+        logger.info("Reloaded program %s", program.name)
+
+        # The includes may have changed
+        files = self._program_files(program)
+        self._programs[program] = files
+        self._watch(files)
+        return 1
+
+    def _reload_texture(self, texture: Any) -> int:
+        """Load the texture again and write it into the existing texture"""
+        meta = texture.extra["meta"]
+        name = meta.resolved_path or meta.label or meta.pos_x
+        try:
+            new_texture = meta.loader_cls(meta).load()
+        except Exception:
+            self.failures += 1
+            logger.exception("Reloading texture %s failed", name)
+            return 0
+
+        try:
+            if (
+                type(new_texture) is not type(texture)
+                or new_texture.size != texture.size
+                or new_texture.components != texture.components
+                or new_texture.dtype != texture.dtype
+            ):
+                self.failures += 1
+                logger.warning(
+                    "Texture %s changed format or size and can't be reloaded in place", name
+                )
+                return 0
+
+            if isinstance(texture, moderngl.TextureCube):
+                for face in range(6):
+                    texture.write(face, new_texture.read(face))
+            else:
+                texture.write(new_texture.read())
+            if meta.mipmap:
+                texture.build_mipmaps()
+        finally:
+            new_texture.release()
+
+        logger.info("Reloaded texture %s", name)
+        return 1
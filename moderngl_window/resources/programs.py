@@ -1,8 +1,15 @@
+import logging
+from collections.abc import Iterable
+from typing import Any, Generator
+
 import moderngl
 
 from moderngl_window.meta import ProgramDescription, ResourceDescription
+from moderngl_window.opengl.program import ProgramBatchError
 from moderngl_window.resources.base import BaseRegistry
 
+logger = logging.getLogger(__name__)
+
 
 class Programs(BaseRegistry):
     """Handle program loading"""
@@ -38,5 +45,79 @@ class Programs(BaseRegistry):
         """
         return super().load(meta)
 
+    def load_batch(self, descriptions: Iterable[ProgramDescription]) -> list[Any]:
+        """Loads several shader programs.
+
+        All sources are read and their includes resolved before the first
+        program is created, so missing files are reported before any time
+        is spent compiling. A program failing to compile does not stop the
+        batch. The errors of all failing programs are raised together
+        after the remaining programs were created. The created programs
+        are released in that case so the batch can be loaded again.
+
+        Args:
+            descriptions: The resource descriptions
+        Returns:
+            list: The programs in the same order as the descriptions
+        Raises:
+            moderngl.Error: If a single program failed to compile or link
+            ProgramBatchError: If several programs failed to compile or link.
+                This is a subclass of ``moderngl.Error``
+        """
+        loaders = []
+        sources = []
+        for meta in descriptions:
+            self._check_meta(meta)
+            self.resolve_loader(meta)
+            assert meta.loader_cls is not None, f"Could not load {meta}, no loader"
+            loader: Any = meta.loader_cls(meta)
+            loaders.append(loader)
+            # Read and preprocess every source first. Compute shaders and loaders
+            # without separate steps are loaded as usual in the second pass
+            if hasattr(loader, "create") and (meta.path or meta.vertex_shader):
+                sources.append(loader.load_shaders())
+            else:
+                sources.append(None)
+
+        # Creating a reloadable program clears the flag on its description
+        reloadable = [loader.meta.reloadable for loader in loaders]
+        created: list[Any] = []
+        errors: list[tuple[str, moderngl.Error]] = []
+        for loader, shaders in zip(loaders, sources):
+            try:
+                created.append(loader.load() if shaders is None else loader.create(shaders))
+            except moderngl.Error as ex:
+                meta = loader.meta
+                errors.append((meta.path or meta.vertex_shader or meta.compute_shader, ex))
+
+        if errors:
+            for prog in created:
+                getattr(prog, "program", prog).release()
+            for loader, flag in zip(loaders, reloadable):
+                loader.meta.reloadable = flag
+            if len(errors) == 1:
+                raise errors[0][1]
+            raise ProgramBatchError(
+                "{} of {} programs failed to load\n\n{}".format(
+                    len(errors),
+                    len(loaders),
+                    "\n\n".join("{}:\n{}".format(name, ex) for name, ex in errors),
+                )
+            )
+
+        logger.debug("Loaded a batch of %s programs", len(created))
+        return created
+
+    def load_pool(self) -> Generator[tuple[ResourceDescription, Any], None, None]:
+        """Loads all added program descriptions in a batch.
+
+        See :py:meth:`load_batch`.
+
+        Returns:
+            Generator of (meta, program) tuples
+        """
+        resources, self._resources = self._resources, []
+        yield from zip(resources, self.load_batch(resources))  # type: ignore
+
 
 programs = Programs()
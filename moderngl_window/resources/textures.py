@@ -2,13 +2,17 @@
 Shader Registry
 """
 
+import logging
 from typing import Union
 
 import moderngl
 
+from moderngl_window import reloader
 from moderngl_window.meta import ResourceDescription, TextureDescription
 from moderngl_window.resources.base import BaseRegistry
 
+logger = logging.getLogger(__name__)
+
 TextureAny = Union[
     moderngl.Texture,
     moderngl.TextureArray,
@@ -33,6 +37,11 @@ class Textures(BaseRegistry):
             moderngl.Texture: 2d texture
         Returns:
             moderngl.TextureArray: texture array if ``layers`` is supplied
+
+        Textures described with ``reloadable=True`` are reloaded when
+        their file changes while a :py:class:`~moderngl_window.reloader.Reloader`
+        is enabled. Textures not loaded from files can't be reloaded
+        and are only logged.
         """
         texture = super().load(meta)
         assert (
@@ -41,6 +50,11 @@ class Textures(BaseRegistry):
             or isinstance(texture, moderngl.TextureCube)
             or isinstance(texture, moderngl.Texture3D)
         ), f"{meta} did not load a texture. Please correct it"
+        if meta.attrs.get("reloadable") and reloader.current is not None:
+            try:
+                reloader.current.track_texture(texture)
+            except ValueError as ex:
+                logger.warning("Texture %s is not reloadable: %s", meta.label or meta.path, ex)
         return texture
 
 
@@ -1,21 +1,27 @@
 from .camera import Camera as Camera
 from .camera import KeyboardCamera as KeyboardCamera
 from .camera import OrbitCamera as OrbitCamera
+from .indirect import IndirectRenderer as IndirectRenderer
 from .material import Material as Material
 from .material import MaterialTexture as MaterialTexture
 from .mesh import Mesh as Mesh
 from .node import Node as Node
 from .programs import MeshProgram as MeshProgram
+from .programs import VariantMeshProgram as VariantMeshProgram
 from .scene import Scene as Scene
+from .uniforms import SceneUniforms as SceneUniforms
 
 __all__ = [
     "Camera",
     "KeyboardCamera",
     "OrbitCamera",
+    "IndirectRenderer",
     "Material",
     "MaterialTexture",
     "Mesh",
     "Node",
     "MeshProgram",
+    "VariantMeshProgram",
     "Scene",
+    "SceneUniforms",
 ]
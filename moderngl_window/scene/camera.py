@@ -401,7 +401,7 @@ class KeyboardCamera(Camera):
             dx: Relative mouse position change on x
             dy: Relative mouse position change on y
         """
-        now = time.time()
+        now = time.perf_counter()
         delta = now - self._last_rot_time
         self._last_rot_time = now
 
@@ -428,7 +428,7 @@ class KeyboardCamera(Camera):
     def matrix(self) -> glm.mat4:
         """glm.mat4x4: The current view matrix for the camera"""
         # Use separate time in camera so we can move it when the demo is paused
-        now = time.time()
+        now = time.perf_counter()
         # If the camera has been inactive for a while, a large time delta
         # can suddenly move the camera far away from the scene
         t = max(now - self._last_time, 0)
@@ -0,0 +1,403 @@
+"""
+GPU driven rendering of static scene geometry using multi-draw indirect.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Optional
+
+import glm
+import moderngl
+import numpy
+import numpy.typing as npt
+
+import moderngl_window as mglw
+from moderngl_window.meta import ProgramDescription
+from moderngl_window.opengl.vao import VAO
+from moderngl_window.resources.programs import programs
+
+if TYPE_CHECKING:
+    from .mesh import Mesh
+    from .node import Node
+    from .scene import Scene
+
+logger = logging.getLogger(__name__)
+
+# Per draw data in the draw storage buffer (std430)
+DRAW_DATA_DTYPE = numpy.dtype([("model", "f4", (16,)), ("color", "f4", (4,))])
+# Per draw world space bounding box used for culling (std430)
+DRAW_BOUNDS_DTYPE = numpy.dtype([("bbox_min", "f4", (4,)), ("bbox_max", "f4", (4,))])
+# Work group size of the culling compute shader
+CULL_GROUP_SIZE = 64
+
+
+def frustum_planes(matrix: glm.mat4) -> npt.NDArray[numpy.float32]:
+    """Extract the six normalized frustum planes from a view projection matrix.
+
+    Args:
+        matrix (glm.mat4): Projection matrix multiplied by the camera matrix
+    Returns:
+        numpy.ndarray: (6, 4) array of ``(a, b, c, d)`` planes pointing inwards
+    """
+    # glm matrices are column major
+    rows = numpy.array(matrix.to_list(), dtype="f8").T
+    planes = numpy.array(
+        [
+            rows[3] + rows[0],
+            rows[3] - rows[0],
+            rows[3] + rows[1],
+            rows[3] - rows[1],
+            rows[3] + rows[2],
+            rows[3] - rows[2],
+        ]
+    )
+    planes /= numpy.linalg.norm(planes[:, :3], axis=1)[:, None]
+    return planes.astype("f4")
+
+
+class IndirectBatch:
+    """Static geometry sharing vertex layout and draw mode.
+
+    The vertex and index data of all meshes in the batch is merged into
+    shared buffers and the entire batch is rendered with one
+    ``render_indirect`` call.
+    """
+
+    def __init__(self, layout: tuple[Any, ...], mode: int, has_normals: bool):
+        """Create an empty batch.
+
+        Args:
+            layout (tuple): Buffer formats and attribute names shared by all meshes
+            mode (int): The draw mode
+            has_normals (bool): Does the geometry have normals?
+        """
+        self.layout = layout
+        self.mode = mode
+        self.has_normals = has_normals
+        self.entries: list[tuple[Node, Mesh]] = []
+        self.vao: Optional[VAO] = None
+        self.commands = numpy.zeros((0, 5), dtype="u4")
+        self.command_buffer: Optional[moderngl.Buffer] = None
+        self.source_buffer: Optional[moderngl.Buffer] = None
+        # Merged vertex and index buffers owned by the batch
+        self._buffers: list[moderngl.Buffer] = []
+
+    @property
+    def draw_count(self) -> int:
+        """int: Number of draw commands in the batch"""
+        return len(self.entries)
+
+    def build(self, draw_ids: moderngl.Buffer, first_draw: int) -> None:
+        """Merge the geometry and create the draw commands.
+
+        Args:
+            draw_ids (moderngl.Buffer): Per instance buffer with draw ids
+            first_draw (int): The global draw id of the first entry
+        """
+        ctx = mglw.ctx()
+        slots: list[list[bytes]] = [[] for _ in self.layout]
+        indices: list[npt.NDArray[numpy.uint32]] = []
+        self.commands = numpy.zeros((self.draw_count, 5), dtype="u4")
+
+        first_index = 0
+        base_vertex = 0
+        for i, (_, mesh) in enumerate(self.entries):
+            assert mesh.vao is not None, "Batched meshes must have a vao"
+            vertices = mesh.vao.buffers[0].vertices
+            for slot, buffer_info in zip(slots, mesh.vao.buffers):
+                slot.append(buffer_info.buffer.read())
+
+            mesh_indices = mesh.vao.read_indices()
+            if mesh_indices is None:
+                mesh_indices = numpy.arange(vertices, dtype="u4")
+            indices.append(mesh_indices)
+
+            self.commands[i] = (len(mesh_indices), 1, first_index, base_vertex, first_draw + i)
+            first_index += len(mesh_indices)
+            base_vertex += vertices
+
+        self.vao = VAO("indirect_batch", mode=self.mode)
+        for (buffer_format, attributes), data in zip(self.layout, slots):
+            self._buffers.append(self.vao.buffer(b"".join(data), buffer_format, list(attributes)))
+
+        self.vao.buffer(draw_ids, "1u/i", "in_draw_id")
+        self._buffers.append(ctx.buffer(numpy.concatenate(indices).tobytes()))
+        self.vao.index_buffer(self._buffers[-1], index_element_size=4)
+
+        self.command_buffer = ctx.buffer(self.commands.tobytes())
+        self.source_buffer = ctx.buffer(self.commands.tobytes())
+
+    def release(self) -> None:
+        """Release the merged geometry and command buffers"""
+        if self.vao is not None:
+            # The draw id buffer is shared between batches and not released here
+            self.vao.release(buffer=False)
+            self.vao = None
+
+        for buffer in self._buffers:
+            buffer.release()
+        self._buffers = []
+
+        if self.command_buffer is not None:
+            self.command_buffer.release()
+            self.command_buffer = None
+
+        if self.source_buffer is not None:
+            self.source_buffer.release()
+            self.source_buffer = None
+
+    def __repr__(self) -> str:
+        return "<IndirectBatch draws={} normals={}>".format(self.draw_count, self.has_normals)
+
+
+class IndirectRenderer:
+    """Renders the static meshes of a scene using multi-draw indirect.
+
+    Meshes sharing a vertex layout are merged into shared vertex and index
+    buffers. Per draw model matrices and material colors are stored in a
+    shader storage buffer indexed by the draw id, and each batch is rendered
+    with a single ``render_indirect`` call. Optionally a compute shader
+    frustum culls the draw commands on the GPU before rendering.
+
+    Materials are rendered using their base color only since textures cannot
+    vary between draws in a single indirect call. Requires OpenGL 4.3.
+
+    Example::
+
+        renderer = IndirectRenderer(scene)
+        renderer.render(projection_matrix, camera_matrix, cull=True)
+    """
+
+    def __init__(self, scene: Scene, program: Optional[moderngl.Program] = None):
+        """Merge the scene meshes into indirect batches.
+
+        Args:
+            scene (Scene): The scene to render
+        Keyword Args:
+            program (moderngl.Program): Custom program used for all batches.
+                Must read ``in_draw_id`` and the draw storage buffer at binding 0.
+        """
+        self.scene = scene
+        self.batches: list[IndirectBatch] = []
+
+        if program is not None:
+            self._programs = {True: program, False: program}
+        else:
+            self._programs = {
+                True: programs.load(
+                    ProgramDescription(
+                        path="scene_default/indirect.glsl", defines={"HAS_NORMALS": "1"}
+                    )
+                ),
+                False: programs.load(ProgramDescription(path="scene_default/indirect.glsl")),
+            }
+
+        self._cull_program: Optional[moderngl.ComputeShader] = None
+        self._draw_ids: Optional[moderngl.Buffer] = None
+        self._draw_buffer: Optional[moderngl.Buffer] = None
+        self._bounds_buffer: Optional[moderngl.Buffer] = None
+
+        self.build()
+
+    @property
+    def ctx(self) -> moderngl.Context:
+        """moderngl.Context: The current context"""
+        return mglw.ctx()
+
+    @property
+    def draw_count(self) -> int:
+        """int: Total number of draws in all batches"""
+        return sum(batch.draw_count for batch in self.batches)
+
+    def build(self) -> None:
+        """(Re)build all batches from the current scene"""
+        self.release()
+
+        batches: dict[tuple[Any, ...], IndirectBatch] = {}
+        for node, mesh in self._static_meshes():
+            assert mesh.vao is not None
+            layout = tuple(
+                (buffer_info.buffer_format, tuple(buffer_info.attributes))
+                for buffer_info in mesh.vao.buffers
+            )
+            key = (mesh.vao.mode, layout)
+            batch = batches.get(key)
+            if batch is None:
+                batch = IndirectBatch(layout, mesh.vao.mode, mesh.has_normals())
+                batches[key] = batch
+            batch.entries.append((node, mesh))
+
+        self.batches = list(batches.values())
+        if not self.batches:
+            return
+
+        self._draw_ids = self.ctx.buffer(numpy.arange(self.draw_count, dtype="u4").tobytes())
+        first_draw = 0
+        for batch in self.batches:
+            batch.build(self._draw_ids, first_draw)
+            first_draw += batch.draw_count
+
+        self._draw_buffer = self.ctx.buffer(reserve=self.draw_count * DRAW_DATA_DTYPE.itemsize)
+        self._bounds_buffer = self.ctx.buffer(reserve=self.draw_count * DRAW_BOUNDS_DTYPE.itemsize)
+        self.update_matrices()
+
+        logger.info("Merged %s meshes into %s indirect batches", self.draw_count, len(self.batches))
+
+    def update_matrices(self) -> None:
+        """Upload the node matrices, material colors and bounding boxes.
+
+        Call this when the scene matrix or node matrices have changed.
+        """
+        if self._draw_buffer is None or self._bounds_buffer is None:
+            return
+
+        draw_data = numpy.zeros(self.draw_count, dtype=DRAW_DATA_DTYPE)
+        bounds = numpy.zeros(self.draw_count, dtype=DRAW_BOUNDS_DTYPE)
+
+        index = 0
+        for batch in self.batches:
+            for node, mesh in batch.entries:
+                matrix = node.matrix_global if node.matrix_global is not None else glm.mat4()
+                draw_data["model"][index] = numpy.frombuffer(matrix.to_bytes(), dtype="f4")
+                draw_data["color"][index] = mesh.material.color if mesh.material else 1.0
+                bounds[index] = self._world_bbox(mesh, matrix)
+                index += 1
+
+        self._draw_buffer.write(draw_data.tobytes())
+        self._bounds_buffer.write(bounds.tobytes())
+
+    def render(
+        self,
+        projection_matrix: glm.mat4,
+        camera_matrix: glm.mat4,
+        cull: bool = False,
+    ) -> None:
+        """Render all batches.
+
+        Args:
+            projection_matrix (glm.mat4): projection matrix
+            camera_matrix (glm.mat4): camera matrix
+        Keyword Args:
+            cull (bool): Frustum cull the draws on the GPU before rendering
+        """
+        if not self.batches or self._draw_buffer is None:
+            return
+
+        if cull:
+            self.cull(projection_matrix * camera_matrix)
+
+        self._draw_buffer.bind_to_storage_buffer(0)
+
+        for program in set(self._programs.values()):
+            program["m_proj"].write(projection_matrix)
+            program["m_cam"].write(camera_matrix)
+
+        for batch in self.batches:
+            assert batch.vao is not None and batch.command_buffer is not None
+            batch.vao.render_indirect(
+                self._programs[batch.has_normals],
+                batch.command_buffer,
+                count=batch.draw_count,
+            )
+
+    def cull(self, matrix: glm.mat4) -> None:
+        """Frustum cull the draw commands of all batches with a compute shader.
+
+        Culled draws get an instance count of zero. Draws stay culled until
+        the next call to this method or :py:meth:`reset_commands`.
+
+        Args:
+            matrix (glm.mat4): Projection matrix multiplied by the camera matrix
+        """
+        if self._bounds_buffer is None:
+            return
+
+        if self._cull_program is None:
+            self._cull_program = programs.load(
+                ProgramDescription(compute_shader="scene_default/indirect_cull.glsl")
+            )
+
+        cull_program = self._cull_program
+        assert cull_program is not None
+        cull_program["planes"].write(frustum_planes(matrix).tobytes())
+        self._bounds_buffer.bind_to_storage_buffer(3)
+
+        for batch in self.batches:
+            assert batch.source_buffer is not None and batch.command_buffer is not None
+            cull_program["draw_count"].value = batch.draw_count
+            batch.source_buffer.bind_to_storage_buffer(1)
+            batch.command_buffer.bind_to_storage_buffer(2)
+            groups = (batch.draw_count + CULL_GROUP_SIZE - 1) // CULL_GROUP_SIZE
+            cull_program.run(group_x=groups)
+
+        self.ctx.memory_barrier(moderngl.COMMAND_BARRIER_BIT | moderngl.SHADER_STORAGE_BARRIER_BIT)
+
+    def reset_commands(self) -> None:
+        """Restore the unculled draw commands for all batches"""
+        for batch in self.batches:
+            assert batch.command_buffer is not None
+            batch.command_buffer.write(batch.commands.tobytes())
+
+    def release(self) -> None:
+        """Release all merged buffers"""
+        for batch in self.batches:
+            batch.release()
+        self.batches = []
+
+        for buffer in (self._draw_ids, self._draw_buffer, self._bounds_buffer):
+            if buffer is not None:
+                buffer.release()
+
+        self._draw_ids = None
+        self._draw_buffer = None
+        self._bounds_buffer = None
+
+    def _static_meshes(self) -> list[tuple[Node, Mesh]]:
+        """Collect the nodes with meshes that can be merged"""
+        result: list[tuple[Node, Mesh]] = []
+        stack = list(reversed(self.scene.root_nodes))
+        while stack:
+            node = stack.pop()
+            stack.extend(reversed(node.children))
+
+            mesh = node.mesh
+            if mesh is None or mesh.vao is None or not mesh.vao.buffers:
+                continue
+
+            if "POSITION" not in mesh.attributes:
+                logger.warning("Mesh '%s' has no positions. Skipping.", mesh.name)
+                continue
+
+            if any(
+                buffer_info.per_instance or any(f.per_instance for f in buffer_info.attrib_formats)
+                for buffer_info in mesh.vao.buffers
+            ):
+                logger.warning("Mesh '%s' has instanced attributes. Skipping.", mesh.name)
+                continue
+
+            result.append((node, mesh))
+
+        return result
+
+    @staticmethod
+    def _world_bbox(mesh: Mesh, matrix: glm.mat4) -> tuple[Any, Any]:
+        """Transform all eight corners of the mesh bbox into world space"""
+        bmin, bmax = mesh.bbox_min, mesh.bbox_max
+        corners = numpy.array(
+            [
+                [x, y, z, 1.0]
+                for x in (bmin.x, bmax.x)
+                for y in (bmin.y, bmax.y)
+                for z in (bmin.z, bmax.z)
+            ],
+            dtype="f4",
+        )
+        world = corners @ numpy.array(matrix.to_list(), dtype="f4")
+        return (
+            (*world[:, :3].min(axis=0), 1.0),
+            (*world[:, :3].max(axis=0), 1.0),
+        )
+
+    def __repr__(self) -> str:
+        return "<IndirectRenderer batches={} draws={}>".format(len(self.batches), self.draw_count)
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Any, Optional
 import glm
 import moderngl
 
+from moderngl_window import profiler
+from moderngl_window.opengl.program import UniformBinder
 from moderngl_window.opengl.vao import VAO
 
 from .material import Material
@@ -65,13 +67,14 @@ class Mesh:
             camera_matrix (bytes): camera_matrix
         """
         if self.mesh_program is not None:
-            self.mesh_program.draw(
-                self,
-                projection_matrix=projection_matrix,
-                model_matrix=model_matrix,
-                camera_matrix=camera_matrix,
-                time=time,
-            )
+            with profiler.scope("MeshProgram.draw", gpu=True):
+                self.mesh_program.draw(
+                    self,
+                    projection_matrix=projection_matrix,
+                    model_matrix=model_matrix,
+                    camera_matrix=camera_matrix,
+                    time=time,
+                )
 
     def draw_bbox(
         self,
@@ -90,11 +93,12 @@ class Mesh:
             program: The moderngl.Program rendering the bounding box
             vao: The vao mesh for the bounding box
         """
-        program["m_proj"].write(proj_matrix.to_bytes())
-        program["m_model"].write(model_matrix.to_bytes())
-        program["m_cam"].write(cam_matrix.to_bytes())
-        program["bb_min"].write(self.bbox_min.to_bytes())
-        program["bb_max"].write(self.bbox_max.to_bytes())
+        binder = UniformBinder.get(program)
+        binder.write("m_proj", proj_matrix)
+        binder.write("m_model", model_matrix)
+        binder.write("m_cam", cam_matrix)
+        binder.write("bb_min", self.bbox_min)
+        binder.write("bb_max", self.bbox_max)
         vao.render(program)
 
     def draw_wireframe(
@@ -107,8 +111,9 @@ class Mesh:
         program: The moderngl.Program rendering the wireframe
         """
         assert self.vao is not None, "Can not draw the wireframe, vao is empty"
-        program["m_proj"].write(proj_matrix.to_bytes())
-        program["m_model"].write(model_matrix.to_bytes())
+        binder = UniformBinder.get(program)
+        binder.write("m_proj", proj_matrix)
+        binder.write("m_model", model_matrix)
         self.vao.render(program)
 
     def add_attribute(self, attr_type: str, name: str, components: int) -> None:
@@ -60,7 +60,7 @@ class Node:
         return self._mesh
 
     @mesh.setter
-    def mesh(self, value: Mesh) -> None:
+    def mesh(self, value: Optional[Mesh]) -> None:
         self._mesh = value
 
     @property
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterable
 from typing import Any, Optional
 
 import glm
@@ -9,9 +10,12 @@ import moderngl
 import moderngl_window
 from moderngl_window.conf import settings
 from moderngl_window.meta import ProgramDescription
+from moderngl_window.opengl.program import UniformBinder
+from moderngl_window.opengl.variants import ProgramVariants
 from moderngl_window.resources.programs import programs
 
 from .mesh import Mesh
+from .uniforms import SceneUniforms
 
 settings.PROGRAM_DIRS.append(os.path.join(os.path.dirname(__file__), "programs"))
 
@@ -21,6 +25,11 @@ class MeshProgram:
     Describes how a mesh is rendered using a specific shader program
     """
 
+    #: bool: The program uses the ``FrameData`` and ``ObjectData`` blocks of
+    #: :py:class:`~moderngl_window.scene.SceneUniforms`. The scene only writes
+    #: the per-object data for meshes drawn by these programs
+    scene_uniforms = False
+
     def __init__(self, program: Optional[moderngl.Program] = None, **kwargs: Any) -> None:
         """Initialize.
 
@@ -34,6 +43,12 @@ class MeshProgram:
         """moderngl.Context: The current context"""
         return moderngl_window.ctx()
 
+    @property
+    def binder(self) -> UniformBinder:
+        """UniformBinder: Cached uniform writes for the program"""
+        assert self.program is not None, "There is no program"
+        return UniformBinder.get(self.program)
+
     def draw(
         self,
         mesh: Mesh,
@@ -54,9 +69,10 @@ class MeshProgram:
         """
         assert self.program is not None, "There is no program to draw"
         assert mesh.vao is not None, "There is no vao to render"
-        self.program["m_proj"].write(projection_matrix)
-        self.program["m_mv"].write(model_matrix)
-        self.program["m_cam"].write(camera_matrix)
+        binder = self.binder
+        binder.write("m_proj", projection_matrix)
+        binder.write("m_mv", model_matrix)
+        binder.write("m_cam", camera_matrix)
         mesh.vao.render(self.program)
 
     def apply(self, mesh: Mesh) -> MeshProgram | None:
@@ -75,9 +91,13 @@ class MeshProgram:
 class VertexColorProgram(MeshProgram):
     """Vertex color program"""
 
+    scene_uniforms = True
+
     def __init__(self, program: Optional[moderngl.Program] = None, **kwargs: Any) -> None:
         super().__init__(program=None)
         self.program = programs.load(ProgramDescription(path="scene_default/vertex_color.glsl"))
+        self.uniforms = SceneUniforms.get(self.ctx)
+        self.uniforms.setup(self.program)
 
     def draw(
         self,
@@ -89,9 +109,7 @@ class VertexColorProgram(MeshProgram):
     ) -> None:
         assert self.program is not None, "There is no program to draw"
         assert mesh.vao is not None, "There is no vao to render"
-        self.program["m_proj"].write(projection_matrix)
-        self.program["m_model"].write(model_matrix)
-        self.program["m_cam"].write(camera_matrix)
+        self.uniforms.use(mesh, projection_matrix, model_matrix, camera_matrix)
         mesh.vao.render(self.program)
 
     def apply(self, mesh: Mesh) -> Optional[MeshProgram]:
@@ -110,9 +128,13 @@ class VertexColorProgram(MeshProgram):
 class ColorLightProgram(MeshProgram):
     """Simple color program with light"""
 
+    scene_uniforms = True
+
     def __init__(self, program: Optional[moderngl.Program] = None, **kwargs: Any) -> None:
         super().__init__(program=None)
         self.program = programs.load(ProgramDescription(path="scene_default/color_light.glsl"))
+        self.uniforms = SceneUniforms.get(self.ctx)
+        self.uniforms.setup(self.program)
 
     def draw(
         self,
@@ -124,20 +146,12 @@ class ColorLightProgram(MeshProgram):
     ) -> None:
         assert self.program is not None, "There is no program to draw"
         assert mesh.vao is not None, "There is no vao to render"
-        if mesh.material is not None:
-            # if mesh.material.double_sided:
-            #     self.ctx.disable(moderngl.CULL_FACE)
-            # else:
-            #     self.ctx.enable(moderngl.CULL_FACE)
-
-            if mesh.material.color:
-                self.program["color"].value = tuple(mesh.material.color)
-            else:
-                self.program["color"].value = (1.0, 1.0, 1.0, 1.0)
-
-        self.program["m_proj"].write(projection_matrix)
-        self.program["m_model"].write(model_matrix)
-        self.program["m_cam"].write(camera_matrix)
+        # if mesh.material is not None and mesh.material.double_sided:
+        #     self.ctx.disable(moderngl.CULL_FACE)
+        # else:
+        #     self.ctx.enable(moderngl.CULL_FACE)
+
+        self.uniforms.use(mesh, projection_matrix, model_matrix, camera_matrix)
         mesh.vao.render(self.program)
 
     def apply(self, mesh: Mesh) -> MeshProgram | None:
@@ -153,9 +167,13 @@ class ColorLightProgram(MeshProgram):
 class TextureProgram(MeshProgram):
     """Plan textured"""
 
+    scene_uniforms = True
+
     def __init__(self, program: Optional[moderngl.Program] = None, **kwargs: Any) -> None:
         super().__init__(program=None)
         self.program = programs.load(ProgramDescription(path="scene_default/texture.glsl"))
+        self.uniforms = SceneUniforms.get(self.ctx)
+        self.uniforms.setup(self.program)
 
     def draw(
         self,
@@ -176,9 +194,7 @@ class TextureProgram(MeshProgram):
         ), "The material texture is not linked to a texture, so it can not be rendered"
 
         mesh.material.mat_texture.texture.use()
-        self.program["m_proj"].write(projection_matrix)
-        self.program["m_model"].write(model_matrix)
-        self.program["m_cam"].write(camera_matrix)
+        self.uniforms.use(mesh, projection_matrix, model_matrix, camera_matrix)
         mesh.vao.render(self.program)
 
     def apply(self, mesh: Mesh) -> Optional[MeshProgram]:
@@ -203,11 +219,15 @@ class TextureProgram(MeshProgram):
 class TextureVertexColorProgram(MeshProgram):
     """textured object with vertex color"""
 
+    scene_uniforms = True
+
     def __init__(self, program: Optional[moderngl.Program] = None, **kwargs: Any) -> None:
         super().__init__(program=None)
         self.program = programs.load(
             ProgramDescription(path="scene_default/vertex_color_texture.glsl")
         )
+        self.uniforms = SceneUniforms.get(self.ctx)
+        self.uniforms.setup(self.program)
 
     def draw(
         self,
@@ -228,9 +248,7 @@ class TextureVertexColorProgram(MeshProgram):
         ), "The material texture is not linked to a texture, so it can not be rendered"
 
         mesh.material.mat_texture.texture.use()
-        self.program["m_proj"].write(projection_matrix)
-        self.program["m_model"].write(model_matrix)
-        self.program["m_cam"].write(camera_matrix)
+        self.uniforms.use(mesh, projection_matrix, model_matrix, camera_matrix)
         mesh.vao.render(self.program)
 
     def apply(self, mesh: Mesh) -> MeshProgram | None:
@@ -257,9 +275,14 @@ class TextureLightProgram(MeshProgram):
     Simple texture program
     """
 
+    scene_uniforms = True
+
     def __init__(self, program: Optional[moderngl.Program] = None, **kwargs: Any) -> None:
         super().__init__(program=None)
         self.program = programs.load(ProgramDescription(path="scene_default/texture_light.glsl"))
+        self.program["texture0"].value = 0
+        self.uniforms = SceneUniforms.get(self.ctx)
+        self.uniforms.setup(self.program)
 
     def draw(
         self,
@@ -285,10 +308,7 @@ class TextureLightProgram(MeshProgram):
         #     self.ctx.enable(moderngl.CULL_FACE)
 
         mesh.material.mat_texture.texture.use()
-        self.program["texture0"].value = 0
-        self.program["m_proj"].write(projection_matrix)
-        self.program["m_model"].write(model_matrix)
-        self.program["m_cam"].write(camera_matrix)
+        self.uniforms.use(mesh, projection_matrix, model_matrix, camera_matrix)
         mesh.vao.render(self.program)
 
     def apply(self, mesh: Mesh) -> MeshProgram | None:
@@ -311,14 +331,111 @@ class TextureLightColorProgram:
     pass
 
 
+NORMALS = "NORMALS"
+TEXTURE = "TEXTURE"
+VERTEX_COLOR = "VERTEX_COLOR"
+
+_NONE: frozenset[str] = frozenset()
+_NORMALS = frozenset((NORMALS,))
+_TEXTURE = frozenset((TEXTURE,))
+_VERTEX_COLOR = frozenset((VERTEX_COLOR,))
+_TEXTURE_NORMALS = frozenset((TEXTURE, NORMALS))
+_TEXTURE_VERTEX_COLOR = frozenset((TEXTURE, VERTEX_COLOR))
+
+
+def mesh_keywords(mesh: Mesh) -> frozenset[str]:
+    """Get the keywords of the ``scene_default/mesh.glsl`` variant drawing a mesh.
+
+    Follows the same rules as the default mesh programs.
+
+    Args:
+        mesh (Mesh): The mesh
+    Returns:
+        frozenset: The enabled keywords
+    """
+    material = mesh.material
+    if not material:
+        return _NONE
+
+    attributes = mesh.attributes
+    normals = attributes.get("NORMAL")
+    texcoords = attributes.get("TEXCOORD_0")
+    if texcoords and material.mat_texture is not None:
+        if normals:
+            return _TEXTURE_NORMALS
+        return _TEXTURE_VERTEX_COLOR if attributes.get("COLOR_0") else _TEXTURE
+
+    if not texcoords and attributes.get("COLOR_0"):
+        return _VERTEX_COLOR
+
+    return _NORMALS if normals else _NONE
+
+
+class VariantMeshProgram(MeshProgram):
+    """Draws any mesh with a variant of a single program.
+
+    The variant is selected when drawing from the attributes and material
+    of the mesh. See :py:func:`mesh_keywords`. Use :py:meth:`warm_up` to
+    compile the variants a set of meshes needs before the first frame.
+    """
+
+    scene_uniforms = True
+
+    def __init__(self, program: Optional[moderngl.Program] = None, **kwargs: Any) -> None:
+        super().__init__(program=None)
+        self.uniforms = SceneUniforms.get(self.ctx)
+        self.variants = ProgramVariants(
+            ProgramDescription(path="scene_default/mesh.glsl"),
+            keywords=(NORMALS, TEXTURE, VERTEX_COLOR),
+            setup=self.uniforms.setup,
+        )
+
+    def warm_up(self, meshes: Iterable[Mesh]) -> None:
+        """Compile the variants needed to draw meshes.
+
+        Args:
+            meshes: The meshes
+        """
+        self.variants.precompile({mesh_keywords(mesh) for mesh in meshes})
+
+    def draw(
+        self,
+        mesh: Mesh,
+        projection_matrix: glm.mat4,
+        model_matrix: glm.mat4,
+        camera_matrix: glm.mat4,
+        time: float = 0.0,
+    ) -> None:
+        assert mesh.vao is not None, "There is no vao to render"
+        keywords = mesh_keywords(mesh)
+        self.program = self.variants.get(keywords)
+        if TEXTURE in keywords:
+            assert mesh.material is not None and mesh.material.mat_texture is not None
+            texture = mesh.material.mat_texture.texture
+            assert (
+                texture is not None
+            ), "The material texture is not linked to a texture, so it can not be rendered"
+            texture.use()
+
+        self.uniforms.use(mesh, projection_matrix, model_matrix, camera_matrix)
+        mesh.vao.render(self.program)
+
+    def apply(self, mesh: Mesh) -> MeshProgram | None:
+        return self
+
+
 class FallbackProgram(MeshProgram):
     """
     Fallback program only rendering positions in white
     """
 
+    scene_uniforms = True
+
     def __init__(self, program: Optional[moderngl.Program] = None, **kwargs: Any) -> None:
         super().__init__(program=None)
         self.program = programs.load(ProgramDescription(path="scene_default/fallback.glsl"))
+        self.uniforms = SceneUniforms.get(self.ctx)
+        self.uniforms.setup(self.program)
 
     def draw(
         self,
@@ -331,15 +448,7 @@ class FallbackProgram(MeshProgram):
         assert self.program is not None, "There is no program to draw"
         assert mesh.vao is not None, "There is no vao to render"
 
-        self.program["m_proj"].write(projection_matrix)
-        self.program["m_model"].write(model_matrix)
-        self.program["m_cam"].write(camera_matrix)
-
-        if mesh.material:
-            self.program["color"].value = tuple(mesh.material.color[0:3])
-        else:
-            self.program["color"].value = (1.0, 1.0, 1.0)
-
+        self.uniforms.use(mesh, projection_matrix, model_matrix, camera_matrix)
         mesh.vao.render(self.program)
 
     def apply(self, mesh: Mesh) -> MeshProgram | None:
@@ -1,16 +1,20 @@
 #version 330
 
+layout(std140) uniform FrameData {
+    mat4 m_proj;
+    mat4 m_cam;
+};
+
+layout(std140) uniform ObjectData {
+    mat4 m_model;
+    vec4 color;
+};
+
 #if defined VERTEX_SHADER
 
 in vec3 in_position;
 in vec3 in_normal;
 
-uniform mat4 m_proj;
-// Use separate model and camera matrix. This means we don't have
-// to calculate modelview matrix in python every frame
-uniform mat4 m_model;
-uniform mat4 m_cam;
-
 out vec3 normal;
 out vec3 pos;
 
@@ -30,7 +34,6 @@ void main() {
 #elif defined FRAGMENT_SHADER
 
 out vec4 fragColor;
-uniform vec4 color;
 
 in vec3 normal;
 in vec3 pos;
@@ -1,13 +1,19 @@
 #version 330
 
+layout(std140) uniform FrameData {
+    mat4 m_proj;
+    mat4 m_cam;
+};
+
+layout(std140) uniform ObjectData {
+    mat4 m_model;
+    vec4 color;
+};
+
 #if defined VERTEX_SHADER
 
 in vec3 in_position;
 
-uniform mat4 m_proj;
-uniform mat4 m_model;
-uniform mat4 m_cam;
-
 void main() {
 	gl_Position = m_proj * m_cam * m_model * vec4(in_position, 1.0);
 }
@@ -15,11 +21,10 @@ void main() {
 #elif defined FRAGMENT_SHADER
 
 out vec4 fragColor;
-uniform vec3 color;
 
 void main()
 {
-    fragColor = vec4(color, 1.0);
+    fragColor = vec4(color.rgb, 1.0);
 }
 
 #endif
@@ -0,0 +1,70 @@
+#version 430
+
+// Set to 1 when the merged geometry has normals.
+// Otherwise flat normals are derived in the fragment shader.
+#define HAS_NORMALS 0
+
+#if defined VERTEX_SHADER
+
+in vec3 in_position;
+#if HAS_NORMALS
+in vec3 in_normal;
+#endif
+// Per instance attribute fetched using the baseInstance of the draw command
+in uint in_draw_id;
+
+struct DrawData {
+    mat4 model;
+    vec4 color;
+};
+
+layout(std430, binding = 0) readonly buffer Draws {
+    DrawData draws[];
+};
+
+uniform mat4 m_proj;
+uniform mat4 m_cam;
+
+out vec3 pos;
+#if HAS_NORMALS
+out vec3 normal;
+#endif
+flat out vec4 color;
+
+void main() {
+    DrawData draw = draws[in_draw_id];
+    mat4 mv = m_cam * draw.model;
+    vec4 p = mv * vec4(in_position, 1.0);
+    gl_Position = m_proj * p;
+#if HAS_NORMALS
+    mat3 m_normal = transpose(inverse(mat3(mv)));
+    normal = m_normal * in_normal;
+#endif
+    pos = p.xyz;
+    color = draw.color;
+}
+
+#elif defined FRAGMENT_SHADER
+
+out vec4 fragColor;
+
+in vec3 pos;
+#if HAS_NORMALS
+in vec3 normal;
+#endif
+flat in vec4 color;
+
+void main()
+{
+#if HAS_NORMALS
+    vec3 n = normalize(normal);
+#else
+    vec3 n = normalize(cross(dFdx(pos), dFdy(pos)));
+#endif
+    // Just use the camera as the only light source
+    float l = dot(normalize(-pos), n);
+    // 25% ambient, 75% light
+    fragColor = color * (0.25 + abs(l) * 0.75);
+}
+
+#endif
@@ -0,0 +1,58 @@
+#version 430
+
+// Frustum culls indirect draw commands.
+// Visible draws are copied as is while culled draws get an instance count of 0.
+
+layout(local_size_x = 64) in;
+
+struct DrawCommand {
+    uint count;
+    uint instance_count;
+    uint first_index;
+    uint base_vertex;
+    uint base_instance;
+};
+
+struct Bounds {
+    vec4 bbox_min;
+    vec4 bbox_max;
+};
+
+layout(std430, binding = 1) readonly buffer SourceCommands {
+    DrawCommand source[];
+};
+
+layout(std430, binding = 2) writeonly buffer OutputCommands {
+    DrawCommand commands[];
+};
+
+layout(std430, binding = 3) readonly buffer DrawBounds {
+    Bounds bounds[];
+};
+
+uniform uint draw_count;
+uniform vec4 planes[6];
+
+void main() {
+    uint index = gl_GlobalInvocationID.x;
+    if (index >= draw_count) {
+        return;
+    }
+
+    DrawCommand cmd = source[index];
+    // The base instance doubles as the draw id
+    Bounds b = bounds[cmd.base_instance];
+
+    bool visible = true;
+    for (int i = 0; i < 6; i++) {
+        // The corner furthest along the plane normal
+        vec3 p = mix(b.bbox_min.xyz, b.bbox_max.xyz, greaterThan(planes[i].xyz, vec3(0.0)));
+        if (dot(planes[i].xyz, p) + planes[i].w < 0.0) {
+            visible = false;
+            break;
+        }
+    }
+
+    cmd.instance_count = visible ? 1u : 0u;
+    commands[index] = cmd;
+}
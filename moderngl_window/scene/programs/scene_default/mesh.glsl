@@ -0,0 +1,89 @@
+#version 330
+
+// Compiled in variants by VariantMeshProgram. The keywords are defined
+// as 1 or 0 after the version line:
+// NORMALS, TEXTURE, VERTEX_COLOR
+
+layout(std140) uniform FrameData {
+    mat4 m_proj;
+    mat4 m_cam;
+};
+
+layout(std140) uniform ObjectData {
+    mat4 m_model;
+    vec4 color;
+};
+
+#if defined VERTEX_SHADER
+
+in vec3 in_position;
+#if NORMALS
+in vec3 in_normal;
+out vec3 normal;
+out vec3 pos;
+#endif
+#if TEXTURE
+in vec2 in_texcoord_0;
+out vec2 uv;
+#endif
+#if VERTEX_COLOR
+in vec3 in_color0;
+out vec3 v_color;
+#endif
+
+void main() {
+    mat4 mv = m_cam * m_model;
+    vec4 p = mv * vec4(in_position, 1.0);
+    gl_Position = m_proj * p;
+#if NORMALS
+    mat3 m_normal = transpose(inverse(mat3(mv)));
+    normal = m_normal * in_normal;
+    pos = p.xyz;
+#endif
+#if TEXTURE
+    uv = in_texcoord_0;
+#endif
+#if VERTEX_COLOR
+    v_color = in_color0;
+#endif
+}
+
+#elif defined FRAGMENT_SHADER
+
+out vec4 fragColor;
+#if NORMALS
+in vec3 normal;
+in vec3 pos;
+#endif
+#if TEXTURE
+uniform sampler2D texture0;
+in vec2 uv;
+#endif
+#if VERTEX_COLOR
+in vec3 v_color;
+#endif
+
+void main()
+{
+#if TEXTURE
+    vec4 c = texture(texture0, uv);
+#if VERTEX_COLOR
+    c = vec4(c.rgb * v_color, 1.0);
+#endif
+#elif VERTEX_COLOR
+    vec4 c = vec4(v_color, 1.0);
+#elif NORMALS
+    vec4 c = color;
+#else
+    vec4 c = vec4(color.rgb, 1.0);
+#endif
+
+#if NORMALS
+    // Use the camera as the only light source. 25% ambient, 75% light
+    float l = dot(normalize(-pos), normalize(normal));
+    c *= 0.25 + abs(l) * 0.75;
+#endif
+    fragColor = c;
+}
+
+#endif
@@ -1,14 +1,20 @@
 #version 330
 
+layout(std140) uniform FrameData {
+    mat4 m_proj;
+    mat4 m_cam;
+};
+
+layout(std140) uniform ObjectData {
+    mat4 m_model;
+    vec4 color;
+};
+
 #if defined VERTEX_SHADER
 
 in vec3 in_position;
 in vec2 in_texcoord_0;
 
-uniform mat4 m_proj;
-uniform mat4 m_model;
-uniform mat4 m_cam;
-
 out vec2 uv;
 
 void main() {
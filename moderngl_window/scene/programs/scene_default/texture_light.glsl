@@ -1,15 +1,21 @@
 #version 330
 
+layout(std140) uniform FrameData {
+    mat4 m_proj;
+    mat4 m_cam;
+};
+
+layout(std140) uniform ObjectData {
+    mat4 m_model;
+    vec4 color;
+};
+
 #if defined VERTEX_SHADER
 
 in vec3 in_position;
 in vec3 in_normal;
 in vec2 in_texcoord_0;
 
-uniform mat4 m_proj;
-uniform mat4 m_model;
-uniform mat4 m_cam;
-
 out vec3 normal;
 out vec2 uv;
 out vec3 pos;
@@ -36,8 +42,8 @@ in vec2 uv;
 void main()
 {
     float l = dot(normalize(-pos), normalize(normal));
-    vec4 color = texture(texture0, uv);
-    fragColor = color * 0.25 + color * 0.75 * abs(l);
+    vec4 tex_color = texture(texture0, uv);
+    fragColor = tex_color * 0.25 + tex_color * 0.75 * abs(l);
 }
 
 #endif
@@ -10,21 +10,16 @@ import glm
 import moderngl
 
 import moderngl_window as mglw
-from moderngl_window import geometry
+from moderngl_window import geometry, profiler
 from moderngl_window.meta import ProgramDescription
+from moderngl_window.opengl.program import UniformBinder
 from moderngl_window.resources.programs import programs
 
+from .indirect import IndirectRenderer
 from .material import Material
 from .node import Node
-from .programs import (
-    ColorLightProgram,
-    FallbackProgram,
-    MeshProgram,
-    TextureLightProgram,
-    TextureProgram,
-    TextureVertexColorProgram,
-    VertexColorProgram,
-)
+from .programs import MeshProgram, VariantMeshProgram
+from .uniforms import SceneUniforms
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +71,7 @@ class Scene:
             self.ctx.extra["DEFAULT_WIREFRAME_PROGRAM"] = self.wireframe_program
 
         self._matrix = glm.mat4()
+        self._indirect_renderer: Optional[IndirectRenderer] = None
 
     @property
     def ctx(self) -> moderngl.Context:
@@ -96,6 +92,9 @@ class Scene:
         for node in self.root_nodes:
             node.calc_model_mat(self._matrix)
 
+        if self._indirect_renderer is not None:
+            self._indirect_renderer.update_matrices()
+
     def draw(
         self,
         projection_matrix: Optional[glm.mat4],
@@ -104,11 +103,50 @@ class Scene:
     ) -> None:
         """Draw all the nodes in the scene.
 
+        The per-frame and per-object uniform blocks used by the default
+        mesh programs are written once before the nodes are drawn.
+        See :py:class:`~moderngl_window.scene.SceneUniforms` and
+        :py:attr:`~moderngl_window.scene.MeshProgram.scene_uniforms`.
+
         Args:
             projection_matrix (ndarray): projection matrix (bytes)
             camera_matrix (ndarray): camera_matrix (bytes)
             time (float): The current time
         """
+        with profiler.scope("Scene.draw", gpu=True):
+            self._draw(projection_matrix, camera_matrix, time)
+
+    def _draw(
+        self,
+        projection_matrix: Optional[glm.mat4],
+        camera_matrix: Optional[glm.mat4],
+        time: float,
+    ) -> None:
+        """Draw all the nodes in the scene"""
+        # Write the per-object data for all meshes drawn by programs using the
+        # shared uniform blocks. The mesh programs bind their range when drawn
+        meshes: list[Mesh] = []
+        matrices: list[glm.mat4] = []
+        stack = list(reversed(self.root_nodes))
+        while stack:
+            node = stack.pop()
+            mesh = node.mesh
+            if (
+                mesh is not None
+                and mesh.mesh_program is not None
+                and mesh.mesh_program.scene_uniforms
+                and node.matrix_global is not None
+            ):
+                meshes.append(mesh)
+                matrices.append(node.matrix_global)
+            stack.extend(reversed(node.children))
+
+        uniforms = SceneUniforms.get(self.ctx) if meshes else None
+        if uniforms is not None:
+            if projection_matrix is not None and camera_matrix is not None:
+                uniforms.write_frame(projection_matrix, camera_matrix)
+            uniforms.write_objects(meshes, matrices)
+
         for node in self.root_nodes:
             node.draw(
                 projection_matrix=projection_matrix,
@@ -116,8 +154,32 @@ class Scene:
                 time=time,
             )
 
+        if uniforms is not None:
+            uniforms.end_frame()
         self.ctx.clear_samplers(0, 4)
 
+    def draw_indirect(
+        self,
+        projection_matrix: glm.mat4,
+        camera_matrix: glm.mat4,
+        cull: bool = False,
+    ) -> None:
+        """Draw all static meshes using multi-draw indirect.
+
+        On the first call meshes sharing a vertex layout are merged
+        into shared buffers. See :py:class:`~moderngl_window.scene.IndirectRenderer`.
+        Requires OpenGL 4.3.
+
+        Args:
+            projection_matrix (glm.mat4): projection matrix
+            camera_matrix (glm.mat4): camera matrix
+            cull (bool): Frustum cull the meshes on the GPU
+        """
+        if self._indirect_renderer is None:
+            self._indirect_renderer = IndirectRenderer(self)
+
+        self._indirect_renderer.render(projection_matrix, camera_matrix, cull=cull)
+
     def draw_bbox(
         self,
         projection_matrix: Optional[glm.mat4] = None,
@@ -137,12 +199,13 @@ class Scene:
         camera_matrix = camera_matrix
 
         # Scene bounding box
-        self.bbox_program["m_proj"].write(projection_matrix)
-        self.bbox_program["m_model"].write(self._matrix)
-        self.bbox_program["m_cam"].write(camera_matrix)
-        self.bbox_program["bb_min"].write(self.bbox_min)
-        self.bbox_program["bb_max"].write(self.bbox_max)
-        self.bbox_program["color"].value = color
+        binder = UniformBinder.get(self.bbox_program)
+        binder.write("m_proj", projection_matrix)
+        binder.write("m_model", self._matrix)
+        binder.write("m_cam", camera_matrix)
+        binder.write("bb_min", self.bbox_min)
+        binder.write("bb_max", self.bbox_max)
+        binder.set("color", color)
         self.bbox_vao.render(self.bbox_program)
 
         if not children:
@@ -169,10 +232,11 @@ class Scene:
         projection_matrix = projection_matrix
         camera_matrix = camera_matrix
 
-        self.wireframe_program["m_proj"].write(projection_matrix)
-        self.wireframe_program["m_model"].write(self._matrix)
-        self.wireframe_program["m_cam"].write(camera_matrix)
-        self.wireframe_program["color"] = color
+        binder = UniformBinder.get(self.wireframe_program)
+        binder.write("m_proj", projection_matrix)
+        binder.write("m_model", self._matrix)
+        binder.write("m_cam", camera_matrix)
+        binder.set("color", color)
 
         # Draw bounding box for children
         self.ctx.wireframe = True
@@ -201,14 +265,7 @@ class Scene:
         if not mesh_programs:
             mesh_programs = self.ctx.extra.get("DEFAULT_PROGRAMS")
             if not mesh_programs:
-                mesh_programs = [
-                    TextureLightProgram(),
-                    TextureProgram(),
-                    VertexColorProgram(),
-                    TextureVertexColorProgram(),
-                    ColorLightProgram(),
-                    FallbackProgram(),
-                ]
+                mesh_programs = [VariantMeshProgram()]
                 self.ctx.extra["DEFAULT_PROGRAMS"] = mesh_programs
 
         for mesh in self.meshes:
@@ -228,6 +285,11 @@ class Scene:
             if not mesh.mesh_program:
                 logger.warning("WARING: No mesh program applied to '%s'", mesh.name)
 
+        # Compile the program variants up front instead of on the first draw
+        for mesh_prog in mesh_programs:
+            if isinstance(mesh_prog, VariantMeshProgram):
+                mesh_prog.warm_up(mesh for mesh in self.meshes if mesh.mesh_program is mesh_prog)
+
     def calc_scene_bbox(self) -> None:
         """Calculate scene bbox"""
         bbox_min: glm.vec3 | None = None
@@ -298,6 +360,10 @@ class Scene:
         for mat in self.materials:
             mat.release()
 
+        if self._indirect_renderer is not None:
+            self._indirect_renderer.release()
+            self._indirect_renderer = None
+
         self.meshes = []
         self.root_nodes = []
 
@@ -0,0 +1,230 @@
+"""
+Uniform buffers shared by the default mesh programs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+import glm
+import moderngl
+import numpy
+
+if TYPE_CHECKING:
+    from .mesh import Mesh
+
+# std140 layouts of the uniform blocks in the scene_default programs
+FRAME_SIZE = 128  # mat4 m_proj, mat4 m_cam
+OBJECT_SIZE = 80  # mat4 m_model, vec4 color
+
+
+def mesh_color(mesh: Mesh) -> tuple[float, ...]:
+    """Get the material color of a mesh.
+
+    Args:
+        mesh (Mesh): The mesh
+    Returns:
+        tuple: rgba color. White if the mesh has no material color
+    """
+    if mesh.material is not None and mesh.material.color:
+        return tuple(mesh.material.color)
+    return (1.0, 1.0, 1.0, 1.0)
+
+
+class SceneUniforms:
+    """Uniform buffers for per-frame and per-object data.
+
+    The ``FrameData`` block (projection and camera matrix) is written
+    and bound once per frame. The ``ObjectData`` block (model matrix
+    and material color) for every mesh in the frame is written to a
+    ring of uniform buffers with a single write and each draw binds
+    its own range of that buffer. Cycling through several buffers
+    avoids writing into a buffer the previous frame may still be using.
+
+    Mesh programs call :py:meth:`use` before rendering. Meshes written
+    with :py:meth:`write_objects` are found by the mesh and model matrix
+    object passed to ``use`` and bind their range of the buffer. For any
+    other mesh, for example when drawing a mesh directly, the data is
+    written immediately.
+    """
+
+    #: Binding point of the ``FrameData`` block
+    FRAME_BINDING = 0
+    #: Binding point of the ``ObjectData`` block
+    OBJECT_BINDING = 1
+
+    def __init__(self, ctx: moderngl.Context, capacity: int = 64, buffers: int = 3):
+        """Create the uniform buffers.
+
+        Args:
+            ctx (moderngl.Context): The context
+            capacity (int): Initial number of objects per buffer
+            buffers (int): Number of object buffers in the ring
+        """
+        self.ctx = ctx
+        alignment = ctx.info.get("GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT") or 256
+        #: Distance in bytes between each object in the object buffers
+        self.stride = -(-OBJECT_SIZE // alignment) * alignment
+        self.dtype = numpy.dtype(
+            {
+                "names": ["model", "color"],
+                "formats": [("f4", (4, 4)), ("f4", 4)],
+                "offsets": [0, 64],
+                "itemsize": self.stride,
+            }
+        )
+        self.frame_buffer = ctx.buffer(reserve=FRAME_SIZE)
+        self._object_buffer = ctx.buffer(reserve=self.stride)
+        self._ring_size = buffers
+        self._ring: list[moderngl.Buffer] = []
+        self._ring_index = 0
+        self._data = numpy.zeros(0, dtype=self.dtype)
+        # Index of each object written this frame by mesh and model matrix id
+        self._indices: dict[tuple[int, int], int] = {}
+        self.reserve(capacity)
+
+    @classmethod
+    def get(cls, ctx: moderngl.Context) -> SceneUniforms:
+        """Get the uniform buffers for a context. Created on the first call.
+
+        Args:
+            ctx (moderngl.Context): The context
+        """
+        if ctx.extra is None:
+            ctx.extra = {}
+
+        uniforms: Optional[SceneUniforms] = ctx.extra.get("DEFAULT_SCENE_UNIFORMS")
+        if uniforms is None:
+            uniforms = cls(ctx)
+            ctx.extra["DEFAULT_SCENE_UNIFORMS"] = uniforms
+
+        return uniforms
+
+    @property
+    def capacity(self) -> int:
+        """int: Number of objects each buffer in the ring can hold"""
+        return len(self._data)
+
+    @property
+    def buffer(self) -> moderngl.Buffer:
+        """moderngl.Buffer: The object buffer used in the current frame"""
+        return self._ring[self._ring_index]
+
+    def reserve(self, capacity: int) -> None:
+        """Make sure the object buffers can hold a number of objects.
+
+        Args:
+            capacity (int): Number of objects
+        """
+        if capacity <= self.capacity:
+            return
+
+        for buffer in self._ring:
+            buffer.release()
+
+        self._data = numpy.zeros(capacity, dtype=self.dtype)
+        self._ring = [
+            self.ctx.buffer(reserve=capacity * self.stride) for _ in range(self._ring_size)
+        ]
+
+    def setup(self, program: moderngl.Program) -> None:
+        """Assign the binding points of the uniform blocks in a program.
+
+        Args:
+            program (moderngl.Program): The program
+        """
+        for name, binding in (
+            ("FrameData", self.FRAME_BINDING),
+            ("ObjectData", self.OBJECT_BINDING),
+        ):
+            block = program.get(name, None)
+            if isinstance(block, moderngl.UniformBlock):
+                block.binding = binding
+
+    def write_frame(self, projection_matrix: glm.mat4, camera_matrix: glm.mat4) -> None:
+        """Write and bind the per-frame data.
+
+        Args:
+            projection_matrix (glm.mat4): The projection matrix
+            camera_matrix (glm.mat4): The camera matrix
+        """
+        self.frame_buffer.write(projection_matrix.to_bytes() + camera_matrix.to_bytes())
+        self.frame_buffer.bind_to_uniform_block(self.FRAME_BINDING)
+
+    def write_objects(self, meshes: list[Mesh], model_matrices: list[glm.mat4]) -> None:
+        """Write the per-object data for a frame to the next buffer in the ring.
+
+        Args:
+            meshes (list): The meshes to draw
+            model_matrices (list): The model matrix for each mesh
+        """
+        count = len(meshes)
+        if count == 0:
+            return
+
+        if count > self.capacity:
+            self.reserve(1 << (count - 1).bit_length())
+
+        data = self._data[:count]
+        # numpy reads glm matrices row by row. GLSL expects column major
+        data["model"] = numpy.array(model_matrices, dtype="f4").transpose(0, 2, 1)
+        data["color"] = [mesh_color(mesh) for mesh in meshes]
+
+        self._ring_index = (self._ring_index + 1) % self._ring_size
+        self.buffer.write(data)
+        self._indices = {
+            (id(mesh), id(matrix)): index
+            for index, (mesh, matrix) in enumerate(zip(meshes, model_matrices))
+        }
+
+    def use_object(self, index: int) -> None:
+        """Bind the data of an object written in :py:meth:`write_objects`.
+
+        Args:
+            index (int): Index of the object
+        """
+        self.buffer.bind_to_uniform_block(
+            self.OBJECT_BINDING, offset=index * self.stride, size=OBJECT_SIZE
+        )
+
+    def use(
+        self,
+        mesh: Mesh,
+        projection_matrix: glm.mat4,
+        model_matrix: glm.mat4,
+        camera_matrix: glm.mat4,
+    ) -> None:
+        """Make sure the uniform blocks hold the data for a mesh.
+
+        Binds the object data when the mesh and model matrix were written
+        with :py:meth:`write_objects`, otherwise the frame and object
+        data is written directly.
+
+        Args:
+            mesh (Mesh): The mesh to draw
+            projection_matrix (glm.mat4): The projection matrix
+            model_matrix (glm.mat4): The model matrix
+            camera_matrix (glm.mat4): The camera matrix
+        """
+        index = self._indices.get((id(mesh), id(model_matrix)))
+        if index is not None:
+            self.use_object(index)
+            return
+
+        self.write_frame(projection_matrix, camera_matrix)
+        self._object_buffer.write(
+            model_matrix.to_bytes() + numpy.array(mesh_color(mesh), dtype="f4").tobytes()
+        )
+        self._object_buffer.bind_to_uniform_block(self.OBJECT_BINDING, size=OBJECT_SIZE)
+
+    def end_frame(self) -> None:
+        """Stop using the object data written for the frame"""
+        self._indices = {}
+
+    def release(self) -> None:
+        """Release the buffers"""
+        self.frame_buffer.release()
+        self._object_buffer.release()
+        for buffer in self._ring:
+            buffer.release()
+        self._ring = []
@@ -1,7 +1,9 @@
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 import moderngl
 from PIL import Image
@@ -13,6 +15,23 @@ logger = logging.getLogger(__name__)
 TEXTURE_MODES = [None, "L", None, "RGB", "RGBA"]
 
 
+def _destination(file_format: str, name: Optional[str]) -> str:
+    """Get the path of a screenshot creating SCREENSHOT_PATH if needed"""
+    dest = ""
+    if settings.SCREENSHOT_PATH:
+        if not os.path.exists(str(settings.SCREENSHOT_PATH)):
+            logger.debug("SCREENSHOT_PATH does not exist. creating: %s", settings.SCREENSHOT_PATH)
+            os.makedirs(str(settings.SCREENSHOT_PATH), exist_ok=True)
+        dest = settings.SCREENSHOT_PATH
+    else:
+        logger.info("SCREENSHOT_PATH not defined in settings. Using cwd as fallback.")
+
+    if not name:
+        name = "{}.{}".format(datetime.now().strftime("%Y-%m-%d-%H-%M-%S-%f"), file_format)
+
+    return os.path.join(str(dest), name)
+
+
 def create(
     source: Union[moderngl.Framebuffer, moderngl.Texture],
     file_format: str = "png",
@@ -32,18 +51,6 @@ def create(
         mode (str): Components/mode to use
         alignment (int): Buffer alignment
     """
-    dest = ""
-    if settings.SCREENSHOT_PATH:
-        if not os.path.exists(str(settings.SCREENSHOT_PATH)):
-            logger.debug("SCREENSHOT_PATH does not exist. creating: %s", settings.SCREENSHOT_PATH)
-            os.makedirs(str(settings.SCREENSHOT_PATH))
-        dest = settings.SCREENSHOT_PATH
-    else:
-        logger.info("SCREENSHOT_PATH not defined in settings. Using cwd as fallback.")
-
-    if not name:
-        name = "{}.{}".format(datetime.now().strftime("%Y-%m-%d-%H-%M-%S-%f"), file_format)
-
     logger.debug(
         "Creating screenshot: source=%s file_format=%s name=%s mode=%s alignment=%s",
         source,
@@ -70,6 +77,275 @@ def create(
         raise ValueError("Source needs to be a FrameBuffer or Texture, not a %s", type(source))
 
     image = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-    dest = os.path.join(str(dest), name)
+    dest = _destination(file_format, name)
     logger.info("Creating screenshot: %s", dest)
     image.save(dest, format=file_format)
+
+
+class _Screenshot:
+    """A screenshot waiting to be read back from the GPU"""
+
+    __slots__ = ("buffer", "mode", "size", "file_format", "dest", "future", "callback", "age")
+
+    def __init__(
+        self,
+        buffer: moderngl.Buffer,
+        mode: str,
+        size: tuple[int, int],
+        file_format: str,
+        dest: str,
+        callback: Optional[Callable[[str], None]],
+    ):
+        self.buffer = buffer
+        self.mode = mode
+        self.size = size
+        self.file_format = file_format
+        self.dest = dest
+        self.future: Future[str] = Future()
+        self.callback = callback
+        self.age = 0
+
+
+class _Burst:
+    """A sequence of screenshots captured in consecutive frames"""
+
+    __slots__ = ("source", "frames", "file_format", "name", "mode", "futures", "future")
+
+    def __init__(
+        self,
+        source: Union[moderngl.Framebuffer, moderngl.Texture],
+        frames: int,
+        file_format: str,
+        name: str,
+        mode: str,
+    ):
+        self.source = source
+        self.frames = frames
+        self.file_format = file_format
+        self.name = name
+        self.mode = mode
+        self.futures: list[Future[str]] = []
+        self.future: Future[list[str]] = Future()
+
+
+class ScreenshotWriter:
+    """Create screenshots without blocking the render thread.
+
+    The pixels are copied into a pixel buffer on the GPU. The buffer is
+    read ``latency`` calls to :py:meth:`update` later when the transfer
+    is done. Flipping, encoding and saving the image then happens in a
+    pool of worker threads. :py:meth:`update` should be called once per
+    frame, for example at the end of ``on_render``.
+
+    Example::
+
+        writer = ScreenshotWriter()
+
+        # Save a screenshot
+        future = writer.capture(self.wnd.fbo, callback=print)
+
+        # Save the next 60 frames
+        writer.burst(self.wnd.fbo, 60, name="burst_{:04d}.png")
+
+        # Once per frame
+        writer.update()
+
+        # When done
+        writer.release()
+    """
+
+    def __init__(self, workers: int = 2, latency: int = 1):
+        """Create the writer.
+
+        Args:
+            workers (int): Number of threads encoding and saving images
+            latency (int): Number of updates before the pixels are read. 0 reads immediately
+        """
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix="ScreenshotWriter"
+        )
+        self._latency = max(latency, 0)
+        self._pending: list[_Screenshot] = []
+        self._saving: list[Future[str]] = []
+        self._bursts: list[_Burst] = []
+        # Unused pixel buffers by size
+        self._free: dict[int, list[moderngl.Buffer]] = {}
+
+    @property
+    def pending(self) -> int:
+        """int: Number of screenshots not read back from the GPU yet"""
+        return len(self._pending)
+
+    def capture(
+        self,
+        source: Union[moderngl.Framebuffer, moderngl.Texture],
+        file_format: str = "png",
+        name: Optional[str] = None,
+        mode: str = "RGB",
+        callback: Optional[Callable[[str], None]] = None,
+    ) -> "Future[str]":
+        """Start a screenshot of a framebuffer or texture.
+
+        Args:
+            source: The framebuffer or texture to screenshot
+            file_format (str): formats supported by PIL (png, jpeg etc)
+            name (str): Optional file name with relative or absolute path
+            mode (str): Components/mode to use for framebuffers
+            callback: Called with the path when the image is saved. Called from a worker thread
+        Returns:
+            Future: Resolves to the path of the saved image
+        """
+        if isinstance(source, moderngl.Framebuffer):
+            size = source.viewport[2], source.viewport[3]
+            buffer = self._buffer(source.ctx, size[0] * size[1] * len(mode))
+            source.read_into(buffer, viewport=source.viewport, components=len(mode))
+        elif isinstance(source, moderngl.Texture):
+            mode = TEXTURE_MODES[source.components] or ""
+            if not mode or source.dtype != "f1":
+                raise ValueError("Texture must have 1, 3 or 4 components of type f1")
+            size = source.size
+            buffer = self._buffer(source.ctx, size[0] * size[1] * source.components)
+            source.read_into(buffer, alignment=1)
+        else:
+            raise ValueError(
+                "Source needs to be a FrameBuffer or Texture, not a {}".format(type(source))
+            )
+
+        screenshot = _Screenshot(
+            buffer, mode, size, file_format, _destination(file_format, name), callback
+        )
+        logger.debug("Capturing screenshot: %s", screenshot.dest)
+        self._pending.append(screenshot)
+        if self._latency == 0:
+            self._read(len(self._pending))
+
+        return screenshot.future
+
+    def burst(
+        self,
+        source: Union[moderngl.Framebuffer, moderngl.Texture],
+        frames: int,
+        file_format: str = "png",
+        name: Optional[str] = None,
+        mode: str = "RGB",
+    ) -> "Future[list[str]]":
+        """Capture a screenshot in each of the next calls to :py:meth:`update`.
+
+        Args:
+            source: The framebuffer or texture to screenshot
+            frames (int): Number of screenshots
+            file_format (str): formats supported by PIL (png, jpeg etc)
+            name (str): File name pattern with a field for the frame number
+            mode (str): Components/mode to use for framebuffers
+        Returns:
+            Future: Resolves to the paths of all saved images
+        """
+        if not name:
+            name = "{}-{{:04d}}.{}".format(
+                datetime.now().strftime("%Y-%m-%d-%H-%M-%S-%f"), file_format
+            )
+
+        burst = _Burst(source, frames, file_format, name, mode)
+        self._bursts.append(burst)
+        return burst.future
+
+    def update(self) -> None:
+        """Capture burst frames and save the screenshots the GPU has finished"""
+        for screenshot in self._pending:
+            screenshot.age += 1
+
+        for burst in self._bursts:
+            burst.futures.append(
+                self.capture(
+                    burst.source,
+                    file_format=burst.file_format,
+                    name=burst.name.format(len(burst.futures)),
+                    mode=burst.mode,
+                )
+            )
+            if len(burst.futures) == burst.frames:
+                self._finish_burst(burst)
+
+        self._bursts = [burst for burst in self._bursts if len(burst.futures) < burst.frames]
+        self._read(sum(1 for screenshot in self._pending if screenshot.age >= self._latency))
+
+    def flush(self, wait: bool = True) -> None:
+        """Read all pending screenshots.
+
+        Args:
+            wait (bool): Wait for all images to be saved
+        """
+        self._read(len(self._pending))
+        if wait:
+            for future in self._saving:
+                future.exception()
+
+    def release(self) -> None:
+        """Save all pending screenshots, stop the workers and release the buffers"""
+        for burst in self._bursts:
+            self._finish_burst(burst)
+        self._bursts = []
+
+        self._read(len(self._pending))
+        self._pool.shutdown(wait=True)
+        for buffers in self._free.values():
+            for buffer in buffers:
+                buffer.release()
+        self._free = {}
+
+    def _buffer(self, ctx: moderngl.Context, size: int) -> moderngl.Buffer:
+        """Get an unused pixel buffer"""
+        buffers = self._free.get(size)
+        if buffers:
+            return buffers.pop()
+        return ctx.buffer(reserve=size)
+
+    def _read(self, count: int) -> None:
+        """Read the oldest pending screenshots and pass them to the workers"""
+        ready, self._pending = self._pending[:count], self._pending[count:]
+        self._saving = [future for future in self._saving if not future.done()]
+        for screenshot in ready:
+            data = screenshot.buffer.read()
+            self._free.setdefault(screenshot.buffer.size, []).append(screenshot.buffer)
+            self._pool.submit(self._save, screenshot, data)
+            self._saving.append(screenshot.future)
+
+    def _save(self, screenshot: _Screenshot, data: bytes) -> None:
+        """Flip, encode and save an image. Called in a worker thread"""
+        try:
+            image = Image.frombytes(screenshot.mode, screenshot.size, data)
+            image = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+            logger.info("Creating screenshot: %s", screenshot.dest)
+            image.save(screenshot.dest, format=screenshot.file_format)
+        except Exception as ex:
+            logger.error("Failed to save screenshot %s: %s", screenshot.dest, ex)
+            screenshot.future.set_exception(ex)
+            return
+
+        screenshot.future.set_result(screenshot.dest)
+        if screenshot.callback is not None:
+            screenshot.callback(screenshot.dest)
+
+    def _finish_burst(self, burst: _Burst) -> None:
+        """Resolve the future of a burst when all its screenshots are saved"""
+        futures = list(burst.futures)
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def done(_: "Future[str]") -> None:
+            # Screenshots complete in different worker threads
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] > 0:
+                    return
+
+            errors = [error for error in (future.exception() for future in futures) if error]
+            if errors:
+                burst.future.set_exception(errors[0])
+            else:
+                burst.future.set_result([future.result() for future in futures])
+
+        if not futures:
+            burst.future.set_result([])
+        for future in futures:
+            future.add_done_callback(done)
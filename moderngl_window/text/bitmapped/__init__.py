@@ -1 +1,2 @@
 from .text_2d import TextWriter2D  # noqa
+from .text_batch_2d import TextBatch2D  # noqa
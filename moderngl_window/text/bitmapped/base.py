@@ -1,6 +1,12 @@
 from typing import Any, Generator, Optional, Union
 
+import glm
+import moderngl
+import numpy
+import numpy.typing as npt
+
 import moderngl_window
+from moderngl_window.opengl.program import UniformBinder
 
 
 class FontMeta:
@@ -37,11 +43,33 @@ class BaseText:
     def __init__(self) -> None:
         self._meta: Optional[FontMeta] = None
         self._ct: list[int] = []
+        self._lut = numpy.zeros(256, dtype=numpy.uint32)
         self.ctx = moderngl_window.ContextRefs.CONTEXT
+        # The projection is only computed again when the viewport changes
+        self._viewport: Optional[tuple[int, int, int, int]] = None
+        self._projection = glm.mat4()
 
     def draw(self, *args: Any, **kwargs: Any) -> None:
         raise NotImplementedError()
 
+    def _update_projection(self, program: moderngl.Program) -> None:
+        """Write the ortho projection for the current viewport"""
+        assert self.ctx is not None, "There was a problem, we do not have a context"
+        assert self.ctx.fbo is not None, "The current context do not have a framebuffer"
+
+        vp = self.ctx.fbo.viewport
+        if vp != self._viewport:
+            self._viewport = vp
+            self._projection = glm.ortho(
+                0,  # left
+                vp[2],  # right
+                0,  # bottom
+                vp[3],  # top
+                1.0,  # near
+                -1.0,  # far
+            )
+        UniformBinder.get(program).write("m_proj", self._projection)
+
     def _translate_string(self, data: str) -> Generator[int, None, None]:
         """Translate string into character texture positions"""
         assert (self._meta is not None) and (
@@ -52,6 +80,12 @@ class BaseText:
         for index, char in enumerate(data_bytes):
             yield self._meta.characters - 1 - self._ct[char]
 
+    def _translate_array(self, data: str) -> npt.NDArray[numpy.uint32]:
+        """Translate string into character texture positions using the lookup table"""
+        assert self._meta is not None, "_meta is empty. Did you call _init()?"
+        chars = numpy.frombuffer(data.encode("iso-8859-1", errors="replace"), dtype=numpy.uint8)
+        return self._lut[chars]
+
     def _init(self, meta: FontMeta) -> None:
         self._meta = meta
         # Check if the atlas size is sane
@@ -69,3 +103,6 @@ class BaseText:
             for c_pos in range(c_range["min"], c_range["max"] + 1):
                 self._ct[c_pos] = index
                 index += 1
+
+        positions = self._meta.characters - 1 - numpy.array(self._ct, dtype=numpy.int64)
+        self._lut = positions.astype(numpy.uint32)
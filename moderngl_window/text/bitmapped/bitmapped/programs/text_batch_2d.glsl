@@ -0,0 +1,88 @@
+#version 330
+
+#if defined VERTEX_SHADER
+
+in vec2 in_position;
+in vec2 in_size;
+in vec4 in_color;
+in uint in_char_id;
+
+out vec2 vs_size;
+out vec4 vs_color;
+out uint vs_char_id;
+
+void main() {
+    gl_Position = vec4(in_position, 0.0, 1.0);
+    vs_size = in_size;
+    vs_color = in_color;
+    vs_char_id = in_char_id;
+}
+
+#elif defined GEOMETRY_SHADER
+
+layout (points) in;
+layout (triangle_strip, max_vertices = 4) out;
+
+uniform mat4 m_proj;
+
+in vec2 vs_size[1];
+in vec4 vs_color[1];
+in uint vs_char_id[1];
+out vec2 uv;
+out vec4 color;
+flat out uint gs_char_id;
+
+void main() {
+    // Unused glyphs have no size
+    if (vs_size[0].y <= 0.0) {
+        return;
+    }
+
+    vec3 pos = gl_in[0].gl_Position.xyz;
+    vec3 right = vec3(vs_size[0].x / 2.0, 0.0, 0.0);
+    vec3 up = vec3(0.0, vs_size[0].y / 2.0, 0.0);
+
+    // upper right
+    uv = vec2(1.0, 1.0);
+    color = vs_color[0];
+    gs_char_id = vs_char_id[0];
+    gl_Position = m_proj * vec4(pos + (right + up), 1.0);
+    EmitVertex();
+
+    // upper left
+    uv = vec2(0.0, 1.0);
+    color = vs_color[0];
+    gs_char_id = vs_char_id[0];
+    gl_Position = m_proj * vec4(pos + (-right + up), 1.0);
+    EmitVertex();
+
+    // lower right
+    uv = vec2(1.0, 0.0);
+    color = vs_color[0];
+    gs_char_id = vs_char_id[0];
+    gl_Position = m_proj * vec4(pos + (right - up), 1.0);
+    EmitVertex();
+
+    // lower left
+    uv = vec2(0.0, 0.0);
+    color = vs_color[0];
+    gs_char_id = vs_char_id[0];
+    gl_Position = m_proj * vec4(pos + (-right - up), 1.0);
+    EmitVertex();
+
+    EndPrimitive();
+}
+
+#elif defined FRAGMENT_SHADER
+
+out vec4 fragColor;
+uniform sampler2DArray font_texture;
+in vec2 uv;
+in vec4 color;
+flat in uint gs_char_id;
+
+void main()
+{
+    fragColor = texture(font_texture, vec3(uv, gs_char_id)) * color;
+}
+#endif
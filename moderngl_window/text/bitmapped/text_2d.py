@@ -1,12 +1,11 @@
 from pathlib import Path
 from typing import Optional
 
-import glm
 import moderngl
-import numpy
 
 from moderngl_window import resources
 from moderngl_window.meta import DataDescription, ProgramDescription, TextureDescription
+from moderngl_window.opengl.program import UniformBinder
 from moderngl_window.opengl.vao import VAO
 
 from .base import BaseText, FontMeta
@@ -53,6 +52,9 @@ class TextWriter2D(BaseText):
 
     @text.setter
     def text(self, value: str) -> None:
+        if value == self._text:
+            return
+
         self._text = value
         self._string_buffer.orphan(size=len(value) * 4)
         self._string_buffer.clear(chunk=b"\32")
@@ -61,34 +63,16 @@ class TextWriter2D(BaseText):
     def _write(self, text: str) -> None:
         self._string_buffer.clear(chunk=b"\32")
 
-        self._string_buffer.write(
-            numpy.fromiter(
-                self._translate_string(text),
-                dtype=numpy.uint32,
-            )
-        )
+        self._string_buffer.write(self._translate_array(text))
 
     def draw(self, pos: tuple[float, float], length: int = -1, size: float = 24.0) -> None:
-        assert self.ctx is not None, "There was a problem, we do not have a context"
-        assert self.ctx.fbo is not None, "The current context do not have a framebuffer"
         assert self._meta is not None, "We are missing the information needed to write text"
 
-        # Calculate ortho projection based on viewport
-        vp = self.ctx.fbo.viewport
-        w, h = vp[2], vp[3]
-        projection = glm.ortho(
-            0,  # left
-            w,  # right
-            0,  # bottom
-            h,  # top
-            1.0,  # near
-            -1.0,  # far
-        )
-
         self._texture.use(location=0)
-        self._program["m_proj"].write(projection)
-        self._program["text_pos"].value = pos
-        self._program["font_texture"].value = 0
-        self._program["char_size"].value = self._meta.char_aspect_wh * size, size
+        self._update_projection(self._program)
+        binder = UniformBinder.get(self._program)
+        binder.set("text_pos", tuple(pos))
+        binder.set("font_texture", 0)
+        binder.set("char_size", (self._meta.char_aspect_wh * size, size))
 
         self._vao.render(self._program, instances=len(self._text if self._text is not None else ""))
@@ -0,0 +1,322 @@
+from pathlib import Path
+from typing import Optional
+
+import moderngl
+import numpy
+
+from moderngl_window import resources
+from moderngl_window.meta import DataDescription, ProgramDescription, TextureDescription
+from moderngl_window.opengl.program import UniformBinder
+from moderngl_window.opengl.vao import VAO
+
+from .base import BaseText, FontMeta
+
+resources.register_dir(Path(__file__).parent.resolve())
+
+GLYPH_DTYPE = numpy.dtype(
+    [
+        ("position", numpy.float32, 2),
+        ("size", numpy.float32, 2),
+        ("color", numpy.float32, 4),
+        ("char", numpy.uint32),
+    ]
+)
+
+
+class _Label:
+    """A string and the glyph range it owns in the instance buffer"""
+
+    __slots__ = ("text", "pos", "size", "color", "offset", "capacity")
+
+    def __init__(
+        self,
+        text: str,
+        pos: tuple[float, float],
+        size: float,
+        color: tuple[float, float, float, float],
+    ):
+        self.text = text
+        self.pos = pos
+        self.size = size
+        self.color = color
+        self.offset = 0
+        self.capacity = 0
+
+
+class TextBatch2D(BaseText):
+    """Monospaced bitmapped text renderer drawing many strings at once.
+
+    Every glyph of every string is a record in one persistent instance
+    buffer. Each string owns a range of records with some spare room, so
+    changing a string only rewrites its own range and only the changed
+    part of the buffer is uploaded before the next draw. All strings are
+    drawn with a single instanced draw call.
+
+    Newlines start a new line below the previous one.
+
+    Example::
+
+        batch = TextBatch2D()
+        fps = batch.add("FPS: 0", (20, 20), size=16)
+        batch.add("Score", (20, 60), size=32, color=(1.0, 0.8, 0.0, 1.0))
+
+        def on_render(self, time, frame_time):
+            batch.update(fps, text="FPS: {:.0f}".format(self.timer.fps))
+            batch.draw()
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        """Create the renderer.
+
+        Args:
+            capacity (int): Initial number of glyphs the instance buffer can hold.
+                The buffer grows when needed
+        """
+        super().__init__()
+
+        meta = FontMeta(resources.data.load(DataDescription(path="bitmapped/text/meta.json")))
+        self._texture = resources.textures.load(
+            TextureDescription(
+                path="bitmapped/textures/VeraMono.png",
+                kind="array",
+                mipmap=True,
+                layers=meta.characters,
+            )
+        )
+        self._program = resources.programs.load(
+            ProgramDescription(path="bitmapped/programs/text_batch_2d.glsl")
+        )
+
+        self._init(meta)
+
+        assert self.ctx is not None, "There was a problem, we do not have a context"
+
+        self._data = numpy.zeros(max(capacity, 1), dtype=GLYPH_DTYPE)
+        self._glyph_buffer = self.ctx.buffer(self._data)
+
+        # Each instance is a single point expanded into a quad by the geometry shader
+        self._vao = VAO("textbatch", mode=moderngl.POINTS)
+        self._vao.buffer(
+            self._glyph_buffer,
+            "2f 2f 4f 1u/i",
+            ["in_position", "in_size", "in_color", "in_char_id"],
+        )
+
+        self._labels: dict[int, _Label] = {}
+        self._next_id = 0
+        # Free glyph ranges (offset: capacity) below the end of the used range
+        self._free: dict[int, int] = {}
+        self._end = 0
+        # Range of glyphs changed since the last upload
+        self._dirty_start = 0
+        self._dirty_end = 0
+
+    @property
+    def glyphs(self) -> int:
+        """int: Number of glyph records drawn, including spare room and free ranges"""
+        return self._end
+
+    @property
+    def capacity(self) -> int:
+        """int: Number of glyphs the instance buffer can currently hold"""
+        return len(self._data)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, label: int) -> bool:
+        return label in self._labels
+
+    def add(
+        self,
+        text: str,
+        pos: tuple[float, float],
+        size: float = 24.0,
+        color: tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0),
+    ) -> int:
+        """Add a string to the batch.
+
+        Args:
+            text (str): The string
+            pos (tuple): Pixel position of the center of the first character
+            size (float): Character height in pixels
+            color (tuple): RGBA color multiplied with the glyphs
+        Returns:
+            int: Id used to update or remove the string
+        """
+        label = _Label(text, pos, size, color)
+        self._allocate(label)
+        self._write(label)
+
+        self._next_id += 1
+        self._labels[self._next_id] = label
+        return self._next_id
+
+    def update(
+        self,
+        label: int,
+        text: Optional[str] = None,
+        pos: Optional[tuple[float, float]] = None,
+        size: Optional[float] = None,
+        color: Optional[tuple[float, float, float, float]] = None,
+    ) -> None:
+        """Change a string in the batch. Nothing is uploaded if no values change.
+
+        Args:
+            label (int): Id returned by :py:meth:`add`
+            text (str): The new string
+            pos (tuple): The new position
+            size (float): The new character height
+            color (tuple): The new color
+        """
+        entry = self._labels[label]
+        changed = False
+        if text is not None and text != entry.text:
+            entry.text = text
+            changed = True
+        if pos is not None and tuple(pos) != tuple(entry.pos):
+            entry.pos = pos
+            changed = True
+        if size is not None and size != entry.size:
+            entry.size = size
+            changed = True
+        if color is not None and tuple(color) != tuple(entry.color):
+            entry.color = color
+            changed = True
+
+        if not changed:
+            return
+
+        if len(entry.text) > entry.capacity:
+            self._release_range(entry.offset, entry.capacity)
+            self._allocate(entry)
+
+        self._write(entry)
+
+    def get(self, label: int) -> str:
+        """Get a string in the batch.
+
+        Args:
+            label (int): Id returned by :py:meth:`add`
+        Returns:
+            str: The string
+        """
+        return self._labels[label].text
+
+    def remove(self, label: int) -> None:
+        """Remove a string from the batch.
+
+        Args:
+            label (int): Id returned by :py:meth:`add`
+        """
+        entry = self._labels.pop(label)
+        self._release_range(entry.offset, entry.capacity)
+
+    def clear(self) -> None:
+        """Remove all strings"""
+        self._labels = {}
+        self._free = {}
+        self._data["size"] = 0
+        self._mark_dirty(0, self._end)
+        self._end = 0
+
+    def draw(self) -> None:
+        """Upload the changed glyphs and draw all strings"""
+        if self._dirty_end > self._dirty_start:
+            self._glyph_buffer.write(
+                self._data[self._dirty_start : self._dirty_end],
+                offset=self._dirty_start * GLYPH_DTYPE.itemsize,
+            )
+            self._dirty_start = self._dirty_end = 0
+
+        if self._end == 0:
+            return
+
+        self._texture.use(location=0)
+        self._update_projection(self._program)
+        UniformBinder.get(self._program).set("font_texture", 0)
+
+        self._vao.render(self._program, vertices=1, instances=self._end)
+
+    def release(self) -> None:
+        """Release the instance buffer and vertex array"""
+        self._vao.release()
+
+    def _allocate(self, label: _Label) -> None:
+        """Find a glyph range for a string with some spare room for it to grow"""
+        capacity = max(-(-len(label.text) // 8) * 8, 8)
+
+        for offset, free in self._free.items():
+            if free >= capacity:
+                del self._free[offset]
+                if free > capacity:
+                    self._free[offset + capacity] = free - capacity
+                label.offset, label.capacity = offset, capacity
+                return
+
+        if self._end + capacity > len(self._data):
+            self._grow(self._end + capacity)
+
+        label.offset, label.capacity = self._end, capacity
+        self._end += capacity
+
+    def _release_range(self, offset: int, capacity: int) -> None:
+        """Hide the glyphs in a range and make it available again"""
+        self._data["size"][offset : offset + capacity] = 0
+        self._mark_dirty(offset, offset + capacity)
+
+        # Merge with the free neighbours so larger strings can reuse the space
+        capacity += self._free.pop(offset + capacity, 0)
+        for start, length in self._free.items():
+            if start + length == offset:
+                del self._free[start]
+                offset, capacity = start, length + capacity
+                break
+
+        # Shrink the drawn range when the end is free
+        if offset + capacity == self._end:
+            self._end = offset
+        else:
+            self._free[offset] = capacity
+
+    def _grow(self, size: int) -> None:
+        """Make the instance buffer hold at least ``size`` glyphs"""
+        data = numpy.zeros(max(size, len(self._data) * 2), dtype=GLYPH_DTYPE)
+        data[: len(self._data)] = self._data
+        self._data = data
+        self._glyph_buffer.orphan(self._data.nbytes)
+        # Orphaning drops the content of the buffer
+        self._mark_dirty(0, self._end)
+
+    def _write(self, label: _Label) -> None:
+        """Write the glyphs of a string into its range"""
+        assert self._meta is not None, "We are missing the information needed to write text"
+
+        chars = numpy.frombuffer(
+            label.text.encode("iso-8859-1", errors="replace"), dtype=numpy.uint8
+        )
+        count = len(chars)
+        index = numpy.arange(count)
+        newlines = chars == 10
+        line = numpy.cumsum(newlines) - newlines
+        column = index - numpy.maximum.accumulate(numpy.where(newlines, index + 1, 0))
+
+        width = self._meta.char_aspect_wh * label.size
+        glyphs = self._data[label.offset : label.offset + label.capacity]
+        glyphs["position"][:count, 0] = label.pos[0] + column * width
+        glyphs["position"][:count, 1] = label.pos[1] - line * label.size
+        glyphs["size"][:count] = width, label.size
+        glyphs["size"][:count][newlines] = 0
+        glyphs["size"][count:] = 0
+        glyphs["color"][:count] = label.color
+        glyphs["char"][:count] = self._lut[chars]
+        self._mark_dirty(label.offset, label.offset + label.capacity)
+
+    def _mark_dirty(self, start: int, end: int) -> None:
+        """Extend the range of glyphs uploaded before the next draw"""
+        if end <= start:
+            return
+        if self._dirty_end > self._dirty_start:
+            start = min(start, self._dirty_start)
+            end = max(end, self._dirty_end)
+        self._dirty_start, self._dirty_end = start, end
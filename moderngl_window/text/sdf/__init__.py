@@ -0,0 +1,5 @@
+from .cache import LayoutCache, layout_cache  # noqa
+from .font import GLYPH_DTYPE, Glyph, SDFFont, distance_field  # noqa
+from .label import SDFLabel  # noqa
+from .program import TextProgram  # noqa
+from .text_2d import SDFTextWriter2D  # noqa
@@ -0,0 +1,135 @@
+import weakref
+from collections import OrderedDict
+from typing import Optional
+
+import numpy
+import numpy.typing as npt
+
+from .font import SDFFont
+
+
+class LayoutCache:
+    """Least recently used cache of laid out strings.
+
+    Layouts are keyed by ``(string, font, size)`` so repeated strings such as
+    labels and numbers are only laid out once. A layout is computed again when
+    the atlas of the font has been rebuilt since it was cached. The cache does
+    not keep fonts alive. The layouts of a font are dropped when the font is
+    garbage collected or found released.
+
+    Example::
+
+        cache = LayoutCache(maxsize=4096)
+        glyphs = cache.layout(font, "Score", 24)
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Create the cache.
+
+        Args:
+            maxsize (int): Maximum number of layouts kept
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1, not {}".format(maxsize))
+
+        self._maxsize = maxsize
+        # Fonts are referenced by id. A finalizer drops their layouts when collected
+        self._layouts: OrderedDict[
+            tuple[str, int, Optional[float]], tuple[int, npt.NDArray[numpy.void]]
+        ] = OrderedDict()
+        self._fonts: dict[int, weakref.finalize] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """int: Maximum number of layouts kept"""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """int: Number of layouts found in the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """int: Number of layouts computed"""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def layout(
+        self, font: SDFFont, text: str, size: Optional[float] = None
+    ) -> npt.NDArray[numpy.void]:
+        """Get the layout of a string.
+
+        Args:
+            font (SDFFont): The font
+            text (str): The string
+            size (float): Font size in pixels. The size of the font if not set
+        Returns:
+            numpy.ndarray: Read only glyph records as returned by :py:meth:`SDFFont.layout`
+        Raises:
+            ValueError: If the font has been released
+        """
+        if font.released:
+            self.discard(font)
+            raise ValueError("Can't lay out text with a released font")
+
+        key = (text, id(font), size)
+        entry = self._layouts.get(key)
+        if entry is not None and entry[0] == font.atlas.version:
+            self._layouts.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+        self._misses += 1
+        data = font.layout(text, size)
+        data.flags.writeable = False
+        # Laying out can rasterize glyphs that rebuild the atlas
+        self._layouts[key] = (font.atlas.version, data)
+        self._layouts.move_to_end(key)
+        if id(font) not in self._fonts:
+            self._fonts[id(font)] = weakref.finalize(
+                font, self._font_collected, weakref.ref(self), id(font)
+            )
+        while len(self._layouts) > self._maxsize:
+            self._layouts.popitem(last=False)
+
+        return data
+
+    def discard(self, font: SDFFont) -> None:
+        """Remove all layouts of a font.
+
+        Args:
+            font (SDFFont): The font
+        """
+        finalizer = self._fonts.pop(id(font), None)
+        if finalizer is not None:
+            finalizer.detach()
+        self._discard(id(font))
+
+    def clear(self) -> None:
+        """Remove all layouts"""
+        for finalizer in self._fonts.values():
+            finalizer.detach()
+        self._fonts.clear()
+        self._layouts.clear()
+
+    def _discard(self, font_id: int) -> None:
+        """Remove the layouts of a font by id"""
+        for key in [key for key in self._layouts if key[1] == font_id]:
+            del self._layouts[key]
+
+    @staticmethod
+    def _font_collected(cache_ref: "weakref.ref[LayoutCache]", font_id: int) -> None:
+        """Drop the layouts of a garbage collected font"""
+        cache = cache_ref()
+        if cache is not None:
+            cache._fonts.pop(font_id, None)
+            cache._discard(font_id)
+
+
+#: The cache used by the text writers and labels unless another is given
+layout_cache = LayoutCache()
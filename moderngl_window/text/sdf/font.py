@@ -0,0 +1,325 @@
+import io
+import math
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import moderngl
+import numpy
+import numpy.typing as npt
+from PIL import Image, ImageDraw, ImageFont
+
+import moderngl_window
+from moderngl_window import resources
+from moderngl_window.atlas.base import ArrayImage
+from moderngl_window.atlas.simple_atlas import TextureAtlas
+from moderngl_window.meta import DataDescription
+
+#: Instance data of a laid out glyph. Position and size of the quad in
+#: pixels with y pointing up and the region of the glyph in the atlas
+GLYPH_DTYPE = numpy.dtype(
+    [
+        ("position", numpy.float32, 2),
+        ("size", numpy.float32, 2),
+        ("region", numpy.float32, 4),
+    ]
+)
+
+
+def distance_field(mask: npt.NDArray[numpy.uint8], spread: int) -> npt.NDArray[numpy.uint8]:
+    """Create a signed distance field from a coverage mask.
+
+    Pixels on the outline are 128. Values increase inside the glyph and
+    decrease outside reaching 255 and 0 ``spread`` pixels from the outline.
+
+    Args:
+        mask (numpy.ndarray): (height, width) coverage with 255 inside the glyph
+        spread (int): Distance in pixels covered by the field
+    Returns:
+        numpy.ndarray: (height, width) distance field
+    """
+    inside = mask >= 128
+    height, width = inside.shape
+    padded = numpy.pad(inside, spread)
+    # Pixels further away than the spread end up saturated
+    to_inside = numpy.full(inside.shape, spread + 0.5)
+    to_outside = numpy.full(inside.shape, spread + 0.5)
+
+    for dy in range(-spread, spread + 1):
+        for dx in range(-spread, spread + 1):
+            distance = math.hypot(dx, dy)
+            if distance == 0 or distance > spread:
+                continue
+            neighbor = padded[spread + dy : spread + dy + height, spread + dx : spread + dx + width]
+            numpy.minimum(to_inside, numpy.where(neighbor, distance, to_inside), out=to_inside)
+            numpy.minimum(to_outside, numpy.where(neighbor, to_outside, distance), out=to_outside)
+
+    # The outline is half a pixel from the centers of the pixels next to it
+    signed = numpy.where(inside, to_outside - 0.5, 0.5 - to_inside)
+    field = numpy.clip(signed / (2 * spread) + 0.5, 0.0, 1.0)
+    return numpy.round(field * 255).astype(numpy.uint8)
+
+
+class Glyph:
+    """Metrics of a glyph in pixels at the size of the font"""
+
+    __slots__ = ("char", "advance", "left", "bottom", "width", "height", "image")
+
+    def __init__(
+        self,
+        char: str,
+        advance: float,
+        left: float = 0.0,
+        bottom: float = 0.0,
+        width: int = 0,
+        height: int = 0,
+        image: Optional[ArrayImage] = None,
+    ):
+        #: The character
+        self.char = char
+        #: Horizontal distance to the next glyph
+        self.advance = advance
+        #: Left edge of the distance field relative to the pen position
+        self.left = left
+        #: Bottom edge of the distance field relative to the baseline
+        self.bottom = bottom
+        #: Width of the distance field
+        self.width = width
+        #: Height of the distance field
+        self.height = height
+        #: The distance field in the atlas. ``None`` for glyphs without any ink
+        self.image = image
+
+
+class SDFFont:
+    """A TrueType font rendered through signed distance fields.
+
+    Glyphs are rasterized on demand the first time they are used and
+    stored in a dynamic single channel :py:class:`~moderngl_window.atlas.simple_atlas.TextureAtlas`.
+    The distance field is generated once at the font size and stays crisp
+    when scaled, so a single atlas serves text of any size. Any unicode
+    character in the font can be used. Glyph metrics and kerning pairs
+    are cached.
+
+    Example::
+
+        font = SDFFont("fonts/NotoSans-Regular.ttf")
+        writer = SDFTextWriter2D(font)
+        writer.text = "Hello ModernGL!"
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        size: int = 48,
+        spread: int = 6,
+        atlas_size: tuple[int, int] = (512, 512),
+        ctx: Optional[moderngl.Context] = None,
+    ):
+        """Load the font.
+
+        Args:
+            path: Path to a TrueType or OpenType font found by the data finders.
+                Uses the default font shipped with Pillow if not set
+            size (int): Size in pixels the glyphs are rasterized at
+            spread (int): Distance in pixels covered by the distance fields
+            atlas_size (tuple): Initial size of the glyph atlas. It grows when full
+            ctx (moderngl.Context): The context. Uses the active context if not set
+        """
+        if path is None:
+            self._font = ImageFont.load_default(size)
+        else:
+            data = resources.data.load(DataDescription(path=str(path), kind="binary"))
+            self._font = ImageFont.truetype(io.BytesIO(data), size)
+
+        if not isinstance(self._font, ImageFont.FreeTypeFont):
+            raise ValueError("Pillow must be built with FreeType support to load fonts")
+
+        ctx = ctx or moderngl_window.ContextRefs.CONTEXT
+        assert ctx is not None, "There was a problem, we do not have a context"
+
+        self._size = size
+        self._spread = spread
+        self._ascent, self._descent = self._font.getmetrics()
+        self._atlas = TextureAtlas(ctx, *atlas_size, components=1, border=1)
+        self._glyphs: dict[str, Glyph] = {}
+        self._kerning: dict[tuple[str, str], float] = {}
+        self._released = False
+
+    @property
+    def size(self) -> int:
+        """int: Size in pixels the glyphs are rasterized at"""
+        return self._size
+
+    @property
+    def spread(self) -> int:
+        """int: Distance in pixels covered by the distance fields"""
+        return self._spread
+
+    @property
+    def ascent(self) -> int:
+        """int: Distance from the baseline to the top of the highest glyph"""
+        return self._ascent
+
+    @property
+    def descent(self) -> int:
+        """int: Distance from the baseline to the bottom of the lowest glyph"""
+        return self._descent
+
+    @property
+    def line_height(self) -> int:
+        """int: Distance between the baselines of two lines"""
+        return self._ascent + self._descent
+
+    @property
+    def released(self) -> bool:
+        """bool: Has the font been released?"""
+        return self._released
+
+    @property
+    def atlas(self) -> TextureAtlas:
+        """TextureAtlas: The atlas holding the distance fields"""
+        return self._atlas
+
+    @property
+    def glyphs(self) -> dict[str, Glyph]:
+        """dict: The glyphs rasterized so far"""
+        return self._glyphs
+
+    def glyph(self, char: str) -> Glyph:
+        """Get a glyph rasterizing it if needed.
+
+        Args:
+            char (str): The character
+        Returns:
+            Glyph: The glyph metrics
+        """
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self._rasterize(char)
+            self._glyphs[char] = glyph
+        return glyph
+
+    def preload(self, chars: Iterable[str]) -> None:
+        """Rasterize glyphs before they are used.
+
+        Args:
+            chars: The characters
+        """
+        for char in chars:
+            self.glyph(char)
+
+    def kerning(self, left: str, right: str) -> float:
+        """Get the adjustment of the advance between two characters.
+
+        Args:
+            left (str): The first character
+            right (str): The following character
+        Returns:
+            float: Pixels to add to the advance of the first character
+        """
+        pair = (left, right)
+        value = self._kerning.get(pair)
+        if value is None:
+            font = self._font
+            value = font.getlength(left + right) - font.getlength(left) - font.getlength(right)
+            self._kerning[pair] = value
+        return value
+
+    def layout(self, text: str, size: Optional[float] = None) -> npt.NDArray[numpy.void]:
+        """Lay out a string with proportional spacing.
+
+        The origin is the start of the baseline of the first line with
+        y pointing up. Newlines start a new line below.
+
+        Args:
+            text (str): The string
+            size (float): Font size in pixels. The size of the font if not set
+        Returns:
+            numpy.ndarray: Glyph records with the :py:data:`GLYPH_DTYPE` dtype
+        """
+        records: list[tuple[float, float, int, int, int, int, int, int]] = []
+        x = y = 0.0
+        previous: Optional[str] = None
+
+        for char in text:
+            if char == "\n":
+                x = 0.0
+                y -= self.line_height
+                previous = None
+                continue
+
+            glyph = self.glyph(char)
+            if previous is not None:
+                x += self.kerning(previous, char)
+
+            if glyph.image is not None:
+                records.append(
+                    (
+                        x + glyph.left,
+                        y + glyph.bottom,
+                        glyph.width,
+                        glyph.height,
+                        *self._atlas.get_region(glyph.image),
+                    )
+                )
+
+            x += glyph.advance
+            previous = char
+
+        data = numpy.empty(len(records), dtype=GLYPH_DTYPE)
+        if records:
+            values = numpy.array(records, dtype=numpy.float32)
+            scale = 1.0 if size is None else size / self._size
+            data["position"] = values[:, 0:2] * scale
+            data["size"] = values[:, 2:4] * scale
+            data["region"] = values[:, 4:8]
+        return data
+
+    def measure(self, text: str, size: Optional[float] = None) -> tuple[float, float]:
+        """Get the size of a string.
+
+        Args:
+            text (str): The string
+            size (float): Font size in pixels. The size of the font if not set
+        Returns:
+            tuple: Width of the longest line and the height of all lines
+        """
+        scale = 1.0 if size is None else size / self._size
+        lines = text.split("\n")
+        width = 0.0
+        for line in lines:
+            line_width = 0.0
+            for index, char in enumerate(line):
+                line_width += self.glyph(char).advance
+                if index > 0:
+                    line_width += self.kerning(line[index - 1], char)
+            width = max(width, line_width)
+
+        return width * scale, len(lines) * self.line_height * scale
+
+    def release(self) -> None:
+        """Release the atlas"""
+        if not self._released:
+            self._released = True
+            self._atlas.release()
+
+    def _rasterize(self, char: str) -> Glyph:
+        """Render a character and create its distance field"""
+        font = self._font
+        advance = font.getlength(char)
+        x0, y0, x1, y1 = (int(value) for value in font.getbbox(char, anchor="ls"))
+        if x1 <= x0 or y1 <= y0:
+            return Glyph(char, advance)
+
+        pad = self._spread
+        width, height = x1 - x0 + pad * 2, y1 - y0 + pad * 2
+        image = Image.new("L", (width, height))
+        ImageDraw.Draw(image).text((pad - x0, pad - y0), char, font=font, anchor="ls", fill=255)
+        mask = numpy.asarray(image)
+        if not mask.any():
+            return Glyph(char, advance)
+
+        field = ArrayImage(distance_field(mask, pad))
+        self._atlas.add(field)
+        # Pillow measures y downwards from the baseline
+        return Glyph(char, advance, x0 - pad, -y1 - pad, width, height, field)
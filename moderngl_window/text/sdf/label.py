@@ -0,0 +1,160 @@
+from typing import Optional
+
+import moderngl
+
+import moderngl_window
+from moderngl_window.opengl.vao import VAO
+
+from .cache import LayoutCache, layout_cache
+from .font import GLYPH_DTYPE, SDFFont
+from .program import TextProgram
+
+
+class SDFLabel:
+    """A retained piece of text drawn with a distance field font.
+
+    The label keeps its glyphs in its own buffer and only lays out and
+    uploads them again when the text, size or font changes. Moving the
+    label or changing its color only updates uniforms. Drawing a label
+    that did not change is a single draw call.
+
+    Example::
+
+        title = SDFLabel("Hello ModernGL!", pos=(20, 40), size=32)
+        score = SDFLabel("0", pos=(20, 80), font=title.font)
+
+        def on_render(self, time, frame_time):
+            score.text = str(points)  # Only uploaded when the points change
+            title.draw()
+            score.draw()
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        pos: tuple[float, float] = (0.0, 0.0),
+        size: float = 24.0,
+        color: tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0),
+        font: Optional[SDFFont] = None,
+        cache: Optional[LayoutCache] = None,
+    ):
+        """Create the label.
+
+        Args:
+            text (str): The string
+            pos (tuple): Pixel position of the start of the baseline of the first line
+            size (float): Font size in pixels
+            color (tuple): RGBA color
+            font (SDFFont): The font. Uses the default font shipped with Pillow if not set
+            cache (LayoutCache): Cache for the layouts. Uses the shared cache if not set
+        """
+        self.ctx = moderngl_window.ContextRefs.CONTEXT
+        assert self.ctx is not None, "There was a problem, we do not have a context"
+
+        self._text = text
+        self._pos = (pos[0], pos[1])
+        self._size = size
+        self._color = (color[0], color[1], color[2], color[3])
+        self._font = font or SDFFont(ctx=self.ctx)
+        self._cache = cache or layout_cache
+        self._program = TextProgram.get(self.ctx)
+
+        self._glyph_buffer = self.ctx.buffer(reserve=GLYPH_DTYPE.itemsize * max(len(text), 1))
+        self._vao = VAO("sdflabel", mode=moderngl.POINTS)
+        self._vao.buffer(self._glyph_buffer, "2f 2f 4f/i", ["in_position", "in_size", "in_region"])
+        self._glyphs = 0
+        self._dirty = True
+        self._version = -1
+
+    @property
+    def text(self) -> str:
+        """str: Get or set the string"""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        if value != self._text:
+            self._text = value
+            self._dirty = True
+
+    @property
+    def pos(self) -> tuple[float, float]:
+        """tuple: Get or set the position of the start of the baseline"""
+        return self._pos
+
+    @pos.setter
+    def pos(self, value: tuple[float, float]) -> None:
+        self._pos = (value[0], value[1])
+
+    @property
+    def size(self) -> float:
+        """float: Get or set the font size in pixels"""
+        return self._size
+
+    @size.setter
+    def size(self, value: float) -> None:
+        if value != self._size:
+            self._size = value
+            self._dirty = True
+
+    @property
+    def color(self) -> tuple[float, float, float, float]:
+        """tuple: Get or set the RGBA color"""
+        return self._color
+
+    @color.setter
+    def color(self, value: tuple[float, float, float, float]) -> None:
+        self._color = (value[0], value[1], value[2], value[3])
+
+    @property
+    def font(self) -> SDFFont:
+        """SDFFont: Get or set the font"""
+        return self._font
+
+    @font.setter
+    def font(self, value: SDFFont) -> None:
+        if value is not self._font:
+            self._font = value
+            self._dirty = True
+
+    @property
+    def dirty(self) -> bool:
+        """bool: Are the glyphs uploaded again on the next draw?"""
+        return self._dirty or self._version != self._font.atlas.version
+
+    def measure(self) -> tuple[float, float]:
+        """Get the size of the label.
+
+        Returns:
+            tuple: Width of the longest line and the height of all lines
+        """
+        return self._font.measure(self._text, self._size)
+
+    def draw(self) -> None:
+        """Draw the label uploading the glyphs first if they changed"""
+        if self.dirty:
+            self._upload()
+        if self._glyphs == 0:
+            return
+
+        program = self._program.use(self._font.atlas)
+        self._program.set("text_pos", self._pos)
+        self._program.set("scale", 1.0)
+        self._program.set("color", self._color)
+
+        self._vao.render(program, vertices=1, instances=self._glyphs)
+
+    def release(self) -> None:
+        """Release the glyph buffer and vertex array"""
+        self._vao.release()
+
+    def _upload(self) -> None:
+        """Lay out the text at the label size and write it to the glyph buffer"""
+        data = self._cache.layout(self._font, self._text, self._size)
+        self._version = self._font.atlas.version
+        self._glyphs = len(data)
+        if data.nbytes > self._glyph_buffer.size:
+            self._glyph_buffer.orphan(data.nbytes)
+        if self._glyphs > 0:
+            self._glyph_buffer.write(data)
+        self._dirty = False
@@ -0,0 +1,88 @@
+import weakref
+from pathlib import Path
+from typing import Any, Optional
+
+import glm
+import moderngl
+
+from moderngl_window import resources
+from moderngl_window.atlas.simple_atlas import TextureAtlas
+from moderngl_window.meta import ProgramDescription
+from moderngl_window.opengl.program import UniformBinder
+
+resources.register_dir(Path(__file__).parent.resolve())
+
+_programs: "weakref.WeakKeyDictionary[moderngl.Context, TextProgram]" = weakref.WeakKeyDictionary()
+
+
+class TextProgram:
+    """The distance field text program shared by all text in a context.
+
+    Uniforms are written through a
+    :py:class:`~moderngl_window.opengl.program.UniformBinder` so only
+    changed values are uploaded. The projection is only computed again
+    when the viewport changes, so drawing text that did not change
+    costs little more than the draw call.
+    """
+
+    def __init__(self, ctx: moderngl.Context):
+        """Load the program.
+
+        Args:
+            ctx (moderngl.Context): The context
+        """
+        self.ctx = ctx
+        self.program = resources.programs.load(ProgramDescription(path="sdf/programs/text_2d.glsl"))
+        #: UniformBinder: Cached uniform writes for the program
+        self.binder = UniformBinder.get(self.program)
+        self._viewport: Optional[tuple[int, int, int, int]] = None
+        self._projection = glm.mat4()
+
+    @classmethod
+    def get(cls, ctx: moderngl.Context) -> "TextProgram":
+        """Get the program of a context creating it on first use.
+
+        Args:
+            ctx (moderngl.Context): The context
+        """
+        program = _programs.get(ctx)
+        if program is None:
+            program = _programs[ctx] = cls(ctx)
+        return program
+
+    def use(self, atlas: TextureAtlas) -> moderngl.Program:
+        """Bind the atlas and update the projection for the current viewport.
+
+        Args:
+            atlas (TextureAtlas): The atlas of the font
+        Returns:
+            moderngl.Program: The program
+        """
+        assert self.ctx.fbo is not None, "The current context do not have a framebuffer"
+
+        viewport = self.ctx.fbo.viewport
+        if viewport != self._viewport:
+            self._viewport = viewport
+            self._projection = glm.ortho(
+                0,  # left
+                viewport[2],  # right
+                0,  # bottom
+                viewport[3],  # top
+                1.0,  # near
+                -1.0,  # far
+            )
+        self.binder.write("m_proj", self._projection)
+
+        atlas.texture.use(location=0)
+        self.set("font_texture", 0)
+        self.set("atlas_size", atlas.size)
+        return self.program
+
+    def set(self, name: str, value: Any) -> None:
+        """Set a uniform if the value changed.
+
+        Args:
+            name (str): Name of the uniform
+            value: The value
+        """
+        self.binder.set(name, value)
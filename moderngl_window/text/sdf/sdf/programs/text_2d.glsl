@@ -0,0 +1,79 @@
+#version 330
+
+#if defined VERTEX_SHADER
+
+in vec2 in_position;
+in vec2 in_size;
+in vec4 in_region;
+
+out vec2 vs_size;
+out vec4 vs_region;
+
+void main() {
+    gl_Position = vec4(in_position, 0.0, 1.0);
+    vs_size = in_size;
+    vs_region = in_region;
+}
+
+#elif defined GEOMETRY_SHADER
+
+layout (points) in;
+layout (triangle_strip, max_vertices = 4) out;
+
+uniform mat4 m_proj;
+uniform vec2 text_pos;
+uniform float scale;
+uniform vec2 atlas_size;
+
+in vec2 vs_size[1];
+in vec4 vs_region[1];
+out vec2 uv;
+
+void main() {
+    // Lower left corner and size of the quad
+    vec2 pos = text_pos + gl_in[0].gl_Position.xy * scale;
+    vec2 size = vs_size[0] * scale;
+
+    // The first row of the glyph is at the top of the quad
+    vec2 uv_min = vs_region[0].xy / atlas_size;
+    vec2 uv_max = (vs_region[0].xy + vs_region[0].zw) / atlas_size;
+
+    // upper right
+    uv = vec2(uv_max.x, uv_min.y);
+    gl_Position = m_proj * vec4(pos + size, 0.0, 1.0);
+    EmitVertex();
+
+    // upper left
+    uv = uv_min;
+    gl_Position = m_proj * vec4(pos + vec2(0.0, size.y), 0.0, 1.0);
+    EmitVertex();
+
+    // lower right
+    uv = uv_max;
+    gl_Position = m_proj * vec4(pos + vec2(size.x, 0.0), 0.0, 1.0);
+    EmitVertex();
+
+    // lower left
+    uv = vec2(uv_min.x, uv_max.y);
+    gl_Position = m_proj * vec4(pos, 0.0, 1.0);
+    EmitVertex();
+
+    EndPrimitive();
+}
+
+#elif defined FRAGMENT_SHADER
+
+out vec4 fragColor;
+uniform sampler2D font_texture;
+uniform vec4 color;
+in vec2 uv;
+
+void main()
+{
+    // The outline is at 0.5. Smooth over about one pixel at any scale
+    float dist = texture(font_texture, uv).r;
+    float width = max(fwidth(dist), 1e-4);
+    float alpha = smoothstep(0.5 - width, 0.5 + width, dist);
+    fragColor = vec4(color.rgb, color.a * alpha);
+}
+#endif
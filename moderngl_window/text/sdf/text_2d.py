@@ -0,0 +1,100 @@
+from typing import Optional
+
+import moderngl
+
+import moderngl_window
+from moderngl_window.opengl.vao import VAO
+
+from .cache import LayoutCache, layout_cache
+from .font import GLYPH_DTYPE, SDFFont
+from .program import TextProgram
+
+
+class SDFTextWriter2D:
+    """Proportional text renderer using signed distance field fonts.
+
+    The string is laid out once when set and drawn at any size without
+    losing sharpness. Layouts are shared through a :py:class:`LayoutCache`.
+
+    Example::
+
+        writer = SDFTextWriter2D(SDFFont("fonts/NotoSans-Regular.ttf"))
+        writer.text = "Hello ModernGL!"
+        writer.draw((20, 20), size=32)
+    """
+
+    def __init__(self, font: Optional[SDFFont] = None, cache: Optional[LayoutCache] = None) -> None:
+        """Create the writer.
+
+        Args:
+            font (SDFFont): The font. Uses the default font shipped with Pillow if not set
+            cache (LayoutCache): Cache for the layouts. Uses the shared cache if not set
+        """
+        self.ctx = moderngl_window.ContextRefs.CONTEXT
+        assert self.ctx is not None, "There was a problem, we do not have a context"
+
+        self._font = font or SDFFont(ctx=self.ctx)
+        self._cache = cache or layout_cache
+        self._program = TextProgram.get(self.ctx)
+        self._glyph_buffer = self.ctx.buffer(reserve=GLYPH_DTYPE.itemsize * 256)
+
+        self._vao = VAO("sdftextwriter", mode=moderngl.POINTS)
+        self._vao.buffer(self._glyph_buffer, "2f 2f 4f/i", ["in_position", "in_size", "in_region"])
+
+        self._text: Optional[str] = None
+        self._glyphs = 0
+        self._version = -1
+        #: RGBA color of the text
+        self.color: tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
+
+    @property
+    def font(self) -> SDFFont:
+        """SDFFont: The font"""
+        return self._font
+
+    @property
+    def text(self) -> Optional[str]:
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        if value == self._text and self._version == self._font.atlas.version:
+            return
+
+        self._text = value
+        self._upload()
+
+    def draw(self, pos: tuple[float, float], size: float = 24.0) -> None:
+        """Draw the text.
+
+        Args:
+            pos (tuple): Pixel position of the start of the baseline of the first line
+            size (float): Font size in pixels
+        """
+        if self._text is not None and self._version != self._font.atlas.version:
+            # The atlas was rebuilt and the glyphs moved
+            self._upload()
+        if self._glyphs == 0:
+            return
+
+        program = self._program.use(self._font.atlas)
+        self._program.set("text_pos", tuple(pos))
+        self._program.set("scale", size / self._font.size)
+        self._program.set("color", tuple(self.color))
+
+        self._vao.render(program, vertices=1, instances=self._glyphs)
+
+    def _upload(self) -> None:
+        """Lay out the text and write it to the glyph buffer"""
+        assert self._text is not None
+        data = self._cache.layout(self._font, self._text)
+        self._version = self._font.atlas.version
+        self._glyphs = len(data)
+        if data.nbytes > self._glyph_buffer.size:
+            self._glyph_buffer.orphan(data.nbytes)
+        if self._glyphs > 0:
+            self._glyph_buffer.write(data)
+
+    def release(self) -> None:
+        """Release the glyph buffer and vertex array"""
+        self._vao.release()
@@ -1,4 +1,17 @@
 from .base import BaseTimer as BaseTimer
 from .clock import Timer as Timer
+from .fixed import FixedTimer as FixedTimer
+from .pacing import FramePacer as FramePacer
+from .perf import FixedStep as FixedStep
+from .perf import PerfTimer as PerfTimer
+from .stats import FrameTimeStats as FrameTimeStats
 
-__all__ = ["BaseTimer", "Timer"]
+__all__ = [
+    "BaseTimer",
+    "Timer",
+    "PerfTimer",
+    "FixedTimer",
+    "FixedStep",
+    "FramePacer",
+    "FrameTimeStats",
+]
@@ -2,6 +2,7 @@ import time
 from typing import Any, Optional
 
 from moderngl_window.timers.base import BaseTimer
+from moderngl_window.timers.stats import FrameTimeStats
 
 
 class Timer(BaseTimer):
@@ -15,6 +16,8 @@ class Timer(BaseTimer):
         self._offset = 0.0
         self._frames = 0  # similar to ticks
         self._fps = 0.0
+        #: Frame times of the recent frames
+        self.stats = FrameTimeStats()
 
     @property
     def is_paused(self) -> bool:
@@ -76,6 +79,7 @@ class Timer(BaseTimer):
         # Avoid division by zero on first frame
         if delta > 0:
             self._fps = 1.0 / delta
+            self.stats.add(delta)
         else:
             self._fps = 0.0
 
@@ -0,0 +1,136 @@
+import time
+from typing import Any, Optional
+
+from moderngl_window.timers.base import BaseTimer
+
+
+class FixedTimer(BaseTimer):
+    """Timer advancing a fixed amount of time every frame.
+
+    The time is independent of the wall clock. Every call to
+    :py:meth:`next_frame` moves the time exactly ``1 / framerate``
+    seconds forward no matter how long the frame took to render.
+    This makes rendering deterministic and is used by the offline
+    render mode for capturing videos.
+    """
+
+    def __init__(self, framerate: float = 60.0, **kwargs: Any) -> None:
+        """Create a fixed step timer.
+
+        Args:
+            framerate (float): Number of frames per second of virtual time
+        """
+        if framerate <= 0:
+            raise ValueError("framerate must be larger than 0, not {}".format(framerate))
+
+        self._framerate = float(framerate)
+        self._base_time = 0.0
+        self._steps = 0
+        self._frames = 0
+        self._paused = False
+        self._start_time: Optional[float] = None
+
+    @property
+    def framerate(self) -> float:
+        """float: Frames per second of virtual time"""
+        return self._framerate
+
+    @property
+    def frame_time(self) -> float:
+        """float: The fixed amount of time between frames in seconds"""
+        return 1.0 / self._framerate
+
+    @property
+    def frames(self) -> int:
+        """int: Number of frames since the timer was started"""
+        return self._frames
+
+    @property
+    def is_paused(self) -> bool:
+        """bool: The pause state of the timer"""
+        return self._paused
+
+    @property
+    def is_running(self) -> bool:
+        """bool: Is the timer currently running?"""
+        return not self._paused
+
+    @property
+    def time(self) -> float:
+        """Get or set the current time.
+        This can be used to jump around in the timeline.
+
+        Returns:
+            The current time in seconds
+        """
+        # Multiply instead of accumulating to avoid drift over long renders
+        return self._base_time + self._steps / self._framerate
+
+    @time.setter
+    def time(self, value: float) -> None:
+        self._base_time = max(value, 0.0)
+        self._steps = 0
+
+    @property
+    def fps(self) -> float:
+        """Get the current frames per second."""
+        return 0.0 if self._paused else self._framerate
+
+    @property
+    def fps_average(self) -> float:
+        """The average number of frames rendered per second of wall time"""
+        if self._start_time is None or self._frames == 0:
+            return 0.0
+
+        duration = time.perf_counter() - self._start_time
+        return self._frames / duration if duration > 0 else 0.0
+
+    def next_frame(self) -> tuple[float, float]:
+        """
+        Get the time and frametime for the next frame.
+        This should only be called once per frame.
+
+        The first frame starts at the current time. The following frames
+        are moved one step forward unless the timer is paused.
+
+        Returns:
+            tuple[float, float]: current time and frametime
+        """
+        self._frames += 1
+        if self._frames == 1 or self._paused:
+            return self.time, 0.0
+
+        self._steps += 1
+        return self.time, self.frame_time
+
+    def start(self) -> None:
+        """Start the timer initially or resume after pause"""
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        elif self._paused:
+            self._paused = False
+        else:
+            print("The timer is already started")
+
+    def pause(self) -> None:
+        """Pause the timer"""
+        self._paused = True
+
+    def toggle_pause(self) -> None:
+        """Toggle the paused state"""
+        if self.is_paused:
+            self.start()
+        else:
+            self.pause()
+
+    def stop(self) -> tuple[float, float]:
+        """
+        Stop the timer. Should only be called once when stopping the timer.
+
+        Returns:
+            tuple[float, float]: Current position in the timer, actual running duration
+        """
+        if self._start_time is None:
+            return 0.0, 0.0
+
+        return self.time, time.perf_counter() - self._start_time
@@ -0,0 +1,151 @@
+import time
+from typing import Callable, Optional
+
+from moderngl_window.timers.stats import FrameTimeStats
+
+
+class FramePacer:
+    """Keeps a steady framerate by waiting for the start of each frame.
+
+    Frames start at fixed intervals of ``1 / fps`` seconds. Waiting sleeps
+    until shortly before the deadline and busy-waits the remaining time
+    using ``time.perf_counter`` since ``time.sleep`` can overshoot by
+    several milliseconds on many systems. Deadlines advance by exactly
+    one interval so small errors do not accumulate. A frame finishing
+    late starts the next interval right away instead of trying to catch up.
+
+    The time spent working between the waits is compared to the frame
+    budget. When the average work time exceeds the budget, or drops well
+    below it again, ``budget_func`` is called so the application can lower
+    or raise the render resolution or quality.
+
+    Example::
+
+        pacer = FramePacer(60, budget_func=on_budget)
+        while running:
+            pacer.wait()
+            render()
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        spin: float = 0.002,
+        budget_func: Optional[Callable[[bool, float], None]] = None,
+        headroom: float = 0.75,
+        smoothing: float = 0.1,
+        cooldown: int = 30,
+    ):
+        """Create the pacer.
+
+        Args:
+            fps (float): The target framerate
+            spin (float): Seconds before the deadline to stop sleeping and busy-wait
+            budget_func: Called with ``(exceeded, frame_time)`` when the average
+                work time crosses the budget
+            headroom (float): Fraction of the budget the work time must drop
+                below before the budget is reported as recovered
+            smoothing (float): Weight of the latest frame in the average work time
+            cooldown (int): Minimum number of frames between calls to ``budget_func``
+        """
+        if fps <= 0:
+            raise ValueError("fps must be larger than 0, not {}".format(fps))
+
+        self._interval = 1.0 / fps
+        self._spin = max(spin, 0.0)
+        self.budget_func = budget_func
+        self._headroom = headroom
+        self._smoothing = smoothing
+        self._cooldown = cooldown
+        self._deadline: Optional[float] = None
+        self._work_start: Optional[float] = None
+        self._work_time = 0.0
+        self._exceeded = False
+        self._frames_since_change = 0
+        #: Work time of the recent frames
+        self.stats = FrameTimeStats()
+
+    @property
+    def fps(self) -> float:
+        """float: The target framerate"""
+        return 1.0 / self._interval
+
+    @fps.setter
+    def fps(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError("fps must be larger than 0, not {}".format(value))
+        self._interval = 1.0 / value
+
+    @property
+    def budget(self) -> float:
+        """float: Seconds available for each frame"""
+        return self._interval
+
+    @property
+    def work_time(self) -> float:
+        """float: Average time in seconds spent between the waits"""
+        return self._work_time
+
+    @property
+    def exceeded(self) -> bool:
+        """bool: Is the average work time over the budget?"""
+        return self._exceeded
+
+    def wait(self) -> float:
+        """Wait for the start of the next frame.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        now = time.perf_counter()
+        if self._work_start is not None:
+            self._record(now - self._work_start)
+
+        if self._deadline is None or now - self._deadline > self._interval:
+            # First frame or running late. Start over from now
+            self._deadline = now + self._interval
+            waited = 0.0
+        else:
+            deadline = self._deadline
+            remaining = deadline - now - self._spin
+            if remaining > 0:
+                time.sleep(remaining)
+            while time.perf_counter() < deadline:
+                pass
+            waited = time.perf_counter() - now
+            self._deadline = deadline + self._interval
+
+        self._work_start = time.perf_counter()
+        return waited
+
+    def reset(self) -> None:
+        """Forget the deadline and work times. Used after pausing"""
+        self._deadline = None
+        self._work_start = None
+        self._work_time = 0.0
+        self._exceeded = False
+        self._frames_since_change = 0
+        self.stats.reset()
+
+    def _record(self, work_time: float) -> None:
+        """Update the average work time and report budget changes"""
+        self.stats.add(work_time)
+        if self.stats.count == 1:
+            self._work_time = work_time
+        else:
+            self._work_time += (work_time - self._work_time) * self._smoothing
+
+        self._frames_since_change += 1
+        if self._frames_since_change < self._cooldown:
+            return
+
+        if not self._exceeded and self._work_time > self._interval:
+            self._exceeded = True
+        elif self._exceeded and self._work_time < self._interval * self._headroom:
+            self._exceeded = False
+        else:
+            return
+
+        self._frames_since_change = 0
+        if self.budget_func is not None:
+            self.budget_func(self._exceeded, self._work_time)
@@ -0,0 +1,218 @@
+import time
+from typing import Any, Optional
+
+from moderngl_window.timers.base import BaseTimer
+from moderngl_window.timers.stats import FrameTimeStats
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class PerfTimer(BaseTimer):
+    """Timer based on the monotonic ``time.perf_counter_ns``.
+
+    Unlike ``time.time`` the performance counter is not affected by
+    system clock adjustments and has the highest resolution available.
+    All time is kept in integer nanoseconds and only converted to
+    seconds when reported, so no error accumulates over long uptimes.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._start_time: Optional[int] = None
+        self._pause_time: Optional[int] = None
+        self._last_frame = 0
+        self._last_delta = 0
+        self._offset = 0
+        self._frames = 0
+        self._fps = 0.0
+        #: Frame times of the recent frames
+        self.stats = FrameTimeStats()
+
+    @property
+    def is_paused(self) -> bool:
+        """bool: The pause state of the timer"""
+        return self._pause_time is not None
+
+    @property
+    def is_running(self) -> bool:
+        """bool: Is the timer currently running?"""
+        return self._pause_time is None
+
+    @property
+    def time_ns(self) -> int:
+        """int: The current time in nanoseconds"""
+        if self._start_time is None:
+            return 0
+
+        now = self._pause_time if self._pause_time is not None else time.perf_counter_ns()
+        return now - self._start_time - self._offset
+
+    @property
+    def time(self) -> float:
+        """Get or set the current time.
+        This can be used to jump around in the timeline.
+
+        Returns:
+            The current time in seconds
+        """
+        return self.time_ns / NS_PER_SECOND
+
+    @time.setter
+    def time(self, value: float) -> None:
+        value_ns = max(round(value * NS_PER_SECOND), 0)
+        self._offset += self.time_ns - value_ns
+
+    @property
+    def frame_time_ns(self) -> int:
+        """int: The frametime returned by the last :py:meth:`next_frame` in nanoseconds"""
+        return self._last_delta
+
+    @property
+    def fps_average(self) -> float:
+        """The average fps since the timer was started"""
+        current = self.time_ns
+        if self._frames == 0 or current <= 0:
+            return 0.0
+        return self._frames * NS_PER_SECOND / current
+
+    @property
+    def fps(self) -> float:
+        """Get the current frames per second."""
+        return self._fps
+
+    def next_frame(self) -> tuple[float, float]:
+        """
+        Get the time and frametime for the next frame.
+        This should only be called once per frame.
+
+        Returns:
+            tuple[float, float]: current time and frametime
+        """
+        self._frames += 1
+        current = self.time_ns
+        delta, self._last_frame = current - self._last_frame, current
+        self._last_delta = delta
+
+        # Avoid division by zero on first frame
+        if delta > 0:
+            self._fps = NS_PER_SECOND / delta
+            self.stats.add(delta / NS_PER_SECOND)
+        else:
+            self._fps = 0.0
+
+        return current / NS_PER_SECOND, delta / NS_PER_SECOND
+
+    def start(self) -> None:
+        """Start the timer initially or resume after pause"""
+        if self._start_time is None:
+            self._start_time = time.perf_counter_ns()
+            self._last_frame = 0
+        elif self._pause_time is not None:
+            self._offset += time.perf_counter_ns() - self._pause_time
+            self._pause_time = None
+        else:
+            print("The timer is already started")
+
+    def pause(self) -> None:
+        """Pause the timer"""
+        if self._pause_time is None:
+            self._pause_time = time.perf_counter_ns()
+
+    def toggle_pause(self) -> None:
+        """Toggle the paused state"""
+        if self.is_paused:
+            self.start()
+        else:
+            self.pause()
+
+    def stop(self) -> tuple[float, float]:
+        """
+        Stop the timer. Should only be called once when stopping the timer.
+
+        Returns:
+            tuple[float, float]: Current position in the timer, actual running duration
+        """
+        if self._start_time is None:
+            return 0.0, 0.0
+
+        duration = time.perf_counter_ns() - self._start_time
+        return self.time_ns / NS_PER_SECOND, duration / NS_PER_SECOND
+
+
+class FixedStep:
+    """Accumulates frame time and splits it into fixed size steps.
+
+    Used for physics-style updates that must run with a constant
+    timestep independent of the framerate. The leftover time is kept
+    in integer nanoseconds and carried over to the next frame.
+
+    Example::
+
+        step = FixedStep(1 / 120)
+
+        def on_render(self, time, frame_time):
+            for _ in range(step.advance_ns(self.timer.frame_time_ns)):
+                world.update(step.step)
+            world.draw(interpolation=step.alpha)
+    """
+
+    def __init__(self, step: float, max_steps: int = 8):
+        """Create the accumulator.
+
+        Args:
+            step (float): The timestep in seconds
+            max_steps (int): Maximum number of steps per frame. Time beyond
+                this is dropped so a slow frame can't cause a spiral of ever longer frames
+        """
+        if step <= 0:
+            raise ValueError("step must be larger than 0, not {}".format(step))
+
+        self._step_ns = max(round(step * NS_PER_SECOND), 1)
+        self._max_steps = max_steps
+        self._accumulator = 0
+        self._steps = 0
+
+    @property
+    def step(self) -> float:
+        """float: The timestep in seconds"""
+        return self._step_ns / NS_PER_SECOND
+
+    @property
+    def steps(self) -> int:
+        """int: Total number of steps taken"""
+        return self._steps
+
+    @property
+    def alpha(self) -> float:
+        """float: Fraction of a step left over. Used to interpolate between two steps"""
+        return self._accumulator / self._step_ns
+
+    def advance(self, frame_time: float) -> int:
+        """Add the time of a frame.
+
+        Args:
+            frame_time (float): The frame time in seconds
+        Returns:
+            int: Number of steps to run this frame
+        """
+        return self.advance_ns(round(frame_time * NS_PER_SECOND))
+
+    def advance_ns(self, frame_time: int) -> int:
+        """Add the time of a frame in nanoseconds.
+
+        Args:
+            frame_time (int): The frame time in nanoseconds
+        Returns:
+            int: Number of steps to run this frame
+        """
+        self._accumulator += max(frame_time, 0)
+        steps, self._accumulator = divmod(self._accumulator, self._step_ns)
+        if self._max_steps > 0 and steps > self._max_steps:
+            steps = self._max_steps
+            self._accumulator = 0
+
+        self._steps += steps
+        return steps
+
+    def reset(self) -> None:
+        """Drop the accumulated time"""
+        self._accumulator = 0
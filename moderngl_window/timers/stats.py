@@ -0,0 +1,118 @@
+from typing import Iterable
+
+import numpy
+import numpy.typing as npt
+
+
+class FrameTimeStats:
+    """Statistics over the most recent frame times.
+
+    Frame times are stored in a fixed size ring so recording a frame
+    never allocates. Percentiles are computed on demand.
+
+    Example::
+
+        stats = timer.stats
+        print(f"p50 {stats.p50 * 1000:.2f} ms, p99 {stats.p99 * 1000:.2f} ms")
+    """
+
+    def __init__(self, size: int = 1000):
+        """Create the statistics.
+
+        Args:
+            size (int): Number of frame times to keep
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1, not {}".format(size))
+
+        self._values = numpy.zeros(size, dtype=numpy.float64)
+        self._index = 0
+        self._count = 0
+
+    @property
+    def size(self) -> int:
+        """int: Maximum number of frame times kept"""
+        return len(self._values)
+
+    @property
+    def count(self) -> int:
+        """int: Number of frame times currently kept"""
+        return self._count
+
+    @property
+    def values(self) -> npt.NDArray[numpy.float64]:
+        """numpy.ndarray: Copy of the kept frame times from oldest to newest"""
+        if self._count < len(self._values):
+            return self._values[: self._count].copy()
+        return numpy.roll(self._values, -self._index)
+
+    @property
+    def mean(self) -> float:
+        """float: Mean frame time in seconds. 0 without any frames"""
+        if self._count == 0:
+            return 0.0
+        return float(self._values[: self._count].mean())
+
+    @property
+    def max(self) -> float:
+        """float: Longest frame time in seconds. 0 without any frames"""
+        if self._count == 0:
+            return 0.0
+        return float(self._values[: self._count].max())
+
+    @property
+    def p50(self) -> float:
+        """float: Median frame time in seconds"""
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float:
+        """float: 95th percentile of the frame times in seconds"""
+        return self.percentile(95)
+
+    @property
+    def p99(self) -> float:
+        """float: 99th percentile of the frame times in seconds"""
+        return self.percentile(99)
+
+    def add(self, frame_time: float) -> None:
+        """Record a frame time.
+
+        Args:
+            frame_time (float): Duration of the frame in seconds
+        """
+        self._values[self._index] = frame_time
+        self._index = (self._index + 1) % len(self._values)
+        self._count = min(self._count + 1, len(self._values))
+
+    def percentile(self, q: float) -> float:
+        """Get a percentile of the frame times.
+
+        Args:
+            q (float): Percentile between 0 and 100
+        Returns:
+            float: The frame time in seconds. 0 without any frames
+        """
+        if self._count == 0:
+            return 0.0
+        return float(numpy.percentile(self._values[: self._count], q))
+
+    def percentiles(self, qs: Iterable[float] = (50, 95, 99)) -> dict[float, float]:
+        """Get several percentiles of the frame times at once.
+
+        Args:
+            qs: Percentiles between 0 and 100
+        Returns:
+            dict: Frame time in seconds for each percentile
+        """
+        qs = list(qs)
+        if self._count == 0:
+            return {q: 0.0 for q in qs}
+
+        values = numpy.percentile(self._values[: self._count], qs)
+        return {q: float(value) for q, value in zip(qs, values)}
+
+    def reset(self) -> None:
+        """Remove all recorded frame times"""
+        self._index = 0
+        self._count = 0
@@ -1,16 +1,70 @@
-import sched
-import time
-from typing import Any, Callable
+import heapq
+from time import perf_counter
+from typing import Any, Callable, Optional
 
 from moderngl_window.timers.base import BaseTimer
 
+#: Catch-up policy running a late recurring event once and dropping the missed
+#: runs. The event stays on its original schedule
+SKIP = "skip"
+#: Catch-up policy running a late recurring event once and restarting its
+#: schedule from the time it ran
+COALESCE = "coalesce"
+#: Catch-up policy running a late recurring event once for every missed run.
+#: The event stays on its original schedule
+BURST = "burst"
+
+CATCH_UP_POLICIES = (SKIP, COALESCE, BURST)
+
+# Minimum number of cancelled events in the heap before it is rebuilt
+_COMPACT_MIN_SIZE = 64
+
+
+class _Event:
+    """A scheduled action. Recurring events reuse the same record for every run"""
+
+    __slots__ = ("id", "action", "arguments", "kwargs", "interval", "catch_up", "cancelled")
+
+    def __init__(
+        self,
+        id: int,
+        action: Callable[..., Any],
+        arguments: tuple[Any, ...],
+        kwargs: dict[Any, Any],
+        interval: float = 0.0,
+        catch_up: str = COALESCE,
+    ):
+        self.id = id
+        self.action = action
+        self.arguments = arguments
+        self.kwargs = kwargs
+        self.interval = interval
+        self.catch_up = catch_up
+        self.cancelled = False
+
 
 class Scheduler:
-    def __init__(self, timer: BaseTimer):
+    """Run actions at a point in time, after a delay or repeatedly.
+
+    Events are kept in a heap ordered by time and priority and are
+    executed by calling :py:meth:`execute` every frame, usually from
+    ``on_render``. Time is read from a timer, so pausing or seeking the
+    timer affects the events as well.
+
+    Cancelled events are only marked and dropped when they reach the top
+    of the heap, so cancelling is constant time. With a ``budget`` the
+    events due in a frame may be spread over several frames. A recurring
+    event that could not run on time is caught up according to its
+    catch-up policy: :py:data:`SKIP`, :py:data:`COALESCE` or :py:data:`BURST`.
+    """
+
+    def __init__(self, timer: BaseTimer, budget: Optional[float] = None):
         """Create a Scheduler object to handle events.
 
         Args:
             timer (BaseTimer): timer to use, subclass of BaseTimer.
+            budget (float, optional): seconds :py:meth:`execute` may spend each call.
+                Expired events over budget are deferred to the next call. Defaults to None.
 
         Raises:
             ValueError: timer is not a valid argument.
@@ -20,14 +74,27 @@ class Scheduler:
                 "timer, {}, has to be a instance of BaseTimer or a callable!".format(timer)
             )
 
-        self._events: dict[int, sched.Event] = dict()
+        self.timer = timer
+        self.budget = budget
+        self._queue: list[tuple[float, int, int, _Event]] = []
+        self._events: dict[int, _Event] = dict()
         self._event_id = 0
+        self._sequence = 0
+        self._cancelled = 0
+        self._executing = False
 
-        self._scheduler = sched.scheduler(lambda: timer.time, time.sleep)
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def pending(self) -> int:
+        """int: Number of expired events waiting to be executed"""
+        now = self.timer.time
+        return sum(1 for entry in self._queue if entry[0] <= now and not entry[3].cancelled)
 
     def run_once(
         self,
-        action: Callable[[Any], Any],
+        action: Callable[..., Any],
         delay: float,
         *,
         priority: int = 1,
@@ -51,14 +118,13 @@ class Scheduler:
         Returns:
             int: event id that can be canceled.
         """
-        event = self._scheduler.enter(delay, priority, action, arguments, kwargs)
-        self._events[self._event_id] = event
-        self._event_id += 1
-        return self._event_id - 1
+        return self.run_at(
+            action, self.timer.time + delay, priority=priority, arguments=arguments, kwargs=kwargs
+        )
 
     def run_at(
         self,
-        action: Callable[[Any], Any],
+        action: Callable[..., Any],
         time: float,
         *,
         priority: int = 1,
@@ -71,7 +137,7 @@ class Scheduler:
             action (callable):
                 function to be called.
             time (float):
-                epoch time at which the function should be called.
+                time of the timer at which the function should be called.
             priority (int, optional):
                 priority for this event, lower is more important. Defaults to 1.
             arguments (tuple, optional):
@@ -82,18 +148,18 @@ class Scheduler:
         Returns:
             int: event id that can be canceled.
         """
-        event = self._scheduler.enterabs(time, priority, action, arguments, kwargs)
-        self._events[self._event_id] = event
-        self._event_id += 1
-        return self._event_id - 1
+        event = self._create(action, arguments, kwargs)
+        self._push(time, priority, event)
+        return event.id
 
     def run_every(
         self,
-        action: Callable[[Any], Any],
+        action: Callable[..., Any],
         delay: float,
         *,
         priority: int = 1,
         initial_delay: float = 0.0,
+        catch_up: str = COALESCE,
         arguments: tuple[Any, ...] = (),
         kwargs: dict[Any, Any] = dict(),
     ) -> int:
@@ -107,8 +173,11 @@ class Scheduler:
             priority (int, optional):
                 priority for this event, lower is more important. Defaults to 1.
             initial_delay (float, optional):
-                initial delay in seconds before executing for the first time.
-            Defaults to 0. arguments (tuple, optional):
+                initial delay in seconds before executing for the first time. Defaults to 0.
+            catch_up (str, optional):
+                how runs missed while the event was late are handled.
+                One of ``"skip"``, ``"coalesce"`` or ``"burst"``. Defaults to ``"coalesce"``.
+            arguments (tuple, optional):
                 arguments for the action. Defaults to ().
             kwargs (dict, optional):
                 keyword arguments for the action. Defaults to dict().
@@ -116,42 +185,60 @@ class Scheduler:
         Returns:
             int: event id that can be canceled.
         """
-        recurring_event = self._recurring_event_factory(
-            action, arguments, kwargs, (delay, priority), self._event_id
-        )
-        event = self._scheduler.enter(initial_delay, priority, recurring_event)
-        self._events[self._event_id] = event
-        self._event_id += 1
-        return self._event_id - 1
+        if delay <= 0:
+            raise ValueError(
+                "The delay of a recurring event must be positive, not {}".format(delay)
+            )
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(
+                "Unknown catch-up policy '{}'. Valid policies: {}".format(
+                    catch_up, CATCH_UP_POLICIES
+                )
+            )
 
-    def _recurring_event_factory(
-        self,
-        function: Callable[[Any], Any],
-        arguments: tuple[Any, ...],
-        kwargs: dict[Any, Any],
-        scheduling_info: tuple[Any, Any],
-        id: int,
-    ) -> Callable[[], None]:
-        """Factory for creating recurring events that will reschedule themselves.
+        event = self._create(action, arguments, kwargs, interval=delay, catch_up=catch_up)
+        self._push(self.timer.time + initial_delay, priority, event)
+        return event.id
+
+    def execute(self, budget: Optional[float] = None) -> int:
+        """Run the scheduler without blocking and execute any expired events.
 
         Args:
-            function (callable): function to be called.
-            arguments (tuple): arguments for the function.
-            kwargs (dict): keyword arguments for the function.
-            scheduling_info (tuple): tuple of information for scheduling the task.
-            id (int): event id this event should be assigned to.
+            budget (float, optional): seconds to spend. At least one expired event is
+                executed. Defaults to the budget of the scheduler.
+        Returns:
+            int: number of events executed.
         """
+        if budget is None:
+            budget = self.budget
+        deadline = None if budget is None else perf_counter() + budget
+
+        now = self.timer.time
+        executed = 0
+        self._executing = True
+        try:
+            # Actions may cancel or clear events replacing the queue
+            while self._queue and self._queue[0][0] <= now:
+                if deadline is not None and executed and perf_counter() >= deadline:
+                    break
+
+                time, priority, _, event = heapq.heappop(self._queue)
+                if event.cancelled:
+                    self._cancelled -= 1
+                    continue
 
-        def _f() -> None:
-            function(*arguments, **kwargs)
-            event = self._scheduler.enter(*scheduling_info, _f)
-            self._events[id] = event
+                if event.interval:
+                    self._reschedule(event, time, priority, now)
+                else:
+                    self._events.pop(event.id, None)
 
-        return _f
+                event.action(*event.arguments, **event.kwargs)
+                executed += 1
+        finally:
+            self._executing = False
+            self._compact()
 
-    def execute(self) -> None:
-        """Run the scheduler without blocking and execute any expired events."""
-        self._scheduler.run(blocking=False)
+        return executed
 
     def cancel(self, event_id: int, delay: float = 0) -> None:
         """Cancel a previously scheduled event.
@@ -165,8 +252,57 @@ class Scheduler:
         else:
             self.run_once(self._cancel, delay, priority=0, arguments=(event_id,))
 
+    def clear(self) -> None:
+        """Cancel all events"""
+        for event in self._events.values():
+            event.cancelled = True
+        self._queue = []
+        self._events = dict()
+        self._cancelled = 0
+
     def _cancel(self, event_id: int) -> None:
         if event_id not in self._events:
             raise ValueError("Recurring event with id {} does not exist".format(event_id))
         event = self._events.pop(event_id)
-        self._scheduler.cancel(event)
+        event.cancelled = True
+        self._cancelled += 1
+        if not self._executing:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild the heap when more than half of it are cancelled events"""
+        if self._cancelled > _COMPACT_MIN_SIZE and self._cancelled * 2 > len(self._queue):
+            self._queue = [entry for entry in self._queue if not entry[3].cancelled]
+            heapq.heapify(self._queue)
+            self._cancelled = 0
+
+    def _create(
+        self,
+        action: Callable[..., Any],
+        arguments: tuple[Any, ...],
+        kwargs: dict[Any, Any],
+        interval: float = 0.0,
+        catch_up: str = COALESCE,
+    ) -> _Event:
+        """Create and register an event record"""
+        event = _Event(self._event_id, action, arguments, kwargs, interval, catch_up)
+        self._events[event.id] = event
+        self._event_id += 1
+        return event
+
+    def _push(self, time: float, priority: int, event: _Event) -> None:
+        """Add an event to the heap"""
+        # The sequence number keeps events with equal time and priority in order
+        heapq.heappush(self._queue, (time, priority, self._sequence, event))
+        self._sequence += 1
+
+    def _reschedule(self, event: _Event, time: float, priority: int, now: float) -> None:
+        """Schedule the next run of a recurring event that was due at ``time``"""
+        interval = event.interval
+        if event.catch_up == BURST:
+            next_time = time + interval
+        elif event.catch_up == SKIP:
+            next_time = time + interval * ((now - time) // interval + 1)
+        else:
+            next_time = now + interval
+        self._push(next_time, priority, event)
@@ -0,0 +1,22 @@
+#version 330
+#include programs/includes/once.glsl
+#include programs/includes/guarded.glsl
+#include programs/includes/uses_once.glsl
+
+#if defined VERTEX_SHADER
+
+in vec3 in_position;
+
+void main() {
+    gl_Position = vec4(in_position * both(), 1.0);
+}
+
+#elif defined FRAGMENT_SHADER
+
+out vec4 fragColor;
+
+void main() {
+    fragColor = vec4(once());
+}
+
+#endif
@@ -0,0 +1,21 @@
+#version 330
+
+#if defined VERTEX_SHADER
+
+#include programs/includes/once.glsl
+in vec3 in_position;
+
+void main() {
+    gl_Position = vec4(in_position * once(), 1.0);
+}
+
+#elif defined FRAGMENT_SHADER
+
+#include programs/includes/once.glsl
+out vec4 fragColor;
+
+void main() {
+    fragColor = vec4(once());
+}
+
+#endif
@@ -0,0 +1,9 @@
+// Include guard
+#ifndef GUARDED_GLSL
+#define GUARDED_GLSL
+
+float guarded() {
+    return 2.0;
+}
+
+#endif
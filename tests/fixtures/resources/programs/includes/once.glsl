@@ -0,0 +1,5 @@
+#pragma once
+
+float once() {
+    return 1.0;
+}
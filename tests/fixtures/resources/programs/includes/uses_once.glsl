@@ -0,0 +1,6 @@
+#include programs/includes/once.glsl
+#include programs/includes/guarded.glsl
+
+float both() {
+    return once() + guarded();
+}
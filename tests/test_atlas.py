@@ -0,0 +1,72 @@
+import numpy
+from headless import HeadlessTestCase
+
+from moderngl_window.atlas.base import ArrayImage
+from moderngl_window.atlas.simple_atlas import AllocatorException, TextureAtlas
+
+
+class TextureAtlasTestCase(HeadlessTestCase):
+
+    def image(self, width, height, value):
+        return ArrayImage(numpy.full((height, width), value, dtype=numpy.uint8))
+
+    def read(self, atlas):
+        data = numpy.frombuffer(atlas.texture.read(), dtype=numpy.uint8)
+        return data.reshape(atlas.height, atlas.width)
+
+    def test_add(self):
+        """Images are written into their regions"""
+        atlas = TextureAtlas(self.ctx, 32, 32, components=1)
+        first = self.image(8, 4, 10)
+        second = self.image(4, 8, 20)
+        x, y, w, h = atlas.add(first)
+        self.assertEqual((x, y, w, h), (1, 1, 8, 4))
+        self.assertEqual(atlas.add(first), (x, y, w, h))
+        x2, y2, _, _ = atlas.add(second)
+        self.assertEqual((x2, y2), (11, 1))
+        self.assertEqual(len(atlas), 2)
+
+        data = self.read(atlas)
+        self.assertTrue((data[y : y + h, x : x + w] == 10).all())
+        self.assertEqual(data[0, 0], 0)
+        self.assertEqual(data[y2, x2], 20)
+        atlas.release()
+
+    def test_resize(self):
+        """The atlas grows when full keeping the regions"""
+        atlas = TextureAtlas(self.ctx, 16, 16, components=1)
+        first = self.image(12, 12, 10)
+        region = atlas.add(first)
+        second = atlas.add(self.image(12, 12, 20))
+        self.assertEqual(atlas.size, (32, 32))
+        self.assertEqual(atlas.get_region(first), region)
+
+        data = self.read(atlas)
+        self.assertEqual(data[region[1], region[0]], 10)
+        self.assertEqual(data[second[1], second[0]], 20)
+        with self.assertRaises(ValueError):
+            atlas.resize(16, 16)
+        atlas.release()
+
+    def test_full(self):
+        """Images not fitting raise an error without auto resize"""
+        atlas = TextureAtlas(self.ctx, 16, 16, components=1, auto_resize=False)
+        with self.assertRaises(AllocatorException):
+            atlas.add(self.image(20, 4, 10))
+        atlas.release()
+
+    def test_rebuild(self):
+        """Rebuilding reclaims the space of removed images"""
+        atlas = TextureAtlas(self.ctx, 32, 32, components=1)
+        first = self.image(8, 8, 10)
+        second = self.image(8, 8, 20)
+        atlas.add(first)
+        atlas.add(second)
+        atlas.remove(first)
+        self.assertNotIn(first, atlas)
+
+        atlas.rebuild()
+        x, y, _, _ = atlas.get_region(second)
+        self.assertEqual((x, y), (1, 1))
+        self.assertEqual(self.read(atlas)[y, x], 20)
+        atlas.release()
@@ -0,0 +1,128 @@
+import os
+import tempfile
+
+import numpy
+from headless import HeadlessTestCase
+from PIL import Image
+
+from moderngl_window.capture import (
+    BaseVideoCapture,
+    ImageSequenceCapture,
+    MemmapCapture,
+    SharedFrameRing,
+    SharedMemoryCapture,
+)
+from moderngl_window.timers import FixedTimer
+
+
+class ListCapture(BaseVideoCapture):
+    """Capture storing the frames in a list"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frames = []
+
+    def _start_func(self):
+        return True
+
+    def _release_func(self):
+        pass
+
+    def _dump_frame(self, frame):
+        self.frames.append(frame)
+
+
+class CaptureTestCase(HeadlessTestCase):
+    window_size = (16, 16)
+
+    def capture(self, framerate=1_000_000, **kwargs):
+        cap = ListCapture(source=self.window.fbo, **kwargs)
+        cap.start_capture(filename="test.mp4", framerate=framerate)
+        for i in range(5):
+            self.window.fbo.clear(red=i / 255.0)
+            cap.save()
+        cap.release()
+        return cap.frames
+
+    def test_sync(self):
+        """Frames are read back directly"""
+        frames = self.capture()
+        self.assertEqual([frame[0] for frame in frames], [0, 1, 2, 3, 4])
+        self.assertEqual(len(frames[0]), 16 * 16 * 3)
+
+    def test_async(self):
+        """Frames read back with pixel buffers are written in order"""
+        frames = self.capture(asynchronous=True, buffers=3, queue_size=1)
+        self.assertEqual([frame[0] for frame in frames], [0, 1, 2, 3, 4])
+        self.assertEqual(len(frames[0]), 16 * 16 * 3)
+
+    def test_fixed_timer(self):
+        """Every frame is captured with a fixed timer"""
+        frames = self.capture(framerate=60, timer=FixedTimer(60))
+        self.assertEqual([frame[0] for frame in frames], [0, 1, 2, 3, 4])
+
+    def fill(self, cap, frames=3):
+        cap.start_capture(filename=self.filename, framerate=60)
+        for i in range(frames):
+            self.window.fbo.clear(red=i / 255.0)
+            # Mark the bottom left pixel
+            self.window.fbo.clear(green=1.0, viewport=(0, 0, 1, 1))
+            cap.save()
+        cap.release()
+
+    def test_memmap(self):
+        """Frames are written to a memory mapped npy file"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.filename = os.path.join(directory, "frames.npy")
+            cap = MemmapCapture(
+                source=self.window.fbo, frames=2, timer=FixedTimer(60), asynchronous=True
+            )
+            self.fill(cap)
+            self.assertEqual(cap.frames_written, 2)
+
+            data = numpy.load(self.filename, mmap_mode="r")
+            self.assertEqual(data.shape, (2, 16, 16, 3))
+            self.assertEqual(list(data[:, 0, 0, 0]), [0, 1])
+            self.assertEqual(list(data[1, 15, 0]), [0, 255, 0])
+            del data
+
+    def test_image_sequence(self):
+        """Frames are saved as images by worker threads"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.filename = directory
+            cap = ImageSequenceCapture(source=self.window.fbo, workers=2, timer=FixedTimer(60))
+            self.fill(cap)
+            self.assertEqual(sorted(os.listdir(directory)), [
+                "frame_000000.png", "frame_000001.png", "frame_000002.png",
+            ])
+            with Image.open(os.path.join(directory, "frame_000002.png")) as image:
+                self.assertEqual(image.getpixel((0, 0)), (2, 0, 0))
+                self.assertEqual(image.getpixel((0, 15)), (0, 255, 0))
+
+            self.filename = os.path.join(directory, "raw", "{:03d}.raw")
+            self.fill(ImageSequenceCapture(source=self.window.fbo, timer=FixedTimer(60)), frames=1)
+            self.assertEqual(os.path.getsize(os.path.join(directory, "raw", "000.raw")), 16 * 16 * 3)
+
+    def test_shared_memory(self):
+        """Frames are written to a ring in shared memory"""
+        self.filename = f"mglw_test_{os.getpid()}"
+        cap = SharedMemoryCapture(source=self.window.fbo, slots=2, timer=FixedTimer(60))
+        cap.start_capture(filename=self.filename, framerate=60)
+        ring = SharedFrameRing.attach(self.filename)
+        self.assertEqual(ring.shape, (16, 16, 3))
+
+        for i in range(3):
+            self.window.fbo.clear(red=i / 255.0)
+            cap.save()
+
+        sequence, frame = ring.latest()
+        self.assertEqual(sequence, 3)
+        self.assertEqual(frame[0, 0, 0], 2)
+        self.assertIsNone(ring.frame(1))
+        self.assertEqual(ring.frame(2, copy=True)[0, 0, 0], 1)
+        with self.assertRaises(ValueError):
+            ring.write(frame)
+
+        del frame
+        ring.close()
+        cap.release()
@@ -0,0 +1,110 @@
+import numpy
+from headless import HeadlessTestCase
+
+from moderngl_window.integrations.draw_lists import DrawListMixin, capacity
+
+
+class Recorder:
+    """Records texture binds and draw calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, texture_id):
+        self.calls.append(("texture", texture_id))
+        return self
+
+    def use(self, location):
+        pass
+
+    def render(self, mode, vertices, first):
+        self.calls.append(("render", first, vertices))
+
+
+class Renderer(DrawListMixin):
+    """The parts of an imgui renderer used by the mixin"""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self._vertex_size = 4
+        self._index_dtype = numpy.uint16
+        self._vertex_data = bytearray()
+        self._index_data = numpy.empty(0, dtype=numpy.uint32)
+        self._vertex_buffer = ctx.buffer(reserve=8)
+        self._index_buffer = ctx.buffer(reserve=8)
+        self._vao = self._textures = Recorder()
+
+    def release(self):
+        self._vertex_buffer.release()
+        self._index_buffer.release()
+
+
+class DrawListTestCase(HeadlessTestCase):
+
+    def setUp(self):
+        self.renderer = Renderer(self.ctx)
+
+    def tearDown(self):
+        self.renderer.release()
+
+    def test_capacity(self):
+        """Sizes are rounded up to the next power of two"""
+        self.assertEqual([capacity(size) for size in (0, 1, 3, 4, 5, 1000)], [1, 1, 4, 4, 8, 1024])
+
+    def test_write_buffers(self):
+        """Draw lists are gathered with indices offset by their base vertex"""
+        vertices = [numpy.arange(12, dtype=numpy.uint8), numpy.arange(12, 20, dtype=numpy.uint8)]
+        indices = [
+            numpy.array([0, 1, 2], dtype=numpy.uint16),
+            numpy.array([1, 0], dtype=numpy.uint16),
+        ]
+        self.renderer._write_buffers(
+            [
+                (
+                    vertex_data.ctypes.data,
+                    len(vertex_data) // 4,
+                    index_data.ctypes.data,
+                    len(index_data),
+                )
+                for vertex_data, index_data in zip(vertices, indices)
+            ]
+        )
+
+        # The buffers grew to fit the frame
+        self.assertEqual(self.renderer._vertex_buffer.size, 32)
+        self.assertEqual(self.renderer._index_buffer.size, 32)
+        self.assertEqual(
+            self.renderer._vertex_buffer.read(20), numpy.arange(20, dtype=numpy.uint8).tobytes()
+        )
+        self.assertEqual(
+            numpy.frombuffer(self.renderer._index_buffer.read(20), dtype=numpy.uint32).tolist(),
+            [0, 1, 2, 4, 3],
+        )
+
+        # Empty frames don't touch the buffers
+        self.renderer._write_buffers([])
+        self.assertEqual(self.renderer._vertex_buffer.read(20)[:4], bytes([0, 1, 2, 3]))
+
+    def test_draw_commands(self):
+        """Consecutive commands with the same texture and clip rect are drawn together"""
+        clip = (0.0, 0.0, 8.0, 8.0)
+        other = (0.0, 0.0, 4.0, 4.0)
+        self.renderer._draw_commands(
+            [
+                [(1, clip, 3), (1, clip, 6)],
+                [(1, clip, 3), (1, other, 3), (2, other, 6)],
+            ],
+            16,
+        )
+        self.assertEqual(
+            self.renderer._vao.calls,
+            [
+                ("texture", 1),
+                ("render", 0, 12),
+                ("render", 12, 3),
+                ("texture", 2),
+                ("render", 15, 6),
+            ],
+        )
+        self.assertEqual(self.ctx.scissor, (0, 12, 4, 4))
+        self.ctx.scissor = None
@@ -1,8 +1,11 @@
 from pathlib import Path
+from unittest import TestCase
 
 import moderngl
+import numpy
 from headless import HeadlessTestCase
 
+import moderngl_window as mglw
 from moderngl_window import geometry, resources
 from moderngl_window.context.headless import Keys
 from moderngl_window.meta import ProgramDescription
@@ -71,3 +74,119 @@ class HeadlessWindowTestCase(HeadlessTestCase):
         # Ensure all fragments (rgba) values are white
         data = self.window.fbo.read(components=4)
         self.assertEqual(data, b'\xff' * (self.window_size[0] * self.window_size[1] * 4))
+
+    def test_streaming(self):
+        """Frames are written to shared memory on swap"""
+        from moderngl_window.capture.shared_memory import SharedFrameRing
+
+        ring = self.window.start_streaming(slots=2)
+        try:
+            self.assertEqual(ring.shape, (16, 16, 3))
+            self.assertIs(self.window.stream, ring)
+            with self.assertRaises(RuntimeError):
+                self.window.start_streaming()
+
+            reader = SharedFrameRing.attach(ring.name)
+            self.assertEqual(reader.wait(0, timeout=0), 0)
+
+            self.window.clear(1.0, 0.0, 0.0)
+            self.window.swap_buffers()
+            self.window.clear(0.0, 1.0, 0.0, viewport=(0, 8, 16, 8))
+            self.window.swap_buffers()
+
+            sequence = reader.wait(0, timeout=1.0)
+            self.assertEqual(sequence, 2)
+            frame = reader.frame(sequence)
+            self.assertEqual(tuple(frame[0, 0]), (0, 255, 0))
+            self.assertEqual(tuple(frame[15, 0]), (255, 0, 0))
+            self.assertFalse(frame.flags.writeable)
+            del frame
+            reader.close()
+        finally:
+            self.window.stop_streaming()
+
+        self.assertIsNone(self.window.stream)
+
+    def test_batch(self):
+        """Render and read back many slots at once"""
+        batch = self.window.create_batch(5, (4, 2))
+        try:
+            self.assertEqual(batch.shape, (5, 2, 4, 3))
+            self.assertEqual(batch.grid, (2, 3))
+            self.assertEqual(batch.viewport(3), (4, 2, 4, 2))
+
+            def render(slot):
+                batch.fbo.clear(slot * 50 / 255, 0.0, 0.0, viewport=batch.viewport(slot))
+                # Mark the top row of each slot
+                x, y, w, h = batch.viewport(slot)
+                batch.fbo.clear(0.0, 1.0, 0.0, viewport=(x, y + h - 1, w, 1))
+
+            batch.clear()
+            batch.render(render)
+            frames = batch.read()
+            self.assertEqual(frames.shape, batch.shape)
+            for slot in range(5):
+                self.assertEqual(tuple(frames[slot, 0, 0]), (0, 255, 0))
+                self.assertEqual(tuple(frames[slot, 1, 3]), (slot * 50, 0, 0))
+
+            out = numpy.zeros(batch.shape, dtype=numpy.uint8)
+            self.assertIs(batch.read(out), out)
+            with self.assertRaises(ValueError):
+                batch.read(numpy.zeros((1, 2, 4, 3), dtype=numpy.uint8))
+
+            transforms = batch.transforms()
+            self.assertEqual(transforms.shape, (5, 4))
+            self.assertEqual(tuple(transforms[0]), (0.5, 1 / 3, -0.5, -2 / 3))
+        finally:
+            batch.release()
+
+
+class BufferedHeadlessWindowTestCase(TestCase):
+    """Headless window with several frames in flight"""
+
+    @classmethod
+    def setUpClass(cls):
+        window_cls = mglw.get_local_window_cls('headless')
+        cls.window = window_cls(size=(16, 16), gl_version=(4, 1), buffers=3)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.window.destroy()
+
+    def test_read_latest(self):
+        """Frames are completed buffers - 1 swaps later"""
+        self.assertEqual(self.window.buffers, 3)
+        fbos = set()
+        start = self.window.frames
+        for i in range(4):
+            fbos.add(self.window.fbo.glo)
+            self.window.clear(i * 0.25, 0.0, 0.0)
+            self.window.swap_buffers()
+            if i < 2:
+                self.assertEqual(self.window.read_latest(), (0, None))
+
+        # The framebuffer stays the same
+        self.assertEqual(len(fbos), 1)
+        frame, data = self.window.read_latest()
+        self.assertEqual(frame, start + 2)
+        self.assertEqual(data.shape, (16, 16, 4))
+        self.assertEqual(data[0, 0, 0], round(0.25 * 255))
+
+        frame, data = self.window.read_latest(wait=True)
+        self.assertEqual(frame, start + 4)
+        self.assertEqual(data[0, 0, 0], round(0.75 * 255))
+
+    def test_streaming(self):
+        """The stream receives completed frames"""
+        ring = self.window.start_streaming(slots=2)
+        try:
+            for i in range(3):
+                self.window.clear(0.0, 1.0, 0.0)
+                self.window.swap_buffers()
+
+            sequence, frame = ring.latest()
+            self.assertGreater(sequence, 0)
+            self.assertEqual(tuple(frame[0, 0]), (0, 255, 0))
+            del frame
+        finally:
+            self.window.stop_streaming()
@@ -1,4 +1,5 @@
 import platform
+import tempfile
 from pathlib import Path
 
 import moderngl
@@ -8,7 +9,7 @@ from headless import HeadlessTestCase
 from moderngl_window import resources
 from moderngl_window.exceptions import ImproperlyConfigured
 from moderngl_window.meta import ProgramDescription
-from moderngl_window.opengl.program import ReloadableProgram
+from moderngl_window.opengl.program import ReloadableProgram, ShaderError
 
 resources.register_dir((Path(__file__).parent / 'fixtures' / 'resources').resolve())
 
@@ -122,3 +123,58 @@ class ProgramLoadersTestCase(HeadlessTestCase):
         path = 'programs/varyings.glsl'
         descr = ProgramDescription(vertex_shader=path, varyings=["value_1",  "value_2"])
         program = resources.programs.load(descr)
+
+    def test_batch(self):
+        """Load several programs in a batch"""
+        programs = resources.programs.load_batch([
+            ProgramDescription(path='programs/white.glsl'),
+            ProgramDescription(path='programs/include_test.glsl', reloadable=True),
+            ProgramDescription(vertex_shader='programs/terrain/terrain_vs.glsl',
+                               tess_control_shader='programs/terrain/terrain_tc.glsl',
+                               tess_evaluation_shader='programs/terrain/terrain_te.glsl',
+                               fragment_shader='programs/terrain/terrain_fs.glsl'),
+        ])
+        self.assertEqual(len(programs), 3)
+        self.assertIsInstance(programs[0], moderngl.Program)
+        self.assertIsInstance(programs[1], ReloadableProgram)
+        self.assertIsInstance(programs[2], moderngl.Program)
+
+        resources.programs.add(ProgramDescription(path='programs/white.glsl'))
+        resources.programs.add(ProgramDescription(path='programs/feedback.glsl'))
+        pool = list(resources.programs.load_pool())
+        self.assertEqual([meta.path for meta, _ in pool], ['programs/white.glsl', 'programs/feedback.glsl'])
+        self.assertEqual(resources.programs.count, 0)
+
+    def test_batch_errors(self):
+        """Compile errors of all programs in a batch are raised together"""
+        with tempfile.TemporaryDirectory() as directory:
+            broken = Path(directory) / 'broken.glsl'
+            broken.write_text(
+                "#version 330\n"
+                "#if defined VERTEX_SHADER\n"
+                "void main() { gl_Position = broken; }\n"
+                "#endif\n"
+            )
+            with self.assertRaises(ShaderError) as context:
+                resources.programs.load_batch([
+                    ProgramDescription(path=str(broken)),
+                    ProgramDescription(path='programs/white.glsl'),
+                    ProgramDescription(path=str(broken)),
+                ])
+            self.assertIn('2 of 3 programs', str(context.exception))
+            self.assertIsInstance(context.exception, moderngl.Error)
+
+            # A single failing program raises its own error and the batch can be retried
+            descriptions = [
+                ProgramDescription(path='programs/white.glsl', reloadable=True),
+                ProgramDescription(path=str(broken)),
+            ]
+            with self.assertRaises(moderngl.Error) as context:
+                resources.programs.load_batch(descriptions)
+            self.assertNotIsInstance(context.exception, ShaderError)
+            self.assertTrue(descriptions[0].reloadable)
+            programs = resources.programs.load_batch(descriptions[:1])
+            self.assertIsInstance(programs[0], ReloadableProgram)
+
+        with self.assertRaises(ImproperlyConfigured):
+            resources.programs.load_batch([ProgramDescription(path='programs/notfound.glsl')])
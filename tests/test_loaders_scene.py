@@ -42,6 +42,20 @@ class SceneLoadersTestCase(HeadlessTestCase):
         scene = resources.scenes.load(SceneDescription(path='scenes/BoxTextured/glTF-Embedded/BoxTextured.gltf'))
         self.assertIsInstance(scene, Scene)
 
+    def test_gltf_merge_meshes(self):
+        """Load gltf merging instanced meshes into a single mesh"""
+        path = 'scenes/BoxTextured/glTF/BoxTexturedInstanced.gltf'
+        scene = resources.scenes.load(SceneDescription(path=path))
+        self.assertEqual(len(scene.meshes), 1)
+
+        scene = resources.scenes.load(SceneDescription(path=path, merge_meshes=True))
+        self.assertEqual(len(scene.meshes), 1)
+        mesh = scene.meshes[0]
+        self.assertEqual(mesh.vao.vertex_count, 48)
+        self.assertEqual(len(mesh.vao.read_indices()), 72)
+        self.assertAlmostEqual(mesh.bbox_max.x - mesh.bbox_min.x, 3.0, places=5)
+        self.assertEqual(len([node for node in scene.nodes if node.mesh]), 1)
+
     def test_gltf_not_found(self):
         """Attempt to load nonexisting gltf"""
         with self.assertRaises(ImproperlyConfigured):
@@ -5,6 +5,7 @@ import moderngl
 
 import moderngl_window as mglw
 from moderngl_window.context.base import BaseWindow
+from moderngl_window.timers import FixedTimer
 
 
 def swap_buffers(self):
@@ -38,3 +39,40 @@ class ModernGlWindowTestCase(TestCase):
 
         self.assertIsInstance(mglw.window(), BaseWindow)
         self.assertIsInstance(mglw.ctx(), moderngl.Context)
+
+    def test_run_window_config_offline(self):
+        """Offline mode renders a fixed number of frames with a fixed timestep"""
+
+        class OfflineConfig(Config):
+            frames = []
+
+            def on_render(self, time: float, frame_time: float):
+                self.frames.append((time, frame_time))
+
+        mglw.run_window_config(
+            OfflineConfig,
+            args=['-wnd', 'headless', '--size', '16x16', '--offline', '30', '--duration', '0.1'],
+        )
+        self.assertIsInstance(mglw.window().config.timer, FixedTimer)
+        self.assertEqual(
+            OfflineConfig.frames, [(0.0, 0.0), (1 / 30, 1 / 30), (2 / 30, 1 / 30)]
+        )
+
+    @mock.patch('moderngl_window.context.headless.Window.swap_buffers', new=swap_buffers)
+    def test_run_window_config_target_fps(self):
+        """Frames are paced to the target framerate"""
+
+        class PacedConfig(Config):
+            frames = []
+
+            def on_render(self, time: float, frame_time: float):
+                self.frames.append(time)
+
+        mglw.run_window_config(
+            PacedConfig, args=['-wnd', 'headless', '--size', '16x16', '--target-fps', '50'],
+        )
+        self.assertEqual(PacedConfig.target_fps, 50)
+        frames = PacedConfig.frames
+        # Allow some slack for the time between the pacer and the timer
+        self.assertGreater(frames[-1] - frames[0], (len(frames) - 1) * 0.02 * 0.9)
+        PacedConfig.target_fps = None
@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from headless import HeadlessTestCase
+
+from moderngl_window import geometry, profiler, resources
+from moderngl_window.meta import ProgramDescription
+
+resources.register_dir((Path(__file__).parent / 'fixtures' / 'resources').resolve())
+
+
+class ProfilerTestCase(HeadlessTestCase):
+
+    def setUp(self):
+        self.profiler = profiler.Profiler(self.ctx, latency=2, history=10)
+        self.profiler.enable()
+
+    def tearDown(self):
+        self.profiler.release()
+
+    def render_frame(self):
+        prog = resources.programs.load(ProgramDescription(path="programs/white.glsl"))
+        quad = geometry.quad_fs()
+        self.profiler.begin_frame()
+        with profiler.scope("outer", gpu=True):
+            quad.render(prog)
+        quad.render(prog)
+        self.profiler.end_frame()
+
+    def test_scopes(self):
+        """Scopes are recorded with GPU times read a few frames later"""
+        self.assertTrue(self.profiler.enabled)
+        self.render_frame()
+        frame = self.profiler.frames[-1]
+        self.assertEqual([s.name for s in frame.scopes], ["outer", "VAO.render", "VAO.render"])
+        self.assertEqual([s.depth for s in frame.scopes], [0, 1, 0])
+        self.assertFalse(frame.gpu_ready)
+        self.assertIsNone(frame.scopes[0].gpu)
+
+        self.render_frame()
+        self.render_frame()
+        self.assertTrue(frame.gpu_ready)
+        self.assertIs(self.profiler.last_frame, frame)
+        # Only the outermost scope measures GPU time
+        self.assertGreaterEqual(frame.scopes[0].gpu, 0)
+        self.assertIsNone(frame.scopes[1].gpu)
+        self.assertGreaterEqual(frame.scopes[2].gpu, 0)
+        self.assertGreater(frame.cpu, frame.scopes[0].cpu)
+
+        summary = self.profiler.summary()
+        self.assertEqual(set(summary), {"frame", "outer", "VAO.render"})
+        self.assertEqual(summary["VAO.render"]["calls"], 2.0)
+
+    def test_disabled(self):
+        """Nothing is recorded outside frames or when disabled"""
+        with profiler.scope("outside"):
+            pass
+        self.profiler.disable()
+        self.assertIsNone(profiler.current)
+        self.profiler.begin_frame()
+        with profiler.scope("disabled"):
+            pass
+        self.profiler.end_frame()
+        self.assertEqual(self.profiler.frames[-1].scopes, [])
+
+    def test_chrome_trace(self):
+        """Frames are exported in the trace event format"""
+        for _ in range(3):
+            self.render_frame()
+        self.profiler.release()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            self.profiler.export_chrome_trace(path)
+            with open(path) as fd:
+                trace = json.load(fd)
+
+        events = trace["traceEvents"]
+        names = [event["name"] for event in events if event.get("tid") == 0]
+        self.assertEqual(names.count("VAO.render"), 6)
+        self.assertIn("Frame 1", names)
+        # GPU events for outer and the second VAO.render in each frame
+        self.assertEqual(len([e for e in events if e.get("tid") == 1 and e["ph"] == "X"]), 6)
+
+    def test_release(self):
+        """All queries are released, also the ones still in flight"""
+        released = []
+
+        class Query:
+            def __init__(self, query):
+                self.query = query
+
+            def __enter__(self):
+                self.query.__enter__()
+
+            def __exit__(self, *args):
+                self.query.__exit__()
+
+            @property
+            def elapsed(self):
+                return self.query.elapsed
+
+            def release(self):
+                released.append(self)
+
+        query = self.profiler._query
+        self.profiler._query = lambda: Query(query())
+        self.render_frame()
+        self.render_frame()
+        self.profiler.release()
+        self.assertEqual(len(released), 4)
+        self.assertEqual(self.profiler._free_queries, [])
@@ -0,0 +1,245 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import numpy
+from headless import HeadlessTestCase
+from PIL import Image
+
+from moderngl_window import geometry, reloader, resources
+from moderngl_window.meta import ProgramDescription, TextureDescription
+from moderngl_window.opengl.includes import include_cache
+from moderngl_window.opengl.program import ReloadableProgram
+
+PROGRAM = """#version 330
+#include {include}
+
+#if defined VERTEX_SHADER
+in vec3 in_position;
+void main() {{
+    gl_Position = vec4(in_position, 1.0);
+}}
+#elif defined FRAGMENT_SHADER
+out vec4 fragColor;
+void main() {{
+    fragColor = color();
+}}
+#endif
+"""
+
+VERTEX_SHADER = """#version 330
+in vec3 in_position;
+void main() {
+    gl_Position = vec4(in_position, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = """#version 330
+#include {include}
+out vec4 fragColor;
+void main() {{
+    fragColor = color();
+}}
+"""
+
+
+def write(path, text):
+    """Write a file making sure the modification time changes"""
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+class WatcherTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "test.glsl"
+        write(self.path, "// first")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_polling(self):
+        """Polling detects changed files"""
+        watcher = reloader.PollingWatcher()
+        watcher.watch(self.path)
+        watcher.poll()
+        self.assertEqual(watcher.changes(), set())
+
+        write(self.path, "// second")
+        watcher.poll()
+        self.assertEqual(watcher.changes(), {self.path})
+        self.assertEqual(watcher.changes(), set())
+
+        watcher.unwatch(self.path)
+        write(self.path, "// third")
+        watcher.poll()
+        self.assertEqual(watcher.changes(), set())
+
+    @unittest.skipUnless(reloader.InotifyWatcher.available(), "inotify is not available")
+    def test_inotify(self):
+        """inotify reports written and replaced files in the background"""
+        watcher = reloader.InotifyWatcher()
+        watcher.watch(self.path)
+        watcher.start()
+        try:
+            write(self.path, "// second")
+            # Editors often save to a temporary file and rename it
+            other = self.path.with_suffix(".tmp")
+            write(other, "// unrelated")
+            os.replace(other, self.path)
+            self.assertEqual(self.wait(watcher), {self.path})
+        finally:
+            watcher.stop()
+        self.assertFalse(watcher.running)
+
+        # Enabling a reloader again restarts the watcher
+        instance = reloader.Reloader(watcher)
+        instance.enable()
+        instance.disable()
+        instance.enable()
+        try:
+            self.assertTrue(watcher.running)
+            write(self.path, "// third")
+            self.assertEqual(self.wait(watcher), {self.path})
+        finally:
+            instance.disable()
+
+    def wait(self, watcher):
+        """Wait for the background thread to report changes"""
+        changes = set()
+        deadline = time.monotonic() + 5
+        while not changes and time.monotonic() < deadline:
+            time.sleep(0.01)
+            changes = watcher.changes()
+        return changes
+
+
+class ReloaderTestCase(HeadlessTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.reloader = reloader.Reloader(reloader.PollingWatcher())
+        self.reloader.enable()
+
+    def tearDown(self):
+        self.reloader.disable()
+        self.directory.cleanup()
+
+    def update(self):
+        self.reloader.watcher.poll()
+        return self.reloader.update()
+
+    def test_program(self):
+        """Programs are swapped in place when an included file changes"""
+        include = self.root / "color.glsl"
+        path = self.root / "program.glsl"
+        write(include, "vec4 color() { return vec4(1.0); }")
+        write(path, PROGRAM.format(include=include))
+
+        program = resources.programs.load(ProgramDescription(path=str(path), reloadable=True))
+        self.assertIsInstance(program, ReloadableProgram)
+        self.assertEqual(self.reloader.watcher.files, {path, include})
+        quad = geometry.quad_fs()
+        quad.render(program)
+        self.assertEqual(len(quad.vaos), 1)
+
+        self.assertEqual(self.update(), 0)
+        previous = program.program
+        write(include, "vec4 color() { return vec4(0.5); }")
+        self.assertEqual(self.update(), 1)
+        self.assertIsNot(program.program, previous)
+        self.assertEqual(len(quad.vaos), 0)
+        quad.render(program)
+
+        # A broken shader keeps the previous program
+        current = program.program
+        write(include, "vec4 color() { return broken; }")
+        self.assertEqual(self.update(), 0)
+        self.assertIs(program.program, current)
+        self.assertEqual(self.reloader.failures, 1)
+        quad.release()
+
+    def test_program_separate(self):
+        """Includes of separate shader files are watched"""
+        include = self.root / "color.glsl"
+        vertex = self.root / "program_vs.glsl"
+        fragment = self.root / "program_fs.glsl"
+        write(include, "vec4 color() { return vec4(1.0); }")
+        write(vertex, VERTEX_SHADER)
+        write(fragment, FRAGMENT_SHADER.format(include=include))
+
+        program = resources.programs.load(
+            ProgramDescription(
+                vertex_shader=str(vertex), fragment_shader=str(fragment), reloadable=True
+            )
+        )
+        self.assertEqual(self.reloader.watcher.files, {vertex, fragment, include})
+        self.assertEqual(include_cache.dependencies(fragment), {include})
+        previous = program.program
+        write(include, "vec4 color() { return vec4(0.5); }")
+        self.assertEqual(self.update(), 1)
+        self.assertIsNot(program.program, previous)
+
+    def test_texture(self):
+        """Textures are written in place when the image changes"""
+        path = self.root / "texture.png"
+        Image.new("RGBA", (4, 4), (255, 0, 0, 255)).save(path)
+        texture = resources.textures.load(TextureDescription(path=str(path), reloadable=True))
+        glo = texture.glo
+
+        Image.new("RGBA", (4, 4), (0, 255, 0, 255)).save(path)
+        os.utime(path, ns=(time.time_ns() + 10**9,) * 2)
+        self.assertEqual(self.update(), 1)
+        self.assertEqual(texture.glo, glo)
+        data = numpy.frombuffer(texture.read(), dtype=numpy.uint8).reshape(-1, 4)
+        self.assertTrue((data == (0, 255, 0, 255)).all())
+
+        # Textures changing size can't be reloaded in place
+        Image.new("RGBA", (8, 8), (0, 0, 255, 255)).save(path)
+        os.utime(path, ns=(time.time_ns() + 2 * 10**9,) * 2)
+        self.assertEqual(self.update(), 0)
+        self.assertEqual(texture.size, (4, 4))
+        texture.release()
+
+    def test_texture_cube(self):
+        """Cube maps are reloaded when a face changes"""
+        faces = {}
+        for face in ("pos_x", "pos_y", "pos_z", "neg_x", "neg_y", "neg_z"):
+            faces[face] = self.root / "{}.png".format(face)
+            Image.new("RGBA", (4, 4), (255, 0, 0, 255)).save(faces[face])
+        texture = resources.textures.load(
+            TextureDescription(
+                kind="cube", reloadable=True, **{k: str(v) for k, v in faces.items()}
+            )
+        )
+        self.assertEqual(self.reloader.watcher.files, set(faces.values()))
+
+        Image.new("RGBA", (4, 4), (0, 255, 0, 255)).save(faces["neg_y"])
+        os.utime(faces["neg_y"], ns=(time.time_ns() + 10**9,) * 2)
+        self.assertEqual(self.update(), 1)
+        data = numpy.frombuffer(texture.read(3), dtype=numpy.uint8).reshape(-1, 4)
+        self.assertTrue((data == (0, 255, 0, 255)).all())
+        texture.release()
+
+    def test_texture_untracked(self):
+        """Textures not loaded from a file can't be tracked"""
+        texture = self.ctx.texture((4, 4), 4)
+        texture.extra = {"meta": TextureDescription(path="missing.png")}
+        with self.assertRaises(ValueError):
+            self.reloader.track_texture(texture)
+        texture.release()
+
+    def test_callback(self):
+        """Callbacks are called with the changed files"""
+        path = self.root / "scene.obj"
+        write(path, "# first")
+        calls = []
+        self.reloader.watch([path], calls.append)
+        write(path, "# second")
+        self.assertEqual(self.update(), 1)
+        self.assertEqual(calls, [{path}])
@@ -0,0 +1,148 @@
+from pathlib import Path
+
+import glm
+import numpy
+from headless import HeadlessTestCase
+
+from moderngl_window import resources
+from moderngl_window.meta import SceneDescription
+from moderngl_window.scene import IndirectRenderer, MeshProgram, SceneUniforms
+
+resources.register_dir((Path(__file__).parent / 'fixtures' / 'resources').resolve())
+
+
+class SceneIndirectTestCase(HeadlessTestCase):
+    window_size = (32, 32)
+    aspect_ratio = 1.0
+    gl_version = (4, 3)
+
+    def setUp(self):
+        self.scene = resources.scenes.load(
+            SceneDescription(path='scenes/BoxTextured/glTF/BoxTextured.gltf')
+        )
+        self.projection = glm.perspective(glm.radians(60.0), 1.0, 0.1, 100.0)
+        self.camera = glm.lookAt(glm.vec3(0.0, 0.0, 3.0), glm.vec3(0.0), glm.vec3(0.0, 1.0, 0.0))
+
+    def tearDown(self):
+        self.scene.destroy()
+
+    def render(self, renderer, camera, cull=False):
+        self.window.use()
+        self.ctx.clear()
+        renderer.render(self.projection, camera, cull=cull)
+        return numpy.frombuffer(self.window.fbo.read(components=4), dtype='u1')
+
+    def test_batches(self):
+        """Meshes sharing a layout are merged into one batch"""
+        renderer = IndirectRenderer(self.scene)
+        self.assertEqual(len(self.scene.meshes), renderer.draw_count)
+        self.assertEqual(len(renderer.batches), 1)
+        self.assertEqual(renderer.batches[0].commands[0][1], 1)
+        self.assertTrue(self.render(renderer, self.camera).any())
+        renderer.release()
+
+    def test_cull(self):
+        """Draws outside the frustum are culled by the compute shader"""
+        renderer = IndirectRenderer(self.scene)
+        self.assertTrue(self.render(renderer, self.camera, cull=True).any())
+
+        away = glm.lookAt(glm.vec3(0.0, 0.0, 3.0), glm.vec3(0.0, 0.0, 6.0), glm.vec3(0.0, 1.0, 0.0))
+        self.assertFalse(self.render(renderer, away, cull=True).any())
+        commands = numpy.frombuffer(renderer.batches[0].command_buffer.read(), dtype='u4')
+        self.assertEqual(commands[1], 0)
+
+        renderer.reset_commands()
+        commands = numpy.frombuffer(renderer.batches[0].command_buffer.read(), dtype='u4')
+        self.assertEqual(commands[1], 1)
+        renderer.release()
+
+    def test_scene_draw_indirect(self):
+        """Drawing indirect gives the same image as drawing the nodes"""
+        # Indirect batches only use the base color so draw the nodes untextured too
+        for mesh in self.scene.meshes:
+            mesh.material.mat_texture = None
+        self.scene.apply_mesh_programs()
+
+        self.window.use()
+        self.ctx.enable(self.ctx.DEPTH_TEST)
+        self.ctx.clear()
+        self.scene.draw(self.projection, self.camera)
+        expected = numpy.frombuffer(self.window.fbo.read(components=4), dtype='u1')
+
+        self.ctx.clear()
+        self.scene.draw_indirect(self.projection, self.camera)
+        image = numpy.frombuffer(self.window.fbo.read(components=4), dtype='u1')
+        self.ctx.disable(self.ctx.DEPTH_TEST)
+
+        self.assertIsInstance(self.scene._indirect_renderer, IndirectRenderer)
+        self.assertTrue(expected.any())
+        self.assertTrue(numpy.array_equal(image, expected))
+
+
+class SceneUniformsTestCase(HeadlessTestCase):
+    window_size = (32, 32)
+    aspect_ratio = 1.0
+
+    def setUp(self):
+        self.scene = resources.scenes.load(
+            SceneDescription(path='scenes/BoxTextured/glTF/BoxTexturedInstanced.gltf')
+        )
+        self.projection = glm.perspective(glm.radians(60.0), 1.0, 0.1, 100.0)
+        self.camera = glm.lookAt(
+            glm.vec3(1.0, 0.0, 4.0), glm.vec3(1.0, 0.0, 0.0), glm.vec3(0.0, 1.0, 0.0)
+        )
+
+    def tearDown(self):
+        self.scene.destroy()
+
+    def read(self):
+        return numpy.frombuffer(self.window.fbo.read(components=4), dtype='u1')
+
+    def test_object_data(self):
+        """Object data for all meshes is written to a single buffer"""
+        self.window.use()
+        self.ctx.clear()
+        self.scene.draw(self.projection, self.camera)
+        self.assertTrue(self.read().any())
+
+        uniforms = SceneUniforms.get(self.ctx)
+        data = numpy.frombuffer(uniforms.buffer.read(), dtype=uniforms.dtype)
+        matrices = [node.matrix_global for node in self.scene.nodes[0].children]
+        self.assertTrue(numpy.allclose(data["model"][0].T, numpy.array(matrices[0])))
+        self.assertTrue(numpy.allclose(data["model"][1].T, numpy.array(matrices[1])))
+
+    def test_draw_mesh(self):
+        """Drawing meshes directly gives the same result as drawing the scene"""
+        self.window.use()
+        self.ctx.clear()
+        self.scene.draw(self.projection, self.camera)
+        expected = self.read()
+
+        self.ctx.clear()
+        for node in self.scene.nodes[0].children:
+            node.mesh.draw(self.projection, node.matrix_global, self.camera)
+        self.assertTrue(numpy.array_equal(self.read(), expected))
+
+    def test_node_draw(self):
+        """Nodes still draw themselves and only opted in programs get object data"""
+        calls = []
+
+        class RecordingProgram(MeshProgram):
+            def draw(self, mesh, projection_matrix, model_matrix, camera_matrix, time=0.0):
+                calls.append(model_matrix)
+
+            def apply(self, mesh):
+                return self
+
+        self.scene.apply_mesh_programs([RecordingProgram()])
+        uniforms = SceneUniforms.get(self.ctx)
+        written = uniforms._ring_index
+        self.scene.draw(self.projection, self.camera)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(uniforms._ring_index, written)
+
+        # The scene is drawn through Node.draw
+        node = self.scene.nodes[0].children[0]
+        node.draw = lambda **kwargs: calls.append("node")
+        self.scene.draw(self.projection, self.camera)
+        self.assertEqual(calls[2:], ["node", self.scene.nodes[0].children[1].matrix_global])
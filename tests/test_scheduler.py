@@ -1,6 +1,7 @@
 import time
 from unittest import TestCase
 
+from moderngl_window.timers.base import BaseTimer
 from moderngl_window.timers.clock import Timer
 from moderngl_window.utils.scheduler import Scheduler
 
@@ -40,3 +41,122 @@ class SchedulingTestCase(TestCase):
         time.sleep(0.11)
         scheduler.execute()
         self.assertEqual(self.test_value, 5)
+
+
+class ManualTimer(BaseTimer):
+    """Timer only moving when told to"""
+
+    def __init__(self):
+        self._time = 0.0
+
+    @property
+    def time(self):
+        return self._time
+
+    @time.setter
+    def time(self, value):
+        self._time = value
+
+
+class HeapSchedulerTestCase(TestCase):
+
+    def setUp(self):
+        self.timer = ManualTimer()
+        self.scheduler = Scheduler(self.timer)
+        self.calls = []
+
+    def run_until(self, end, step):
+        while self.timer.time < end:
+            self.timer.time = round(self.timer.time + step, 6)
+            self.scheduler.execute()
+
+    def test_order(self):
+        """Events run by time, then priority, then in the order they were added"""
+        self.scheduler.run_at(self.calls.append, 2.0, arguments=("late",))
+        self.scheduler.run_at(self.calls.append, 1.0, arguments=("second",))
+        self.scheduler.run_at(self.calls.append, 1.0, priority=0, arguments=("first",))
+        self.scheduler.run_at(self.calls.append, 1.0, arguments=("third",))
+        self.timer.time = 1.0
+        self.assertEqual(self.scheduler.execute(), 3)
+        self.assertEqual(self.calls, ["first", "second", "third"])
+        self.assertEqual(len(self.scheduler), 1)
+
+    def test_cancel(self):
+        """Cancelled events are skipped and the heap is compacted"""
+        events = [
+            self.scheduler.run_once(self.calls.append, 1.0, arguments=(i,)) for i in range(200)
+        ]
+        for event in events[:150]:
+            self.scheduler.cancel(event)
+        self.assertLess(len(self.scheduler._queue), 200)
+        self.assertEqual(len(self.scheduler), 50)
+        with self.assertRaises(ValueError):
+            self.scheduler.cancel(events[0])
+
+        self.timer.time = 1.0
+        self.scheduler.execute()
+        self.assertEqual(self.calls, list(range(150, 200)))
+
+        # A recurring event can cancel itself
+        event = self.scheduler.run_every(lambda: self.scheduler.cancel(event), 1.0)
+        self.scheduler.execute()
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_cancel_in_action(self):
+        """Actions can cancel events due in the same execute"""
+        events = []
+
+        def cancel():
+            for event in events[:150]:
+                self.scheduler.cancel(event)
+
+        self.scheduler.run_once(cancel, 1.0, priority=0)
+        events.extend(
+            self.scheduler.run_once(self.calls.append, 1.0, arguments=(i,)) for i in range(200)
+        )
+        self.timer.time = 1.0
+        self.assertEqual(self.scheduler.execute(), 51)
+        self.assertEqual(self.calls, list(range(150, 200)))
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertEqual(self.scheduler._cancelled, 0)
+        self.assertEqual(self.scheduler._queue, [])
+        self.assertEqual(self.scheduler.execute(), 0)
+
+    def test_clear_in_action(self):
+        """Actions can clear the scheduler"""
+        self.scheduler.run_every(self.scheduler.clear, 1.0, priority=0)
+        self.scheduler.run_once(self.calls.append, 0.0, arguments=(1,))
+        self.assertEqual(self.scheduler.execute(), 1)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(self.scheduler), 0)
+        self.timer.time = 5.0
+        self.assertEqual(self.scheduler.execute(), 0)
+
+    def test_budget(self):
+        """Expired events over the budget are deferred to the next execute"""
+        for i in range(3):
+            self.scheduler.run_once(self.calls.append, 0.0, arguments=(i,))
+        self.assertEqual(self.scheduler.pending, 3)
+        self.assertEqual(self.scheduler.execute(budget=0.0), 1)
+        self.assertEqual(self.scheduler.pending, 2)
+        self.assertEqual(self.scheduler.execute(), 2)
+        self.assertEqual(self.calls, [0, 1, 2])
+
+    def test_catch_up(self):
+        """Late recurring events are caught up according to their policy"""
+        calls = {"skip": [], "coalesce": [], "burst": []}
+        for policy, times in calls.items():
+            self.scheduler.run_every(
+                lambda times=times: times.append(self.timer.time), 1.0, catch_up=policy
+            )
+
+        self.scheduler.execute()
+        self.timer.time = 3.5
+        self.scheduler.execute()
+        self.run_until(5.0, 0.5)
+        self.assertEqual(calls["skip"], [0.0, 3.5, 4.0, 5.0])
+        self.assertEqual(calls["coalesce"], [0.0, 3.5, 4.5])
+        self.assertEqual(calls["burst"], [0.0, 3.5, 3.5, 3.5, 4.0, 5.0])
+
+        with self.assertRaises(ValueError):
+            self.scheduler.run_every(self.calls.append, 1.0, catch_up="never")
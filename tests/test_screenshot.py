@@ -1,7 +1,9 @@
+import tempfile
 from pathlib import Path
 from unittest import mock
 
 from headless import HeadlessTestCase
+from PIL import Image
 from utils import settings_context
 
 from moderngl_window import screenshot
@@ -30,3 +32,73 @@ class ScreenshotTestCase(HeadlessTestCase):
         """Attempt to pass invalid source"""
         with self.assertRaises(ValueError):
             screenshot.create("Hello")
+
+
+class ScreenshotWriterTestCase(HeadlessTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_capture(self):
+        """Screenshots are saved after the next update"""
+        writer = screenshot.ScreenshotWriter(workers=2, latency=1)
+        saved = []
+        self.window.use()
+        self.window.clear(1.0, 0.0, 0.0)
+        self.window.clear(0.0, 1.0, 0.0, viewport=(0, 8, 16, 8))
+        future = writer.capture(
+            self.window.fbo, name=str(self.path / 'fbo.png'), callback=saved.append
+        )
+        self.assertEqual(writer.pending, 1)
+        self.assertFalse(future.done())
+
+        writer.update()
+        self.assertEqual(writer.pending, 0)
+        self.assertEqual(future.result(timeout=5), str(self.path / 'fbo.png'))
+        writer.release()
+        self.assertEqual(saved, [future.result()])
+
+        with Image.open(future.result()) as image:
+            self.assertEqual(image.size, (16, 16))
+            # The image is flipped so the top row comes first
+            self.assertEqual(image.getpixel((0, 0)), (0, 255, 0))
+            self.assertEqual(image.getpixel((0, 15)), (255, 0, 0))
+
+    def test_texture(self):
+        """Screenshot of a texture read immediately"""
+        writer = screenshot.ScreenshotWriter(latency=0)
+        texture = self.ctx.texture((4, 4), 4, data=b'\xff' * 64)
+        future = writer.capture(texture, name=str(self.path / 'texture.png'))
+        self.assertEqual(writer.pending, 0)
+        writer.flush()
+        self.assertTrue(future.done())
+        with Image.open(future.result()) as image:
+            self.assertEqual(image.mode, 'RGBA')
+
+        with self.assertRaises(ValueError):
+            writer.capture("Hello")
+        writer.release()
+
+    def test_burst(self):
+        """A burst captures one screenshot per update"""
+        writer = screenshot.ScreenshotWriter()
+        future = writer.burst(self.window.fbo, 3, name=str(self.path / 'burst_{:02d}.png'))
+        for _ in range(4):
+            writer.update()
+
+        writer.flush()
+        paths = future.result(timeout=5)
+        self.assertEqual(paths, [str(self.path / 'burst_{:02d}.png'.format(i)) for i in range(3)])
+        self.assertTrue(all(Path(path).exists() for path in paths))
+        writer.release()
+
+    def test_failed_save(self):
+        """Errors are reported through the future"""
+        writer = screenshot.ScreenshotWriter(latency=0)
+        future = writer.capture(self.window.fbo, name=str(self.path / 'missing' / 'fbo.png'))
+        writer.release()
+        self.assertIsInstance(future.exception(), OSError)
@@ -1,9 +1,11 @@
+import tempfile
 from pathlib import Path
 from unittest import TestCase
 
 from moderngl_window import resources
 from moderngl_window.meta import DataDescription
 from moderngl_window.opengl import program
+from moderngl_window.opengl.includes import ENDIF, IF, INCLUDE, IncludeCache, include_cache
 
 resources.register_dir((Path(__file__).parent / 'fixtures/resources').resolve())
 
@@ -78,6 +80,19 @@ class ShaderSourceTestCase(TestCase):
         self.assertTrue("#define NUM_THINGS 100" in shader.source)
         self.assertTrue("#define SCALE 2.0" in shader.source)
 
+    def test_source_with_defines(self):
+        """Defines are added after the #version line keeping the line numbers"""
+        source = program.ShaderSource(
+            program.VERTEX_SHADER,
+            "test.glsl",
+            "// Header\n#version 330\nvoid main() {}",
+            root=False,
+        )
+        self.assertEqual(
+            source.source_with_defines({"NORMALS": 1}),
+            "// Header\n#version 330\n#define NORMALS 1\n#line 3\nvoid main() {}",
+        )
+
     def test_define_compute(self):
         """Injecting defines in compute shader"""
         shader = program.ShaderSource(
@@ -173,6 +188,108 @@ class ShaderSourceTestCase(TestCase):
         with self.assertRaises(program.ShaderError):
             source.handle_includes(load_source)
 
+    def test_include_once(self):
+        """Sources with #pragma once or include guards are only included once"""
+        def load_source(path):
+            return path, resources.data.load(DataDescription(path, kind='text'))
+
+        path = 'programs/include_once.glsl'
+        source = program.ShaderSource(program.VERTEX_SHADER, path, load_source(path)[1])
+        source.handle_includes(load_source)
+
+        self.assertEqual(source.source.count("float once()"), 1)
+        self.assertEqual(source.source.count("float guarded()"), 1)
+        self.assertEqual(source.source.count("float both()"), 1)
+        self.assertNotIn("#pragma once", source.source)
+        self.assertEqual(
+            [entry.name for entry in source.source_list],
+            [
+                'programs/include_once.glsl',
+                'programs/includes/once.glsl',
+                'programs/includes/guarded.glsl',
+                'programs/includes/uses_once.glsl',
+            ],
+        )
+
+    def test_include_once_conditional(self):
+        """#pragma once sources included in conditional blocks are guarded by a macro"""
+        def load_source(path):
+            return path, resources.data.load(DataDescription(path, kind='text'))
+
+        path = 'programs/include_once_conditional.glsl'
+        source = program.ShaderSource(program.VERTEX_SHADER, path, load_source(path)[1])
+        source.handle_includes(load_source)
+
+        self.assertEqual(source.source.count("float once()"), 2)
+        self.assertEqual(source.source.count("#ifndef MODERNGL_WINDOW_ONCE_0"), 2)
+
+    def test_include_graph(self):
+        """Resolving includes records the include graph"""
+        def load_source(path):
+            return path, resources.data.load(DataDescription(path, kind='text'))
+
+        path = 'programs/include_test.glsl'
+        source = program.ShaderSource(program.VERTEX_SHADER, path, load_source(path)[1])
+        source.handle_includes(load_source)
+
+        self.assertEqual(
+            include_cache.dependents('programs/includes/utils_1.glsl'),
+            {'programs/includes/utils.glsl', 'programs/include_test.glsl'},
+        )
+        self.assertEqual(
+            include_cache.dependencies(path),
+            {
+                'programs/includes/blend_functions.glsl',
+                'programs/includes/utils.glsl',
+                'programs/includes/utils_1.glsl',
+                'programs/includes/utils_2.glsl',
+            },
+        )
+
+
+class IncludeCacheTestCase(TestCase):
+
+    def test_read(self):
+        """Files are only read again when they change"""
+        cache = IncludeCache()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'test.glsl'
+            path.write_text("// first")
+            self.assertEqual(cache.read(path), "// first")
+            self.assertEqual(cache.read(path), "// first")
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            path.write_text("// second change")
+            self.assertEqual(cache.read(path), "// second change")
+            self.assertEqual(cache.misses, 2)
+
+    def test_parse(self):
+        """Preprocessors and include guards are parsed once"""
+        cache = IncludeCache()
+        source = "#ifndef A\n#define A\n#include b.glsl\n#endif\n"
+        parsed = cache.parse('a.glsl', source)
+        self.assertIs(cache.parse('a.glsl', source), parsed)
+        self.assertEqual(parsed.guard, 'A')
+        self.assertEqual(
+            parsed.directives,
+            [(0, IF, None), (2, INCLUDE, 'b.glsl'), (3, ENDIF, None)],
+        )
+        self.assertIsNone(cache.parse('a.glsl', source + "#define B\n").guard)
+
+    def test_graph(self):
+        """Dependents are found through the include graph"""
+        cache = IncludeCache()
+        cache.set_includes('a', {'b', 'c'})
+        cache.set_includes('b', {'c'})
+        cache.set_includes('c', {'d'})
+        self.assertEqual(cache.dependents('d'), {'a', 'b', 'c'})
+        self.assertEqual(cache.dependencies('a'), {'b', 'c', 'd'})
+        self.assertEqual(cache.invalidate('c'), {'a', 'b', 'c'})
+
+        cache.set_includes('b', set())
+        cache.set_includes('a', {'b'})
+        self.assertEqual(cache.dependents('d'), {'c'})
+
 
 INCLUDE_RESULT = """#version 330
 #define VERTEX_SHADER 1
@@ -0,0 +1,294 @@
+import gc
+
+import numpy
+from headless import HeadlessTestCase
+
+from moderngl_window.opengl.program import UniformBinder
+from moderngl_window.text.bitmapped import TextBatch2D, TextWriter2D
+from moderngl_window.text.sdf import (
+    LayoutCache,
+    SDFFont,
+    SDFLabel,
+    SDFTextWriter2D,
+    TextProgram,
+    distance_field,
+)
+
+
+class TextBatchTestCase(HeadlessTestCase):
+    window_size = (64, 64)
+
+    def setUp(self):
+        self.batch = TextBatch2D(capacity=16)
+
+    def tearDown(self):
+        self.batch.release()
+
+    def test_translate(self):
+        """The lookup table matches the character map"""
+        text = "Hello ModernGL! \xe6\xf8\xe5"
+        self.assertEqual(
+            self.batch._translate_array(text).tolist(),
+            list(self.batch._translate_string(text)),
+        )
+
+    def test_ranges(self):
+        """Strings get glyph ranges that are reused when freed"""
+        first = self.batch.add("Hello", (10, 10))
+        second = self.batch.add("World", (10, 40))
+        self.assertEqual(len(self.batch), 2)
+        self.assertEqual(self.batch.glyphs, 16)
+
+        # Fits in the spare room of the range
+        self.batch.update(first, text="Hello!!")
+        self.assertEqual(self.batch.glyphs, 16)
+        self.assertEqual(self.batch.get(first), "Hello!!")
+
+        # Moves to a new range and the buffer grows
+        self.batch.update(first, text="A much longer string")
+        self.assertEqual(self.batch.glyphs, 40)
+        self.assertEqual(self.batch.capacity, 40)
+
+        # The first range is reused
+        third = self.batch.add("Again", (10, 20))
+        self.assertEqual(self.batch._labels[third].offset, 0)
+
+        self.batch.remove(first)
+        self.batch.remove(second)
+        self.assertEqual(self.batch.glyphs, 8)
+        self.batch.remove(third)
+        self.assertEqual(self.batch.glyphs, 0)
+        self.assertNotIn(first, self.batch)
+
+    def test_merge_ranges(self):
+        """Neighbouring free ranges are merged"""
+        first = self.batch.add("One", (10, 10))
+        second = self.batch.add("Two", (10, 20))
+        third = self.batch.add("Three", (10, 30))
+        self.batch.add("Four", (10, 40))
+
+        self.batch.remove(first)
+        self.batch.remove(third)
+        self.assertEqual(self.batch._free, {0: 8, 16: 8})
+        self.batch.remove(second)
+        self.assertEqual(self.batch._free, {0: 24})
+        self.assertEqual(self.batch.glyphs, 32)
+
+        # A longer string fits in the merged range
+        label = self.batch.add("A longer string", (10, 10))
+        self.assertEqual(self.batch._labels[label].offset, 0)
+        self.assertEqual(self.batch._free, {16: 8})
+
+    def test_dirty_range(self):
+        """Only changed glyphs are uploaded"""
+        self.batch.add("One", (10, 10))
+        label = self.batch.add("Two", (10, 40))
+        self.batch.draw()
+        self.assertEqual((self.batch._dirty_start, self.batch._dirty_end), (0, 0))
+
+        self.batch.update(label, text="Two")
+        self.assertEqual((self.batch._dirty_start, self.batch._dirty_end), (0, 0))
+        self.batch.update(label, color=(1.0, 0.0, 0.0, 1.0))
+        self.assertEqual((self.batch._dirty_start, self.batch._dirty_end), (8, 16))
+
+    def test_newlines(self):
+        """Newlines move the following characters down"""
+        label = self.batch.add("ab\ncd", (10, 50), size=10)
+        glyphs = self.batch._data[self.batch._labels[label].offset :][:5]
+        self.assertEqual(glyphs["position"][3].tolist(), [10, 40])
+        self.assertEqual(glyphs["position"][0][1], 50)
+        self.assertEqual(glyphs["size"][2].tolist(), [0, 0])
+
+    def test_draw(self):
+        """All strings are drawn in their color"""
+        self.batch.add("XX", (8, 48), size=16, color=(1.0, 0.0, 0.0, 1.0))
+        self.batch.add("XX", (8, 16), size=16, color=(0.0, 0.0, 1.0, 1.0))
+        self.window.fbo.use()
+        self.window.fbo.clear()
+        self.batch.draw()
+
+        data = numpy.frombuffer(self.window.fbo.read(components=3), dtype=numpy.uint8)
+        data = data.reshape(64, 64, 3)
+        self.assertGreater(data[32:, :, 0].sum(), 0)
+        self.assertEqual(data[32:, :, 2].sum(), 0)
+        self.assertGreater(data[:32, :, 2].sum(), 0)
+        self.assertEqual(data[:32, :, 0].sum(), 0)
+        self.assertEqual(data[:, :, 1].sum(), 0)
+
+
+class TextWriterTestCase(HeadlessTestCase):
+
+    def test_draw(self):
+        """Draw a single string"""
+        writer = TextWriter2D()
+        writer.text = "Hello"
+        writer.draw((4, 8), size=8)
+
+    def test_projection(self):
+        """The projection is only updated when the viewport changes"""
+        writer = TextWriter2D()
+        writer.text = "Hello"
+        writer.draw((4, 8), size=8)
+        self.assertEqual(writer._viewport, self.window.fbo.viewport)
+        binder = UniformBinder.get(writer._program)
+        self.assertEqual(binder._values["text_pos"], (4, 8))
+        writes = binder.writes
+        writer.draw((4, 8), size=8)
+        self.assertEqual(binder.writes, writes)
+
+        self.window.fbo.viewport = (0, 0, 8, 8)
+        writer.draw((4, 8), size=8)
+        self.assertEqual(writer._viewport, (0, 0, 8, 8))
+        self.window.fbo.viewport = (0, 0, *self.window.fbo.size)
+
+
+class SDFTextTestCase(HeadlessTestCase):
+    window_size = (64, 64)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.font = SDFFont(size=32, spread=4, atlas_size=(64, 64))
+
+    def test_distance_field(self):
+        """The outline is at the middle of the range"""
+        mask = numpy.zeros((16, 16), dtype=numpy.uint8)
+        mask[4:12, 4:12] = 255
+        field = distance_field(mask, 4)
+        self.assertGreater(field[8, 8], 230)
+        self.assertEqual(field[0, 0], 0)
+        self.assertGreater(field[4, 8], 128)
+        self.assertLess(field[3, 8], 128)
+
+    def test_glyphs(self):
+        """Glyphs are rasterized once on demand"""
+        glyph = self.font.glyph("A")
+        self.assertIs(self.font.glyph("A"), glyph)
+        self.assertIn(glyph.image, self.font.atlas)
+        self.assertGreater(glyph.advance, 0)
+        self.assertEqual(glyph.width, glyph.image.width)
+
+        space = self.font.glyph(" ")
+        self.assertIsNone(space.image)
+        self.assertGreater(space.advance, 0)
+
+        # Any character can be requested
+        self.font.glyph("\u2603")
+
+    def test_layout(self):
+        """Glyphs are laid out with proportional spacing"""
+        self.assertLess(self.font.measure("iiii")[0], self.font.measure("WWWW")[0])
+        width, height = self.font.measure("ab\ncd", size=16)
+        self.assertEqual(height, self.font.line_height)
+
+        data = self.font.layout("a b\nc")
+        self.assertEqual(len(data), 3)
+        self.assertLess(data["position"][0][0], data["position"][1][0])
+        self.assertLess(data["position"][2][1], data["position"][0][1])
+
+        half = self.font.layout("a b\nc", size=16)
+        numpy.testing.assert_allclose(half["position"], data["position"] / 2)
+        numpy.testing.assert_allclose(half["region"], data["region"])
+
+    def test_draw(self):
+        """Draw text with the distance field shader"""
+        writer = SDFTextWriter2D(self.font)
+        writer.text = "Hi"
+        writer.color = (1.0, 0.0, 0.0, 1.0)
+        self.window.fbo.use()
+        self.window.fbo.clear()
+        self.ctx.enable(self.ctx.BLEND)
+        writer.draw((4, 20), size=32)
+        self.ctx.disable(self.ctx.BLEND)
+        writer.release()
+
+        data = numpy.frombuffer(self.window.fbo.read(components=3), dtype=numpy.uint8)
+        data = data.reshape(64, 64, 3)
+        self.assertGreater(data[:, :, 0].sum(), 0)
+        self.assertEqual(data[:, :, 1].sum(), 0)
+
+
+class SDFLabelTestCase(HeadlessTestCase):
+    window_size = (64, 64)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.font = SDFFont(size=32, spread=4, atlas_size=(64, 64))
+
+    def test_layout_cache(self):
+        """Layouts are reused and evicted in least recently used order"""
+        cache = LayoutCache(maxsize=2)
+        first = cache.layout(self.font, "one", 16)
+        self.assertIs(cache.layout(self.font, "one", 16), first)
+        self.assertFalse(first.flags.writeable)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.layout(self.font, "one", 24)
+        cache.layout(self.font, "two", 16)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(cache.layout(self.font, "one", 16), first)
+        self.assertEqual(cache.misses, 4)
+
+        # Rebuilding the atlas moves the glyphs
+        second = cache.layout(self.font, "one", 16)
+        self.font.atlas.rebuild()
+        self.assertIsNot(cache.layout(self.font, "one", 16), second)
+
+    def test_layout_cache_fonts(self):
+        """The cache does not keep fonts alive or use released fonts"""
+        cache = LayoutCache()
+        font = SDFFont(size=16, spread=2, atlas_size=(32, 32))
+        cache.layout(font, "one")
+        cache.layout(self.font, "one")
+        del font
+        gc.collect()
+        self.assertEqual(len(cache), 1)
+
+        font = SDFFont(size=16, spread=2, atlas_size=(32, 32))
+        cache.layout(font, "one")
+        font.release()
+        with self.assertRaises(ValueError):
+            cache.layout(font, "one")
+        self.assertEqual(len(cache), 1)
+
+    def test_label(self):
+        """Labels only upload their glyphs when the layout changes"""
+        label = SDFLabel("Score", pos=(4, 20), size=16, font=self.font, cache=LayoutCache())
+        self.assertTrue(label.dirty)
+        label.draw()
+        self.assertFalse(label.dirty)
+
+        label.pos = (8, 20)
+        label.color = (1.0, 0.0, 0.0, 1.0)
+        label.text = "Score"
+        self.assertFalse(label.dirty)
+
+        label.text = "Score 10"
+        self.assertTrue(label.dirty)
+        label.draw()
+        label.size = 20
+        self.assertTrue(label.dirty)
+        label.draw()
+        self.assertEqual(label.measure(), self.font.measure("Score 10", 20))
+        label.release()
+
+    def test_program(self):
+        """Text in a context shares a program writing only changed uniforms"""
+        program = TextProgram.get(self.ctx)
+        self.assertIs(TextProgram.get(self.ctx), program)
+
+        label = SDFLabel("Hi", pos=(4, 20), size=32, color=(1.0, 0.0, 0.0, 1.0), font=self.font)
+        self.window.fbo.use()
+        self.window.fbo.clear()
+        self.ctx.enable(self.ctx.BLEND)
+        label.draw()
+        self.ctx.disable(self.ctx.BLEND)
+        self.assertEqual(program.binder._values["color"], (1.0, 0.0, 0.0, 1.0))
+        self.assertEqual(program._viewport, self.window.fbo.viewport)
+        label.release()
+
+        data = numpy.frombuffer(self.window.fbo.read(components=3), dtype=numpy.uint8)
+        data = data.reshape(64, 64, 3)
+        self.assertGreater(data[:, :, 0].sum(), 0)
+        self.assertEqual(data[:, :, 1].sum(), 0)
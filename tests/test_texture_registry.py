@@ -0,0 +1,57 @@
+import gc
+
+from headless import HeadlessTestCase
+
+from moderngl_window.integrations.texture_registry import TextureRegistry
+
+
+class TextureRegistryTestCase(HeadlessTestCase):
+
+    def test_register(self):
+        """Registered textures are found by their id"""
+        registry = TextureRegistry(self.ctx)
+        texture = self.ctx.texture((4, 4), 4)
+        texture_id = registry.register(texture)
+        self.assertEqual(texture_id, texture.glo)
+        self.assertIn(texture_id, registry)
+        self.assertIs(registry.get(texture_id), texture)
+
+        registry.remove(texture)
+        registry.remove(texture)
+        self.assertNotIn(texture_id, registry)
+        texture.release()
+
+    def test_garbage_collected(self):
+        """Textures are not kept alive by the registry"""
+        registry = TextureRegistry(self.ctx)
+        texture = self.ctx.texture((4, 4), 4)
+        registry.register(texture)
+        self.assertEqual(len(registry), 1)
+        del texture
+        gc.collect()
+        self.assertEqual(len(registry), 0)
+
+    def test_released(self):
+        """Released textures are dropped on lookup"""
+        registry = TextureRegistry(self.ctx)
+        texture = self.ctx.texture((4, 4), 4)
+        texture_id = registry.register(texture)
+        texture.release()
+        self.assertNotIn(texture_id, registry)
+        self.assertIsNot(registry.get(texture_id), texture)
+        self.assertEqual(len(registry), 0)
+
+    def test_unregistered(self):
+        """Unknown ids are bound directly without failing"""
+        registry = TextureRegistry(self.ctx)
+        texture = self.ctx.texture((4, 4), 4)
+        wrapper = registry.get(texture.glo)
+        self.assertEqual(wrapper.glo, texture.glo)
+        self.assertIs(registry.get(texture.glo), wrapper)
+        wrapper.use(0)
+
+        registry.register(texture)
+        self.assertIs(registry.get(texture.glo), texture)
+        registry.clear()
+        self.assertNotIn(texture.glo, registry)
+        texture.release()
@@ -1,7 +1,7 @@
 import time
 from unittest import TestCase
 
-from moderngl_window.timers import clock
+from moderngl_window.timers import clock, fixed, pacing, perf, stats
 
 
 class TimerTestCase(TestCase):
@@ -42,3 +42,122 @@ class TimerTestCase(TestCase):
         timer.next_frame()
         # FPS should be 0 when delta is 0 to avoid division by zero
         self.assertEqual(timer.fps, 0)
+
+    def test_fixed_timer(self) -> None:
+        """The fixed timer advances exactly one step per frame"""
+        timer = fixed.FixedTimer(framerate=50)
+        timer.start()
+        self.assertEqual(timer.next_frame(), (0.0, 0.0))
+        self.assertEqual(timer.next_frame(), (0.02, 0.02))
+        timer.pause()
+        self.assertEqual(timer.next_frame(), (0.02, 0.0))
+        timer.toggle_pause()
+        for _ in range(99):
+            timer.next_frame()
+        self.assertEqual(timer.time, 2.0)
+        self.assertEqual(timer.frames, 102)
+        timer.time = 10.0
+        self.assertEqual(timer.next_frame(), (10.02, 0.02))
+        pos, duration = timer.stop()
+        self.assertEqual(pos, 10.02)
+        self.assertTrue(duration >= 0)
+
+        with self.assertRaises(ValueError):
+            fixed.FixedTimer(framerate=0)
+
+    def test_frame_time_stats(self) -> None:
+        """Percentiles are computed over the most recent frames"""
+        frame_stats = stats.FrameTimeStats(size=100)
+        self.assertEqual(frame_stats.p99, 0.0)
+        for i in range(150):
+            frame_stats.add(i / 1000)
+
+        self.assertEqual(frame_stats.count, 100)
+        self.assertEqual(frame_stats.values[0], 0.05)
+        self.assertEqual(frame_stats.values[-1], 0.149)
+        self.assertAlmostEqual(frame_stats.p50, 0.0995)
+        self.assertAlmostEqual(frame_stats.max, 0.149)
+        self.assertEqual(
+            frame_stats.percentiles((50, 99)), {50: frame_stats.p50, 99: frame_stats.p99}
+        )
+        frame_stats.reset()
+        self.assertEqual(frame_stats.count, 0)
+
+    def test_clock_timer_stats(self) -> None:
+        """The clock timer records frame times"""
+        timer = clock.Timer()
+        timer.start()
+        for _ in range(3):
+            time.sleep(0.001)
+            timer.next_frame()
+        self.assertEqual(timer.stats.count, 3)
+        self.assertGreater(timer.stats.p50, 0)
+
+    def test_frame_pacer(self) -> None:
+        """Frames start at fixed intervals"""
+        pacer = pacing.FramePacer(100)
+        self.assertEqual(pacer.budget, 0.01)
+        pacer.wait()
+        start = time.perf_counter()
+        for _ in range(5):
+            pacer.wait()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+        self.assertEqual(pacer.stats.count, 5)
+
+    def test_frame_pacer_budget(self) -> None:
+        """The budget function is called when work time crosses the budget"""
+        calls = []
+        pacer = pacing.FramePacer(
+            200, budget_func=lambda exceeded, t: calls.append(exceeded), cooldown=2
+        )
+        for _ in range(4):
+            pacer.wait()
+            time.sleep(0.01)
+        self.assertEqual(calls, [True])
+        self.assertTrue(pacer.exceeded)
+
+        pacer._smoothing = 1.0
+        for _ in range(3):
+            pacer.wait()
+        self.assertEqual(calls, [True, False])
+
+    def test_perf_timer(self) -> None:
+        """The perf timer keeps time in integer nanoseconds"""
+        timer = perf.PerfTimer()
+        self.assertEqual(timer.time, 0.0)
+        timer.start()
+        time.sleep(0.01)
+        current, delta = timer.next_frame()
+        self.assertGreaterEqual(current, 0.01)
+        self.assertEqual(delta, current)
+        self.assertEqual(timer.frame_time_ns, round(delta * 1e9))
+        self.assertIsInstance(timer.time_ns, int)
+
+        timer.pause()
+        paused = timer.time_ns
+        time.sleep(0.005)
+        self.assertEqual(timer.time_ns, paused)
+        timer.toggle_pause()
+        self.assertTrue(timer.is_running)
+
+        timer.time = 100.0
+        self.assertGreaterEqual(timer.time_ns, 100 * 10**9)
+        self.assertLess(timer.time, 100.1)
+        pos, duration = timer.stop()
+        self.assertGreaterEqual(pos, 100.0)
+        self.assertGreater(duration, 0.015)
+
+    def test_fixed_step(self) -> None:
+        """Frame time is split into fixed steps carrying over the remainder"""
+        step = perf.FixedStep(1 / 100, max_steps=4)
+        self.assertEqual(step.advance(0.025), 2)
+        self.assertAlmostEqual(step.alpha, 0.5)
+        self.assertEqual(step.advance(0.005), 1)
+        self.assertEqual(step.alpha, 0.0)
+        # Never lose time to rounding
+        for _ in range(300):
+            step.advance_ns(3_333_333)
+        self.assertEqual(step.steps, 3 + 99)
+        # Slow frames are capped
+        self.assertEqual(step.advance(1.0), 4)
+        self.assertEqual(step.alpha, 0.0)
@@ -0,0 +1,100 @@
+import gc
+import weakref
+
+import glm
+from headless import HeadlessTestCase
+
+from moderngl_window.meta import ProgramDescription
+from moderngl_window.opengl.program import ReloadableProgram, UniformBinder
+
+
+class UniformBinderTestCase(HeadlessTestCase):
+
+    def createProgram(self):
+        return self.ctx.program(
+            vertex_shader="""
+            #version 330
+
+            uniform mat4 m_proj;
+            uniform float scale;
+            in vec3 in_position;
+
+            void main() {
+                gl_Position = m_proj * vec4(in_position * scale, 1.0);
+            }
+            """,
+            fragment_shader="""
+            #version 330
+
+            out vec4 fragColor;
+
+            void main() {
+                fragColor = vec4(1.0);
+            }
+            """,
+        )
+
+    def test_skip_writes(self):
+        """Writing unchanged values is skipped"""
+        program = self.createProgram()
+        binder = UniformBinder(program)
+        self.assertTrue(binder.write("m_proj", glm.mat4(2.0)))
+        self.assertFalse(binder.write("m_proj", glm.mat4(2.0)))
+        self.assertTrue(binder.write("m_proj", glm.mat4(1.0)))
+        self.assertTrue(binder.set("scale", 2.0))
+        self.assertFalse(binder.set("scale", 2.0))
+        self.assertEqual((binder.writes, binder.skipped), (3, 2))
+        self.assertEqual(binder.program["scale"].value, 2.0)
+
+        binder.invalidate()
+        self.assertTrue(binder.set("scale", 2.0))
+
+        with self.assertRaises(KeyError):
+            binder.write("nope", b"")
+
+    def test_matrix_order(self):
+        """Matrices are written in the same order as writing them to the program"""
+        program = self.createProgram()
+        matrix = glm.translate(glm.vec3(1.0, 2.0, 3.0))
+        UniformBinder(program).write("m_proj", matrix)
+        self.assertEqual(glm.mat4.from_bytes(program["m_proj"].read()), matrix)
+
+    def test_frame_counters(self):
+        """Counters for shared binders are summed and reset"""
+        program = self.createProgram()
+        binder = UniformBinder.get(program)
+        self.assertIs(UniformBinder.get(program), binder)
+        UniformBinder.frame_counters()
+
+        binder.set("scale", 1.0)
+        binder.set("scale", 1.0)
+        self.assertEqual(UniformBinder.frame_counters(), (1, 1))
+        self.assertEqual(UniformBinder.frame_counters(), (0, 0))
+
+    def test_collected(self):
+        """Shared binders do not keep their programs alive"""
+        programs = [self.createProgram() for _ in range(5)]
+        binders = [weakref.ref(UniformBinder.get(program)) for program in programs]
+        refs = [weakref.ref(program) for program in programs]
+        UniformBinder.frame_counters()
+        UniformBinder.get(programs[0]).set("scale", 1.0)
+        for program in programs:
+            program.release()
+        # Binders of released programs are not counted
+        self.assertEqual(UniformBinder.frame_counters(), (0, 0))
+
+        del programs, program
+        gc.collect()
+        self.assertEqual([ref() for ref in refs], [None] * 5)
+        self.assertEqual([ref() for ref in binders], [None] * 5)
+
+    def test_reloadable(self):
+        """The cache is dropped when a reloadable program is replaced"""
+        program = ReloadableProgram(ProgramDescription(path="test.glsl"), self.createProgram())
+        binder = program.binder
+        binder.set("scale", 1.0)
+        self.assertFalse(binder.set("scale", 1.0))
+
+        program.program = self.createProgram()
+        self.assertTrue(binder.set("scale", 1.0))
+        self.assertEqual(program.program["scale"].value, 1.0)
@@ -1,7 +1,12 @@
+import gc
+import weakref
+
 import moderngl
 import numpy
 from headless import HeadlessTestCase
 
+from moderngl_window.meta import ProgramDescription
+from moderngl_window.opengl.program import ReloadableProgram
 from moderngl_window.opengl.vao import VAO, BufferInfo, VAOError
 
 
@@ -113,3 +118,70 @@ class VaoTestCase(HeadlessTestCase):
             buffer2.content(attributes), (buffer2.buffer, "3f/r", "normal")
         )
         self.assertEqual(buffer3.content(attributes), (buffer3.buffer, "2f/i", "uv"))
+
+    def createMesh(self):
+        mesh = VAO("test", mode=moderngl.LINES)
+        mesh.buffer(
+            numpy.array([0.0, 0.0, 0.0, 1.0, 1.0, 1.0], dtype="f4"), "3f", "position"
+        )
+        mesh.buffer(
+            numpy.array([0.0, 0.0, 1.0, 1.0, 0.0, 1.0], dtype="f4"), "3f", "normal"
+        )
+        return mesh
+
+    def test_instance_cache(self):
+        """Instances are cached per program and shared buffer mapping"""
+        mesh = self.createMesh()
+        prog1, prog2 = self.createProgram(), self.createProgram()
+        mesh.warm_up([prog1, prog2])
+        self.assertEqual(len(mesh.vaos), 2)
+        self.assertEqual(len(mesh._content), 1)
+        self.assertIs(mesh.instance(prog1), mesh.instance(prog1))
+
+    def test_instance_released_program(self):
+        """Released programs do not return stale instances"""
+        mesh = self.createMesh()
+        prog = self.createProgram()
+        vao = mesh.instance(prog)
+        prog.release()
+        with self.assertRaises(VAOError):
+            mesh.instance(prog)
+        self.assertNotIn(vao, mesh.vaos.values())
+
+    def test_instance_reloaded_program(self):
+        """Reloading a program creates a new instance"""
+        mesh = self.createMesh()
+        prog = ReloadableProgram(ProgramDescription(path="test.glsl"), self.createProgram())
+        vao = mesh.instance(prog)
+        prog.program = self.createProgram()
+        self.assertIsNot(mesh.instance(prog), vao)
+        self.assertEqual(len(mesh.vaos), 1)
+
+    def test_instance_lru(self):
+        """The number of cached instances is bounded"""
+        mesh = self.createMesh()
+        mesh.max_instances = 2
+        programs = [self.createProgram() for _ in range(3)]
+        first = mesh.instance(programs[0])
+        mesh.warm_up(programs[1:])
+        self.assertEqual(len(mesh.vaos), 2)
+        self.assertIsNot(mesh.instance(programs[0]), first)
+
+    def test_instance_collected_program(self):
+        """Cached instances go with collected program wrappers and released programs"""
+        mesh = self.createMesh()
+        prog = ReloadableProgram(ProgramDescription(path="test.glsl"), self.createProgram())
+        mesh.instance(prog)
+        ref = weakref.ref(prog)
+        del prog
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(len(mesh.vaos), 0)
+        self.assertEqual(len(mesh._owners), 0)
+
+        prog = self.createProgram()
+        mesh.instance(prog)
+        prog.release()
+        VAO.release_stale_instances()
+        self.assertEqual(len(mesh.vaos), 0)
+        self.assertEqual(len(mesh._owners), 0)
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import glm
+from headless import HeadlessTestCase
+
+from moderngl_window import resources
+from moderngl_window.meta import ProgramDescription, SceneDescription
+from moderngl_window.opengl.variants import ProgramVariants
+from moderngl_window.scene import VariantMeshProgram
+from moderngl_window.scene.programs import mesh_keywords
+
+resources.register_dir((Path(__file__).parent / 'fixtures' / 'resources').resolve())
+
+KEYWORDS = ("NORMALS", "TEXTURE", "VERTEX_COLOR")
+
+
+class ProgramVariantsTestCase(HeadlessTestCase):
+
+    def setUp(self):
+        self.variants = ProgramVariants(
+            ProgramDescription(path="scene_default/mesh.glsl"), keywords=KEYWORDS
+        )
+
+    def tearDown(self):
+        self.variants.release()
+
+    def test_get(self):
+        """Variants are compiled on first use and cached per keyword set"""
+        self.assertEqual(len(self.variants), 0)
+        program = self.variants.get(["TEXTURE", "NORMALS"])
+        self.assertEqual(len(self.variants), 1)
+        self.assertIs(self.variants.get({"NORMALS", "TEXTURE"}), program)
+        self.assertIs(self.variants.get(frozenset(("NORMALS", "TEXTURE"))), program)
+        self.assertIn("in_normal", program)
+        self.assertIn("texture0", program)
+        self.assertNotIn("in_color0", program)
+
+        plain = self.variants.get()
+        self.assertIsNot(plain, program)
+        self.assertNotIn("in_normal", plain)
+
+        with self.assertRaises(ValueError):
+            self.variants.get({"SHADOWS"})
+
+    def test_compile_pending(self):
+        """Queued variants are compiled within a budget"""
+        self.variants.queue(self.variants.combinations())
+        self.assertEqual(self.variants.pending, 8)
+        # At least one variant is compiled even without any budget
+        self.assertEqual(self.variants.compile_pending(budget=0.0), 1)
+        self.assertEqual(self.variants.pending, 7)
+        self.assertEqual(self.variants.compile_pending(), 7)
+        self.assertEqual(len(self.variants), 8)
+        self.assertEqual(self.variants.compile_pending(), 0)
+
+        # Compiled variants are not queued again
+        self.variants.queue([{"NORMALS"}])
+        self.assertEqual(self.variants.pending, 0)
+
+
+class VariantMeshProgramTestCase(HeadlessTestCase):
+    window_size = (32, 32)
+    aspect_ratio = 1.0
+
+    def test_scene(self):
+        """Scenes use the variants matching their meshes compiled when loaded"""
+        scene = resources.scenes.load(
+            SceneDescription(path='scenes/BoxTextured/glTF/BoxTextured.gltf')
+        )
+        mesh = scene.meshes[0]
+        self.assertIsInstance(mesh.mesh_program, VariantMeshProgram)
+        self.assertEqual(mesh_keywords(mesh), {"NORMALS", "TEXTURE"})
+        self.assertIn(mesh_keywords(mesh), mesh.mesh_program.variants)
+
+        self.window.use()
+        self.ctx.clear()
+        projection = glm.perspective(glm.radians(60.0), 1.0, 0.1, 100.0)
+        camera = glm.lookAt(glm.vec3(0.0, 0.0, 3.0), glm.vec3(0.0), glm.vec3(0.0, 1.0, 0.0))
+        scene.draw(projection, camera)
+        self.assertTrue(any(self.window.fbo.read()))
+        scene.destroy()